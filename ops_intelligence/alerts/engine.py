@@ -1,20 +1,94 @@
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import UTC, date, datetime, timedelta
 
 import duckdb
 
 from ops_intelligence.alerts.notifiers import notify_email, notify_webhook
-from ops_intelligence.alerts.rules import AlertFinding, evaluate_alerts
+from ops_intelligence.alerts.rules import AlertFinding, alert_rules, evaluate_alerts
 from ops_intelligence.config import TenantConfig
+from ops_intelligence.warehouse.db import transaction
 
 
-def run_alert_engine(conn: duckdb.DuckDBPyConnection, cfg: TenantConfig) -> list[AlertFinding]:
-    findings = evaluate_alerts(conn, cfg.alerts)
-    if findings:
-        conn.executemany(
-            "INSERT INTO alert_events(alert_name, severity, details, triggered_at) VALUES (?, ?, ?, ?)",
-            [[f.name, f.severity, f.details, datetime.utcnow()] for f in findings],
+def _alert_tables(cfg: TenantConfig) -> list[str]:
+    return sorted({rule.table for rule in alert_rules(cfg.alerts)})
+
+
+def _pending_partitions(
+    conn: duckdb.DuckDBPyConnection, cfg: TenantConfig
+) -> tuple[datetime | None, int]:
+    row = conn.execute(
+        """
+        SELECT MAX(refreshed_at), COUNT(DISTINCT (table_name, partition_date))
+        FROM gold_partition_log
+        WHERE list_contains(?, table_name)
+        """,
+        [_alert_tables(cfg)],
+    ).fetchone()
+    return (row[0], int(row[1])) if row else (None, 0)
+
+
+def _table_partitions(conn: duckdb.DuckDBPyConnection, cfg: TenantConfig) -> int:
+    columns = {(rule.table, rule.date_column) for rule in alert_rules(cfg.alerts)}
+    total = 0
+    for table, column in sorted(columns):
+        row = conn.execute(f"SELECT COUNT(DISTINCT {column}) FROM {table}").fetchone()
+        total += int(row[0]) if row else 0
+    return total
+
+
+def _evaluated_before(conn: duckdb.DuckDBPyConnection) -> bool:
+    row = conn.execute("SELECT COUNT(*) FROM alert_runs").fetchone()
+    return bool(row and row[0])
+
+
+def run_alert_engine(
+    conn: duckdb.DuckDBPyConnection, cfg: TenantConfig, full: bool = False
+) -> list[AlertFinding]:
+    evaluated_at = datetime.now(tz=UTC)
+    cooldown_since = evaluated_at - timedelta(hours=cfg.alerts.cooldown_hours)
+    with transaction(conn):
+        through, partitions = _pending_partitions(conn, cfg)
+        full = full or not _evaluated_before(conn)
+        findings: list[AlertFinding] = []
+        deferred: set[tuple[str, date]] = set()
+        if full:
+            partitions = _table_partitions(conn, cfg)
+            findings, deferred = evaluate_alerts(conn, cfg.alerts, None, cooldown_since)
+        elif through is not None:
+            findings, deferred = evaluate_alerts(conn, cfg.alerts, through, cooldown_since)
+        if findings:
+            conn.executemany(
+                """
+                INSERT INTO alert_events(
+                    alert_name, severity, details, triggered_at, location_id, alert_date
+                )
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                [
+                    [f.name, f.severity, f.details, evaluated_at, f.location_id, f.alert_date]
+                    for f in findings
+                ],
+            )
+        if through is not None:
+            conn.execute(
+                """
+                DELETE FROM gold_partition_log
+                WHERE refreshed_at <= ? AND list_contains(?, table_name)
+                """,
+                [through, _alert_tables(cfg)],
+            )
+        if deferred:
+            conn.executemany(
+                """
+                INSERT INTO gold_partition_log(table_name, partition_date, refreshed_at)
+                VALUES (?, ?, ?)
+                """,
+                [[table, partition, through or evaluated_at] for table, partition in sorted(deferred)],
+            )
+        conn.execute(
+            "INSERT INTO alert_runs(evaluated_at, mode, partitions, findings) VALUES (?, ?, ?, ?)",
+            [evaluated_at, "full" if full else "changed", partitions, len(findings)],
         )
 
     notify_email(cfg, findings)
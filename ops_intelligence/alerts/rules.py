@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-from collections.abc import Iterable
 from dataclasses import dataclass
+from datetime import date, datetime
 
 import duckdb
 
@@ -13,92 +13,124 @@ class AlertFinding:
     name: str
     severity: str
     details: str
+    location_id: str | None = None
+    alert_date: date | None = None
 
 
-def _iter_rows(conn: duckdb.DuckDBPyConnection, sql: str) -> Iterable[tuple]:
-    return conn.execute(sql).fetchall()
+@dataclass(frozen=True)
+class AlertRule:
+    name: str
+    severity: str
+    table: str
+    date_column: str
+    value_column: str
+    threshold: float
+    label: str
+    location_column: str | None = "location_id"
+    precision: int = 1
+    unit: str = ""
+    limit: int = 20
 
+    def describe(self, alert_date: date, location_id: str | None, value: float) -> str:
+        location = f" location={location_id}" if self.location_column else ""
+        return f"{alert_date}{location} {self.label}={value:.{self.precision}f}{self.unit}"
 
-def evaluate_alerts(
-    conn: duckdb.DuckDBPyConnection,
-    thresholds: AlertThresholdConfig,
-) -> list[AlertFinding]:
-    findings: list[AlertFinding] = []
 
-    yard_rows = _iter_rows(
-        conn,
-        f"""
-        SELECT service_date, location_id, avg_time_in_yard_minutes
-        FROM gold_plant_ops_daily
-        WHERE avg_time_in_yard_minutes > {thresholds.yard_time_minutes}
-        ORDER BY service_date DESC
-        LIMIT 20
-        """,
-    )
-    for service_date, location_id, value in yard_rows:
-        findings.append(
-            AlertFinding(
-                name="yard_congestion",
-                severity="high",
-                details=f"{service_date} location={location_id} avg_time_in_yard={value:.1f}m",
-            )
-        )
+def alert_rules(thresholds: AlertThresholdConfig) -> list[AlertRule]:
+    return [
+        AlertRule(
+            "yard_congestion",
+            "high",
+            "gold_plant_ops_daily",
+            "service_date",
+            "avg_time_in_yard_minutes",
+            thresholds.yard_time_minutes,
+            "avg_time_in_yard",
+            unit="m",
+        ),
+        AlertRule(
+            "load_variance",
+            "medium",
+            "gold_plant_ops_daily",
+            "service_date",
+            "avg_load_variance_pct",
+            thresholds.load_variance_percent,
+            "avg_load_variance_pct",
+            precision=2,
+        ),
+        AlertRule(
+            "late_deliveries",
+            "high",
+            "gold_dispatch_daily",
+            "service_date",
+            "avg_delivery_minutes",
+            thresholds.late_delivery_minutes,
+            "avg_delivery_minutes",
+        ),
+        AlertRule(
+            "ar_aging_risk",
+            "high",
+            "gold_billing_ar_daily",
+            "as_of_date",
+            "ar_90_plus",
+            thresholds.ar_overdue_amount,
+            "ar_90_plus",
+            location_column=None,
+            precision=2,
+            limit=5,
+        ),
+    ]
 
-    variance_rows = _iter_rows(
-        conn,
-        f"""
-        SELECT service_date, location_id, avg_load_variance_pct
-        FROM gold_plant_ops_daily
-        WHERE avg_load_variance_pct > {thresholds.load_variance_percent}
-        ORDER BY service_date DESC
-        LIMIT 20
-        """,
-    )
-    for service_date, location_id, value in variance_rows:
-        findings.append(
-            AlertFinding(
-                name="load_variance",
-                severity="medium",
-                details=f"{service_date} location={location_id} avg_load_variance_pct={value:.2f}",
-            )
-        )
 
-    dispatch_rows = _iter_rows(
-        conn,
-        f"""
-        SELECT service_date, location_id, avg_delivery_minutes
-        FROM gold_dispatch_daily
-        WHERE avg_delivery_minutes > {thresholds.late_delivery_minutes}
-        ORDER BY service_date DESC
-        LIMIT 20
-        """,
-    )
-    for service_date, location_id, value in dispatch_rows:
-        findings.append(
-            AlertFinding(
-                name="late_deliveries",
-                severity="high",
-                details=f"{service_date} location={location_id} avg_delivery_minutes={value:.1f}",
-            )
-        )
+def _violations_sql(rule: AlertRule, changed_through: datetime | None) -> tuple[str, list[object]]:
+    location = f"g.{rule.location_column}" if rule.location_column else "NULL"
+    params: list[object] = [rule.threshold]
+    scope = "TRUE"
+    if changed_through is not None:
+        scope = f"""g.{rule.date_column} IN (
+                SELECT partition_date
+                FROM gold_partition_log
+                WHERE table_name = ? AND refreshed_at <= ?
+            )"""
+        params += [rule.table, changed_through]
+    sql = f"""
+        SELECT g.{rule.date_column}, {location}::TEXT AS location_id, g.{rule.value_column}
+        FROM {rule.table} g
+        WHERE g.{rule.value_column} > ?
+          AND {scope}
+          AND NOT EXISTS (
+            SELECT 1
+            FROM alert_events e
+            WHERE e.alert_name = ?
+              AND e.alert_date = g.{rule.date_column}
+              AND e.location_id IS NOT DISTINCT FROM {location}::TEXT
+              AND e.triggered_at > ?
+          )
+        ORDER BY g.{rule.date_column} DESC
+        """
+    return sql, params + [rule.name]
 
-    ar_rows = _iter_rows(
-        conn,
-        f"""
-        SELECT as_of_date, ar_90_plus
-        FROM gold_billing_ar_daily
-        WHERE ar_90_plus > {thresholds.ar_overdue_amount}
-        ORDER BY as_of_date DESC
-        LIMIT 5
-        """,
-    )
-    for as_of_date, value in ar_rows:
-        findings.append(
-            AlertFinding(
-                name="ar_aging_risk",
-                severity="high",
-                details=f"{as_of_date} ar_90_plus={value:.2f}",
-            )
-        )
 
-    return findings
+def evaluate_alerts(
+    conn: duckdb.DuckDBPyConnection,
+    thresholds: AlertThresholdConfig,
+    changed_through: datetime | None = None,
+    cooldown_since: datetime | None = None,
+) -> tuple[list[AlertFinding], set[tuple[str, date]]]:
+    findings: list[AlertFinding] = []
+    deferred: set[tuple[str, date]] = set()
+    for rule in alert_rules(thresholds):
+        sql, params = _violations_sql(rule, changed_through)
+        rows = conn.execute(sql, [*params, cooldown_since or datetime.max]).fetchall()
+        deferred.update((rule.table, row[0]) for row in rows[rule.limit :])
+        for alert_date, location_id, value in rows[: rule.limit]:
+            findings.append(
+                AlertFinding(
+                    name=rule.name,
+                    severity=rule.severity,
+                    details=rule.describe(alert_date, location_id, value),
+                    location_id=location_id,
+                    alert_date=alert_date,
+                )
+            )
+    return findings, deferred
@@ -3,6 +3,7 @@ from __future__ import annotations
 import json
 import os
 import subprocess
+from dataclasses import asdict
 from datetime import datetime
 from pathlib import Path
 
@@ -10,7 +11,8 @@ import typer
 
 from ops_intelligence.alerts.engine import run_alert_engine
 from ops_intelligence.config import load_config
-from ops_intelligence.extraction.sync import sync_entities
+from ops_intelligence.extraction.benchmark import METHOD_LABELS, benchmark_bronze_loads
+from ops_intelligence.extraction.sync import entity_query, sync_entities
 from ops_intelligence.graphql.client import GraphQLClient
 from ops_intelligence.graphql.schema_guard import (
     detect_breaking_changes,
@@ -18,8 +20,13 @@ from ops_intelligence.graphql.schema_guard import (
     load_schema_snapshot,
     save_schema_snapshot,
 )
+from ops_intelligence.graphql.transport import GraphQLTransport
 from ops_intelligence.pipeline import run_full_pipeline, run_modeling, run_reporting
+from ops_intelligence.replay.benchmark import benchmark_extraction, parse_variant
+from ops_intelligence.replay.server import ReplaySettings, StandInGraphQLServer
 from ops_intelligence.scheduler.service import start_scheduler
+from ops_intelligence.tenants import run_tenants, tenant_run_report, write_tenant_run_report
+from ops_intelligence.warehouse.compaction import compact_bronze
 from ops_intelligence.warehouse.db import connect_warehouse
 
 app = typer.Typer(help="Fast-Weigh Operations Intelligence Pack")
@@ -39,7 +46,7 @@ def sync(
     config_path: str | None = typer.Option(None, "--config"),
 ) -> None:
     cfg = load_config(config_path)
-    conn = connect_warehouse(cfg.warehouse_path)
+    conn = connect_warehouse(cfg.warehouse_path, cfg.resources.sync)
     try:
         counts = sync_entities(
             conn=conn,
@@ -54,20 +61,48 @@ def sync(
 
 
 @app.command()
-def model(config_path: str | None = typer.Option(None, "--config")) -> None:
+def model(
+    full_refresh: bool = typer.Option(False, help="Rebuild silver tables from all bronze history"),
+    select: list[str] = typer.Option(
+        None,
+        "--select",
+        help="Model name, glob or layer; prefix + for upstream, suffix + for downstream; repeatable",
+    ),
+    config_path: str | None = typer.Option(None, "--config"),
+) -> None:
     cfg = load_config(config_path)
-    conn = connect_warehouse(cfg.warehouse_path)
+    conn = connect_warehouse(cfg.warehouse_path, cfg.resources.model)
     try:
-        run_modeling(cfg, conn)
+        payload = run_modeling(cfg, conn, full_refresh=full_refresh, select=select or None)
+        typer.echo(json.dumps(payload, indent=2, sort_keys=True))
         typer.echo("Modeling complete")
     finally:
         conn.close()
 
 
+@app.command()
+def compact(
+    history_depth: int | None = typer.Option(
+        None, help="Versions kept per (entity, record id); defaults to compact_history_depth"
+    ),
+    config_path: str | None = typer.Option(None, "--config"),
+) -> None:
+    cfg = load_config(config_path)
+    conn = connect_warehouse(cfg.warehouse_path, cfg.resources.compact)
+    try:
+        result = compact_bronze(conn, cfg, history_depth)
+    finally:
+        conn.close()
+    payload = dict(
+        asdict(result), rows_removed=result.rows_removed, bytes_reclaimed=result.bytes_reclaimed
+    )
+    typer.echo(json.dumps(payload, indent=2, sort_keys=True))
+
+
 @app.command()
 def report(config_path: str | None = typer.Option(None, "--config")) -> None:
     cfg = load_config(config_path)
-    conn = connect_warehouse(cfg.warehouse_path)
+    conn = connect_warehouse(cfg.warehouse_path, cfg.resources.report)
     try:
         payload = run_reporting(cfg, conn)
         typer.echo(json.dumps(payload, indent=2, sort_keys=True))
@@ -76,12 +111,17 @@ def report(config_path: str | None = typer.Option(None, "--config")) -> None:
 
 
 @app.command()
-def alerts(config_path: str | None = typer.Option(None, "--config")) -> None:
+def alerts(
+    full: bool = typer.Option(
+        False, "--full", help="Evaluate every gold partition, not only those changed since the last run"
+    ),
+    config_path: str | None = typer.Option(None, "--config"),
+) -> None:
     cfg = load_config(config_path)
-    conn = connect_warehouse(cfg.warehouse_path)
+    conn = connect_warehouse(cfg.warehouse_path, cfg.resources.report)
     try:
-        findings = run_alert_engine(conn, cfg)
-        typer.echo(json.dumps([f.__dict__ for f in findings], indent=2))
+        findings = run_alert_engine(conn, cfg, full=full)
+        typer.echo(json.dumps([f.__dict__ for f in findings], indent=2, default=str))
     finally:
         conn.close()
 
@@ -91,10 +131,11 @@ def pipeline(
     entity: list[str] = typer.Option(None, "--entity", help="Entity name; repeat for multiple"),
     start: str | None = typer.Option(None, help="ISO datetime start"),
     end: str | None = typer.Option(None, help="ISO datetime end"),
+    full_refresh: bool = typer.Option(False, help="Rebuild silver tables from all bronze history"),
     config_path: str | None = typer.Option(None, "--config"),
 ) -> None:
     cfg = load_config(config_path)
-    conn = connect_warehouse(cfg.warehouse_path)
+    conn = connect_warehouse(cfg.warehouse_path, cfg.resources.sync)
     try:
         payload = run_full_pipeline(
             cfg=cfg,
@@ -102,19 +143,78 @@ def pipeline(
             entities=entity or None,
             start_at=_parse_dt(start),
             end_at=_parse_dt(end),
+            full_refresh=full_refresh,
         )
         typer.echo(json.dumps(payload, indent=2, default=str))
     finally:
         conn.close()
 
 
+def _run_all(
+    mode: str,
+    config_dir: str,
+    workers: int,
+    entity: list[str] | None,
+    start: str | None,
+    end: str | None,
+    report_path: str | None,
+) -> None:
+    results = run_tenants(
+        config_dir,
+        mode=mode,
+        workers=workers,
+        entities=entity or None,
+        start_at=_parse_dt(start),
+        end_at=_parse_dt(end),
+    )
+    report = tenant_run_report(results, mode)
+    out = report_path or str(
+        Path("output") / "tenant_runs" / f"{mode}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    )
+    write_tenant_run_report(out, report)
+    for result in results:
+        typer.echo(
+            f"{result.status:<9} {result.tenant_name or '-':<24} {result.duration_seconds:>8.1f}s "
+            f"{result.error or ''}"
+        )
+    typer.echo(f"{report['succeeded']}/{report['tenants']} tenants succeeded; report: {out}")
+    if report["failed"]:
+        raise typer.Exit(code=1)
+
+
+@app.command("sync-all")
+def sync_all(
+    config_dir: str = typer.Option("config/tenants", help="Directory of tenant YAML configs"),
+    workers: int = typer.Option(4, help="Tenants synced in parallel, one process each"),
+    entity: list[str] = typer.Option(None, "--entity", help="Entity name; repeat for multiple"),
+    start: str | None = typer.Option(None, help="ISO datetime start"),
+    end: str | None = typer.Option(None, help="ISO datetime end"),
+    report_path: str | None = typer.Option(None, "--report", help="Aggregated status report path"),
+) -> None:
+    _run_all("sync", config_dir, workers, entity, start, end, report_path)
+
+
+@app.command("pipeline-all")
+def pipeline_all(
+    config_dir: str = typer.Option("config/tenants", help="Directory of tenant YAML configs"),
+    workers: int = typer.Option(4, help="Tenant pipelines run in parallel, one process each"),
+    entity: list[str] = typer.Option(None, "--entity", help="Entity name; repeat for multiple"),
+    start: str | None = typer.Option(None, help="ISO datetime start"),
+    end: str | None = typer.Option(None, help="ISO datetime end"),
+    report_path: str | None = typer.Option(None, "--report", help="Aggregated status report path"),
+) -> None:
+    _run_all("pipeline", config_dir, workers, entity, start, end, report_path)
+
+
 @app.command("schema-snapshot")
 def schema_snapshot(
     output: str = typer.Option("schema/fastweigh_schema_snapshot.json"),
     config_path: str | None = typer.Option(None, "--config"),
 ) -> None:
     cfg = load_config(config_path)
-    with GraphQLClient(cfg.graphql_endpoint, cfg.api_key(), cfg.timeout_seconds) as client:
+    with GraphQLClient(
+        cfg.graphql_endpoint, cfg.api_key(), cfg.timeout_seconds, GraphQLTransport(cfg.transport)
+    ) as client:
         schema = introspect_schema(client)
     save_schema_snapshot(schema, output)
     typer.echo(f"Schema snapshot saved: {output}")
@@ -127,7 +227,9 @@ def schema_check(
 ) -> None:
     cfg = load_config(config_path)
     old_schema = load_schema_snapshot(baseline)
-    with GraphQLClient(cfg.graphql_endpoint, cfg.api_key(), cfg.timeout_seconds) as client:
+    with GraphQLClient(
+        cfg.graphql_endpoint, cfg.api_key(), cfg.timeout_seconds, GraphQLTransport(cfg.transport)
+    ) as client:
         new_schema = introspect_schema(client)
 
     issues = detect_breaking_changes(old_schema, new_schema)
@@ -138,6 +240,20 @@ def schema_check(
     typer.echo("No breaking schema changes detected")
 
 
+@app.command("generate-queries")
+def generate_queries(
+    output_dir: str = typer.Option("output/queries", help="Directory for the pruned .graphql files"),
+    config_path: str | None = typer.Option(None, "--config"),
+) -> None:
+    cfg = load_config(config_path)
+    target = Path(output_dir)
+    target.mkdir(parents=True, exist_ok=True)
+    for entity, entity_cfg in cfg.entities.items():
+        out = target / Path(entity_cfg.query_file).name
+        out.write_text(entity_query(cfg, entity) + "\n", encoding="utf-8")
+        typer.echo(f"{entity}: {out}")
+
+
 @app.command()
 def dashboard(config_path: str | None = typer.Option(None, "--config")) -> None:
     env = os.environ.copy()
@@ -159,6 +275,122 @@ def dashboard(config_path: str | None = typer.Option(None, "--config")) -> None:
     )
 
 
+@app.command("replay-server")
+def replay_server(
+    port: int = typer.Option(8765),
+    rows_per_hour: float = typer.Option(200.0, help="Synthetic records per hour of window"),
+    requests_per_second: float = typer.Option(0.0, help="Throttle above this rate with 429; 0 disables"),
+    burst: int = typer.Option(5),
+    retry_after: float = typer.Option(1.0, help="Retry-After seconds sent with 429 responses"),
+    latency_ms: float = typer.Option(0.0, help="Added to every response"),
+    jitter_ms: float = typer.Option(0.0, help="Random extra latency up to this many ms"),
+    page_size: int | None = typer.Option(None, help="Cap on records per page regardless of 'first'"),
+    error_rate: float = typer.Option(0.0, help="Fraction of requests answered with HTTP 503"),
+    graphql_error_rate: float = typer.Option(
+        0.0, help="Fraction of requests answered with a retryable GraphQL error"
+    ),
+    recordings_dir: str | None = typer.Option(
+        None, help="Serve recorded <root>.json / <root>.jsonl nodes instead of synthetic ones"
+    ),
+    seed: int | None = typer.Option(None, help="Seed for latency jitter and error injection"),
+) -> None:
+    server = StandInGraphQLServer(
+        ReplaySettings(
+            rows_per_hour=rows_per_hour,
+            requests_per_second=requests_per_second,
+            burst=burst,
+            retry_after_seconds=retry_after,
+            latency_ms=latency_ms,
+            latency_jitter_ms=jitter_ms,
+            max_page_size=page_size,
+            error_rate=error_rate,
+            graphql_error_rate=graphql_error_rate,
+            recordings_dir=recordings_dir,
+            seed=seed,
+        ),
+        port=port,
+    )
+    typer.echo(f"Stand-in GraphQL server listening on {server.url}")
+    server.serve_forever()
+
+
+@app.command("bench-extract")
+def bench_extract(
+    entity: list[str] = typer.Option(None, "--entity", help="Entity name; repeat for multiple"),
+    start: str = typer.Option("2026-01-01T00:00:00Z", help="ISO datetime start"),
+    end: str = typer.Option("2026-01-08T00:00:00Z", help="ISO datetime end"),
+    variant: list[str] = typer.Option(
+        None,
+        "--variant",
+        help="label:key=value,... config overrides (dotted keys for nested); repeat to compare",
+    ),
+    repeat: int = typer.Option(1, help="Runs per variant"),
+    rows_per_hour: float = typer.Option(200.0, help="Synthetic records per hour of window"),
+    latency_ms: float = typer.Option(0.0),
+    jitter_ms: float = typer.Option(0.0),
+    page_size: int | None = typer.Option(None, help="Server-side cap on records per page"),
+    error_rate: float = typer.Option(0.0, help="Fraction of requests answered with HTTP 503"),
+    requests_per_second: float = typer.Option(0.0, help="Server throttle; 0 disables"),
+    recordings_dir: str | None = typer.Option(None),
+    seed: int = typer.Option(7),
+    output: str | None = typer.Option(None, help="Write results as JSON to this path"),
+    config_path: str | None = typer.Option(None, "--config"),
+) -> None:
+    cfg = load_config(config_path)
+    settings = ReplaySettings(
+        rows_per_hour=rows_per_hour,
+        requests_per_second=requests_per_second,
+        latency_ms=latency_ms,
+        latency_jitter_ms=jitter_ms,
+        max_page_size=page_size,
+        error_rate=error_rate,
+        recordings_dir=recordings_dir,
+        seed=seed,
+    )
+    start_at = _parse_dt(start)
+    end_at = _parse_dt(end)
+    if start_at is None or end_at is None:
+        raise typer.BadParameter("--start and --end are required")
+    results = benchmark_extraction(
+        cfg,
+        settings,
+        start_at,
+        end_at,
+        variants=dict(parse_variant(v) for v in variant) if variant else None,
+        entities=entity or None,
+        repeat=repeat,
+    )
+    for result in results:
+        peak = f"{result.peak_rss_mb:.0f}MB" if result.peak_rss_mb is not None else "n/a"
+        typer.echo(
+            f"{result.label:<16} run={result.run} rows={result.rows:>9} "
+            f"seconds={result.seconds:>8.2f} rows_per_second={result.rows_per_second:>10,.0f} "
+            f"requests={result.requests:>6} throttled={result.throttled} errors={result.errors} "
+            f"peak_rss={peak} {result.error or ''}"
+        )
+    if output:
+        out = Path(output)
+        out.parent.mkdir(parents=True, exist_ok=True)
+        payload = [dict(asdict(r), rows_per_second=r.rows_per_second) for r in results]
+        out.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+
+
+@app.command("bench-bronze-load")
+def bench_bronze_load(
+    rows: list[int] = typer.Option([10_000, 100_000, 1_000_000], "--rows", help="Repeat per size"),
+    batch_size: int = typer.Option(500, help="Rows per insert call, matching one sync page"),
+    baseline_max_rows: int | None = typer.Option(
+        None, help="Skip the row-at-a-time baselines above this many rows"
+    ),
+) -> None:
+    results = benchmark_bronze_loads(rows, batch_size=batch_size, baseline_max_rows=baseline_max_rows)
+    for result in results:
+        typer.echo(
+            f"{result.method:<12} rows={result.rows:>9} seconds={result.seconds:>9.3f} "
+            f"rows_per_second={result.rows_per_second:>12,.0f}  ({METHOD_LABELS[result.method]})"
+        )
+
+
 @app.command()
 def schedule(
     cron: str = typer.Option("0 6 * * *", help="Cron schedule (server timezone)"),
@@ -3,7 +3,7 @@ from __future__ import annotations
 import os
 from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
 
 import yaml
 from pydantic import BaseModel, Field, ValidationError
@@ -30,6 +30,37 @@ class AlertThresholdConfig(BaseModel):
     load_variance_percent: float = 5.0
     late_delivery_minutes: int = 30
     ar_overdue_amount: float = 10000.0
+    cooldown_hours: float = 24.0
+
+
+class TransportConfig(BaseModel):
+    requests_per_second: float = 5.0
+    burst: int = 10
+    max_attempts: int = 4
+    max_retry_after_seconds: float = 120.0
+    circuit_failure_threshold: int = 5
+    circuit_reset_seconds: float = 60.0
+
+
+class TripConfig(BaseModel):
+    gap_minutes: int = 30
+    dwell_radius_meters: float = 150.0
+    idle_minutes: int = 10
+
+
+class ResourceProfile(BaseModel):
+    threads: int | None = None
+    memory_limit: str | None = None
+    temp_directory: str | None = None
+    preserve_insertion_order: bool | None = None
+
+
+class ResourceConfig(BaseModel):
+    sync: ResourceProfile = Field(default_factory=ResourceProfile)
+    model: ResourceProfile = Field(default_factory=ResourceProfile)
+    compact: ResourceProfile = Field(default_factory=ResourceProfile)
+    report: ResourceProfile = Field(default_factory=ResourceProfile)
+    dashboard: ResourceProfile = Field(default_factory=ResourceProfile)
 
 
 class EntityConfig(BaseModel):
@@ -41,6 +72,15 @@ class EntityConfig(BaseModel):
     updated_after_variable: str = "updatedAfter"
     updated_before_variable: str = "updatedBefore"
     updated_at_field: str = "lastUpdatedAt"
+    id_field: str = "id"
+    max_concurrency: int = 1
+
+
+ReportGrain = Literal["hour", "day", "week", "month"]
+
+
+def _default_report_grains() -> list[ReportGrain]:
+    return ["day"]
 
 
 class TenantConfig(BaseModel):
@@ -51,12 +91,35 @@ class TenantConfig(BaseModel):
     timeout_seconds: int = 45
     page_size: int = 500
     max_pages: int = 2000
+    prefetch_pages: int = 2
+    max_concurrency: int = 4
+    raw_page_ingest: bool = True
+    skip_unchanged_records: bool = True
+    compact_history_depth: int = 1
+    model_threads: int = 4
     sync_window_days: int = 1
+    adaptive_windows: bool = True
+    window_target_rows: int = 20000
+    window_page_budget: int = 200
+    window_row_budget: int = 100000
+    min_window_minutes: int = 15
+    max_window_days: int = 7
+    prune_queries: bool = True
+    schema_snapshot_path: str = "schema/fastweigh_schema_snapshot.json"
+    silver_mapping_path: str | None = None
     warehouse_path: str = "data/ops_intelligence.duckdb"
+    bronze_storage: Literal["duckdb", "parquet"] = "duckdb"
+    bronze_lake_dir: str = "data/bronze"
+    publish_read_snapshot: bool = True
+    read_snapshot_path: str | None = None
     output_dir: str = "output"
+    report_grains: list[ReportGrain] = Field(default_factory=_default_report_grains)
     shared_drive_path: str | None = None
     entities: dict[str, EntityConfig]
+    transport: TransportConfig = Field(default_factory=TransportConfig)
+    resources: ResourceConfig = Field(default_factory=ResourceConfig)
     alerts: AlertThresholdConfig = Field(default_factory=AlertThresholdConfig)
+    trips: TripConfig = Field(default_factory=TripConfig)
     email: EmailConfig = Field(default_factory=EmailConfig)
     webhook: WebhookConfig = Field(default_factory=WebhookConfig)
 
@@ -78,24 +141,43 @@ def _load_yaml(path: Path) -> dict[str, Any]:
         content = yaml.safe_load(path.read_text(encoding="utf-8"))
     except FileNotFoundError as exc:
         raise ConfigError(f"Config file not found: {path}") from exc
+    except yaml.YAMLError as exc:
+        raise ConfigError(f"Config file {path} is not valid YAML: {exc}") from exc
     if not isinstance(content, dict):
         raise ConfigError(f"Config file {path} is empty or invalid")
     return content
 
 
-@lru_cache(maxsize=1)
-def load_config(config_path: str | None = None) -> TenantConfig:
+def parse_config(config_path: str | None = None) -> TenantConfig:
     path = Path(config_path or os.getenv("FASTWEIGH_TENANT_CONFIG", "config/tenant.example.yaml"))
     payload = _load_yaml(path)
     try:
-        cfg = TenantConfig.model_validate(payload)
+        return TenantConfig.model_validate(payload)
     except ValidationError as exc:
         raise ConfigError(f"Invalid tenant configuration in {path}: {exc}") from exc
 
+
+def read_config(config_path: str | None = None) -> TenantConfig:
+    cfg = parse_config(config_path)
     Path(cfg.output_dir).mkdir(parents=True, exist_ok=True)
     Path(cfg.warehouse_path).parent.mkdir(parents=True, exist_ok=True)
     return cfg
 
 
+@lru_cache(maxsize=1)
+def load_config(config_path: str | None = None) -> TenantConfig:
+    return read_config(config_path)
+
+
+def discover_tenant_configs(config_dir: str) -> list[Path]:
+    directory = Path(config_dir)
+    if not directory.is_dir():
+        raise ConfigError(f"Tenant config directory not found: {directory}")
+    paths = sorted(p for p in directory.iterdir() if p.suffix in {".yaml", ".yml"} and p.is_file())
+    if not paths:
+        raise ConfigError(f"No tenant configs (*.yaml, *.yml) in {directory}")
+    return paths
+
+
 def env_or_empty(name: str) -> str:
     return os.getenv(name, "")
@@ -6,13 +6,21 @@ import plotly.express as px
 import streamlit as st
 
 from ops_intelligence.config import load_config
+from ops_intelligence.warehouse.rollups import LANE_HOURLY_TABLE, ROLLUP_GRAINS, rollup_query
+from ops_intelligence.warehouse.sketches import (
+    plain_columns,
+    sketch_distinct_sql,
+    sketch_quantiles_sql,
+)
+from ops_intelligence.warehouse.snapshot import open_read_snapshot
+from ops_intelligence.warehouse.trips import TRIPS_TABLE
 
 st.set_page_config(page_title="Fast-Weigh Operations Intelligence", layout="wide")
 st.title("Operations Intelligence Pack")
 
 cfg = load_config()
 try:
-    conn = duckdb.connect(cfg.warehouse_path, read_only=True)
+    conn = open_read_snapshot(cfg, cfg.resources.dashboard)
 except duckdb.IOException:
     st.warning(
         "Warehouse database not found yet. Run `ops-intel pipeline` first, then refresh this page."
@@ -21,14 +29,70 @@ except duckdb.IOException:
 
 
 @st.cache_data(ttl=120)
-def read_df(sql: str) -> pd.DataFrame:
-    return conn.execute(sql).df()
+def read_df(sql: str, params: tuple[object, ...] = ()) -> pd.DataFrame:
+    return conn.execute(sql, list(params)).df()
 
 
-plant_df = read_df("SELECT * FROM gold_plant_ops_daily ORDER BY service_date DESC")
-dispatch_df = read_df("SELECT * FROM gold_dispatch_daily ORDER BY service_date DESC")
+def read_rollup(table: str, grain: str | None = None) -> pd.DataFrame:
+    sql, params = rollup_query(table, grain)
+    return read_df(sql, tuple(params))
+
+
+def recent_days(table: str) -> str:
+    return f"service_date > (SELECT MAX(service_date) FROM {table}) - ?::INTEGER"
+
+
+grain = st.sidebar.radio("Trend grain", ROLLUP_GRAINS, format_func=str.title)
+range_days = st.sidebar.selectbox("Percentile range (days)", [7, 30, 90], index=1)
+
+
+plant_df = read_df(f"{plain_columns('gold_plant_ops_daily')} ORDER BY service_date DESC")
+dispatch_df = read_df(f"{plain_columns('gold_dispatch_daily')} ORDER BY service_date DESC")
 billing_df = read_df("SELECT * FROM gold_billing_ar_daily ORDER BY as_of_date DESC")
-hauler_df = read_df("SELECT * FROM gold_hauler_productivity_daily ORDER BY service_date DESC")
+ar_history_df = read_df("SELECT * FROM gold_ar_snapshot_daily ORDER BY as_of_date")
+hauler_df = read_df(f"{plain_columns('gold_hauler_productivity_daily')} ORDER BY service_date DESC")
+trips_df = read_df(
+    f"""
+    SELECT
+        service_date,
+        SUM(moving_minutes) AS moving_minutes,
+        SUM(dwell_minutes) - SUM(idle_minutes) AS short_stop_minutes,
+        SUM(idle_minutes) AS idle_minutes
+    FROM {TRIPS_TABLE}
+    GROUP BY 1
+    ORDER BY 1
+    """
+)
+yard_pct_df = read_df(
+    sketch_quantiles_sql(
+        "gold_plant_ops_daily",
+        "yard_minutes_sketch",
+        [0.5, 0.9],
+        ["location_id"],
+        recent_days("gold_plant_ops_daily"),
+    ),
+    (range_days,),
+)
+delivery_pct_df = read_df(
+    sketch_quantiles_sql(
+        "gold_dispatch_daily",
+        "delivery_minutes_sketch",
+        [0.5, 0.9],
+        ["location_id"],
+        recent_days("gold_dispatch_daily"),
+    ),
+    (range_days,),
+)
+trucks_df = read_df(
+    sketch_distinct_sql(
+        "gold_dispatch_daily", "trucks_sketch", where=recent_days("gold_dispatch_daily")
+    ),
+    (range_days,),
+)
+location_rollup_df = read_rollup("gold_location_rollup", grain)
+hauler_rollup_df = read_rollup("gold_hauler_rollup", grain)
+lane_hourly_df = read_rollup(LANE_HOURLY_TABLE)
+conn.close()
 
 tab1, tab2, tab3, tab4 = st.tabs(["Plant Ops", "Dispatch", "Billing/AR", "Hauler Productivity"])
 
@@ -44,34 +108,76 @@ with tab1:
         c3.metric("Tickets / Lane Hour", f"{latest['tickets_per_lane_hour']:.2f}")
 
         fig = px.line(
-            plant_df,
-            x="service_date",
+            location_rollup_df,
+            x="period_start",
             y="avg_time_in_yard_minutes",
             color="location_id",
-            title="Time-in-Yard Trend",
+            title=f"Time-in-Yard Trend ({grain})",
         )
         st.plotly_chart(fig, use_container_width=True)
 
+        if not yard_pct_df.empty:
+            fig = px.bar(
+                yard_pct_df.melt(
+                    id_vars=["location_id"], value_vars=["p50", "p90"], var_name="percentile"
+                ),
+                x="location_id",
+                y="value",
+                color="percentile",
+                barmode="group",
+                title=f"Time in Yard P50 / P90, last {range_days} days (min)",
+            )
+            st.plotly_chart(fig, use_container_width=True)
+
+        if not lane_hourly_df.empty:
+            by_hour = (
+                lane_hourly_df.assign(hour_of_day=lane_hourly_df["service_hour"].dt.hour)
+                .groupby(["hour_of_day", "lane_id"], dropna=False)["tickets_count"]
+                .sum()
+                .reset_index()
+            )
+            fig = px.bar(
+                by_hour,
+                x="hour_of_day",
+                y="tickets_count",
+                color="lane_id",
+                title="Tickets by Hour of Day and Lane",
+            )
+            st.plotly_chart(fig, use_container_width=True)
+
 with tab2:
     st.subheader("Dispatch Delivery Performance")
     if dispatch_df.empty:
         st.info("No dispatch KPI data available yet.")
     else:
         latest = dispatch_df.iloc[0]
-        c1, c2, c3 = st.columns(3)
+        c1, c2, c3, c4 = st.columns(4)
         c1.metric("Deliveries", f"{int(latest['deliveries'])}")
         c2.metric("On-Time Rate", f"{latest['on_time_delivery_rate'] * 100:.1f}%")
         c3.metric("Avg Delivery Minutes", f"{latest['avg_delivery_minutes']:.1f}")
+        if not trucks_df.empty:
+            c4.metric(
+                f"Trucks, last {range_days} days", f"~{trucks_df['distinct_estimate'].iloc[0]:.0f}"
+            )
 
         fig = px.bar(
-            dispatch_df,
-            x="service_date",
+            location_rollup_df,
+            x="period_start",
             y="on_time_delivery_rate",
             color="location_id",
-            title="On-Time Delivery Rate",
+            barmode="group",
+            title=f"On-Time Delivery Rate ({grain})",
         )
         st.plotly_chart(fig, use_container_width=True)
 
+        if not delivery_pct_df.empty:
+            st.dataframe(
+                delivery_pct_df.rename(
+                    columns={"p50": "p50_delivery_minutes", "p90": "p90_delivery_minutes"}
+                ),
+                use_container_width=True,
+            )
+
 with tab3:
     st.subheader("Billing / AR Visibility")
     if billing_df.empty:
@@ -83,7 +189,8 @@ with tab3:
         c2.metric("AR 90+", f"${latest['ar_90_plus']:,.2f}")
         c3.metric("Customers With Open AR", f"{int(latest['customers_with_open_ar'])}")
 
-        ar_series = billing_df[["as_of_date", "ar_current", "ar_1_30", "ar_31_60", "ar_61_90", "ar_90_plus"]]
+        history = ar_history_df if not ar_history_df.empty else billing_df
+        ar_series = history[["as_of_date", "ar_current", "ar_1_30", "ar_31_60", "ar_61_90", "ar_90_plus"]]
         fig = px.area(
             ar_series.melt(id_vars=["as_of_date"], var_name="bucket", value_name="amount"),
             x="as_of_date",
@@ -104,10 +211,21 @@ with tab4:
             use_container_width=True,
         )
         fig = px.scatter(
-            hauler_df,
+            hauler_rollup_df,
             x="loads_completed",
             y="pay_variance_pct",
             color="hauler_id",
-            title="Load Volume vs Pay Variance %",
+            hover_data=["period_start"],
+            title=f"Load Volume vs Pay Variance % ({grain})",
         )
         c2.plotly_chart(fig, use_container_width=True)
+
+    if not trips_df.empty:
+        fig = px.bar(
+            trips_df.melt(id_vars=["service_date"], var_name="activity", value_name="minutes"),
+            x="service_date",
+            y="minutes",
+            color="activity",
+            title="Truck Time: Moving vs Stopped vs Idle",
+        )
+        st.plotly_chart(fig, use_container_width=True)
@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import json
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import duckdb
+
+from ops_intelligence.config import EntityConfig
+from ops_intelligence.extraction.bronze import insert_bronze_rows, insert_bronze_source
+from ops_intelligence.warehouse.db import connect_warehouse
+from ops_intelligence.warehouse.staging import ensure_staged_tables
+
+BENCH_ENTITY = EntityConfig(
+    query_file="queries/tickets.graphql",
+    root_path="data.tickets.nodes",
+    page_info_path="data.tickets.pageInfo",
+)
+
+InsertFn = Callable[
+    [duckdb.DuckDBPyConnection, str, list[dict[str, Any]], EntityConfig, datetime, datetime, datetime],
+    int,
+]
+
+
+@dataclass
+class BulkLoadResult:
+    method: str
+    rows: int
+    seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds > 0 else 0.0
+
+
+def _nested_value(payload: dict[str, Any], dotted: str) -> Any:
+    value: Any = payload
+    for key in dotted.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+        if value is None:
+            return None
+    return value
+
+
+def _as_datetime(value: Any) -> datetime | None:
+    if not isinstance(value, str) or not value:
+        return None
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def original_insert(
+    conn: duckdb.DuckDBPyConnection,
+    entity: str,
+    rows: list[dict[str, Any]],
+    entity_cfg: EntityConfig,
+    window_start: datetime,
+    window_end: datetime,
+    pulled_at: datetime,
+) -> int:
+    # The pre-columnar sync insert, kept verbatim: no fingerprints and no staging.
+    payload = []
+    for row in rows:
+        updated_at = _as_datetime(_nested_value(row, entity_cfg.updated_at_field))
+        payload.append(
+            [
+                entity,
+                pulled_at,
+                window_start,
+                window_end,
+                json.dumps(row, separators=(",", ":")),
+                updated_at,
+            ]
+        )
+
+    if payload:
+        conn.executemany(
+            """
+            INSERT INTO bronze_events(entity, pulled_at, window_start, window_end, record_json, record_updated_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            payload,
+        )
+    return len(payload)
+
+
+def executemany_insert(
+    conn: duckdb.DuckDBPyConnection,
+    entity: str,
+    rows: list[dict[str, Any]],
+    entity_cfg: EntityConfig,
+    window_start: datetime,
+    window_end: datetime,
+    pulled_at: datetime,
+) -> int:
+    if not rows:
+        return 0
+    conn.execute("CREATE OR REPLACE TEMP TABLE bronze_rows (record_json VARCHAR)")
+    try:
+        conn.executemany(
+            "INSERT INTO bronze_rows VALUES (?)",
+            [[json.dumps(row, separators=(",", ":"))] for row in rows],
+        )
+        counts = insert_bronze_source(
+            conn, entity, "bronze_rows", entity_cfg, window_start, window_end, pulled_at
+        )
+    finally:
+        conn.execute("DROP TABLE IF EXISTS bronze_rows")
+    return counts.inserted
+
+
+def columnar_insert(
+    conn: duckdb.DuckDBPyConnection,
+    entity: str,
+    rows: list[dict[str, Any]],
+    entity_cfg: EntityConfig,
+    window_start: datetime,
+    window_end: datetime,
+    pulled_at: datetime,
+) -> int:
+    counts = insert_bronze_rows(conn, entity, rows, entity_cfg, window_start, window_end, pulled_at)
+    return counts.inserted
+
+
+LOAD_METHODS: dict[str, InsertFn] = {
+    "original": original_insert,
+    "executemany": executemany_insert,
+    "columnar": columnar_insert,
+}
+
+METHOD_LABELS = {
+    "original": "pre-columnar sync insert, bronze_events only",
+    "executemany": "row-by-row bind, fingerprints and staging",
+    "columnar": "columnar batch, fingerprints and staging",
+}
+
+ROW_AT_A_TIME = {"original", "executemany"}
+
+
+def synthetic_rows(count: int, start: datetime) -> list[dict[str, Any]]:
+    return [
+        {
+            "id": f"ticket-{i}",
+            "locationId": f"L{i % 5}",
+            "customer": {"id": f"C{i % 97}"},
+            "netWeight": 20.0 + i % 7,
+            "status": "COMPLETE",
+            "lastUpdatedAt": (start + timedelta(seconds=i)).isoformat().replace("+00:00", "Z"),
+        }
+        for i in range(count)
+    ]
+
+
+def benchmark_bronze_loads(
+    row_counts: list[int],
+    batch_size: int = 500,
+    methods: list[str] | None = None,
+    baseline_max_rows: int | None = None,
+) -> list[BulkLoadResult]:
+    start = datetime(2026, 1, 1, tzinfo=UTC)
+    results: list[BulkLoadResult] = []
+    for count in row_counts:
+        rows = synthetic_rows(count, start)
+        for method in methods or list(LOAD_METHODS):
+            if method in ROW_AT_A_TIME and baseline_max_rows is not None and count > baseline_max_rows:
+                continue
+            insert = LOAD_METHODS[method]
+            conn = connect_warehouse(":memory:")
+            ensure_staged_tables(conn)
+            try:
+                began = time.perf_counter()
+                for offset in range(0, count, max(1, batch_size)):
+                    batch = rows[offset : offset + batch_size]
+                    insert(conn, "tickets", batch, BENCH_ENTITY, start, start, start)
+                elapsed = time.perf_counter() - began
+                stored = conn.execute("SELECT COUNT(*) FROM bronze_events").fetchone()
+            finally:
+                conn.close()
+            if stored is None or stored[0] != count:
+                raise RuntimeError(f"{method} stored {stored} rows, expected {count}")
+            results.append(BulkLoadResult(method=method, rows=count, seconds=elapsed))
+    return results
@@ -0,0 +1,295 @@
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, fields
+from datetime import datetime
+from typing import Any
+
+import duckdb
+import pandas as pd
+
+from ops_intelligence.config import EntityConfig
+from ops_intelligence.extraction.state import Window
+from ops_intelligence.graphql.transport import GraphQLError
+from ops_intelligence.warehouse.columns import SILVER_MODELS, SilverModel, silver_model_for
+from ops_intelligence.warehouse.staging import staged_insert_sql
+
+
+@dataclass
+class IngestCounts:
+    fetched: int = 0
+    new: int = 0
+    changed: int = 0
+    unchanged: int = 0
+    inserted: int = 0
+
+    def add(self, other: IngestCounts, sign: int = 1) -> None:
+        for item in fields(self):
+            setattr(self, item.name, getattr(self, item.name) + sign * getattr(other, item.name))
+
+
+def json_path(dotted: str) -> str:
+    return "$." + dotted
+
+
+def _stage_records(
+    conn: duckdb.DuckDBPyConnection,
+    entity: str,
+    entity_cfg: EntityConfig,
+    source: str,
+    source_params: list[Any],
+) -> None:
+    conn.execute(
+        f"""
+        CREATE OR REPLACE TEMP TABLE bronze_stage AS
+        SELECT
+            s.record_json,
+            TRY_CAST(json_extract_string(s.record_json, ?) AS TIMESTAMPTZ) AT TIME ZONE 'UTC'
+                AS record_updated_at,
+            s.record_id,
+            s.content_hash,
+            CASE
+                WHEN f.content_hash IS NULL THEN 'new'
+                WHEN f.content_hash = s.content_hash THEN 'unchanged'
+                ELSE 'changed'
+            END AS change
+        FROM (
+            SELECT
+                record_json,
+                json_extract_string(record_json, ?) AS record_id,
+                md5_number(record_json) AS content_hash
+            FROM {source}
+        ) AS s
+        LEFT JOIN bronze_fingerprints AS f
+          ON f.entity = ? AND f.record_id = s.record_id
+        """,
+        [
+            json_path(entity_cfg.updated_at_field),
+            json_path(entity_cfg.id_field),
+            *source_params,
+            entity,
+        ],
+    )
+
+
+def _ingest_stage(
+    conn: duckdb.DuckDBPyConnection,
+    entity: str,
+    window_start: datetime,
+    window_end: datetime,
+    pulled_at: datetime,
+    skip_unchanged: bool,
+    models: tuple[SilverModel, ...],
+) -> IngestCounts:
+    row = conn.execute(
+        """
+        SELECT
+            COUNT(*),
+            COUNT(*) FILTER (WHERE change = 'new'),
+            COUNT(*) FILTER (WHERE change = 'changed'),
+            COUNT(*) FILTER (WHERE change = 'unchanged')
+        FROM bronze_stage
+        """
+    ).fetchone()
+    fetched, new, changed, unchanged = row if row else (0, 0, 0, 0)
+    inserted = conn.execute(
+        """
+        INSERT INTO bronze_events(
+            entity, pulled_at, window_start, window_end,
+            record_json, record_updated_at, record_id, content_hash
+        )
+        SELECT ?, ?, ?, ?, record_json, record_updated_at, record_id, content_hash
+        FROM bronze_stage
+        WHERE change <> 'unchanged' OR NOT ?
+        """,
+        [entity, pulled_at, window_start, window_end, skip_unchanged],
+    ).fetchone()
+    model = silver_model_for(entity, models)
+    if model is not None:
+        conn.execute(
+            staged_insert_sql(
+                model, "bronze_stage", "change <> 'unchanged' OR NOT ?", envelope="?, ?, ?"
+            ),
+            [pulled_at, window_start, window_end, skip_unchanged],
+        )
+    conn.execute(
+        """
+        INSERT INTO bronze_fingerprints(entity, record_id, content_hash, pulled_at)
+        SELECT ?, record_id, content_hash, ?
+        FROM bronze_stage
+        WHERE record_id IS NOT NULL AND change = 'new'
+        QUALIFY row_number() OVER (
+            PARTITION BY record_id ORDER BY record_updated_at DESC NULLS LAST
+        ) = 1
+        """,
+        [entity, pulled_at],
+    )
+    if changed:
+        conn.execute(
+            """
+            UPDATE bronze_fingerprints AS f
+            SET content_hash = s.content_hash, pulled_at = ?
+            FROM (
+                SELECT record_id, content_hash
+                FROM bronze_stage
+                WHERE change = 'changed'
+                QUALIFY row_number() OVER (
+                    PARTITION BY record_id ORDER BY record_updated_at DESC NULLS LAST
+                ) = 1
+            ) AS s
+            WHERE f.entity = ? AND f.record_id = s.record_id
+            """,
+            [pulled_at, entity],
+        )
+    return IngestCounts(
+        fetched=int(fetched),
+        new=int(new),
+        changed=int(changed),
+        unchanged=int(unchanged),
+        inserted=int(inserted[0]) if inserted else 0,
+    )
+
+
+def insert_bronze_source(
+    conn: duckdb.DuckDBPyConnection,
+    entity: str,
+    source: str,
+    entity_cfg: EntityConfig,
+    window_start: datetime,
+    window_end: datetime,
+    pulled_at: datetime,
+    skip_unchanged: bool = True,
+    models: tuple[SilverModel, ...] = SILVER_MODELS,
+) -> IngestCounts:
+    # Re-serialize through DuckDB's JSON writer so record_json, and so content_hash,
+    # match insert_bronze_page byte for byte (escapes, number formatting).
+    _stage_records(
+        conn,
+        entity,
+        entity_cfg,
+        f"(SELECT json(record_json)::VARCHAR AS record_json FROM {source})",
+        [],
+    )
+    return _ingest_stage(
+        conn, entity, window_start, window_end, pulled_at, skip_unchanged, models
+    )
+
+
+def insert_bronze_rows(
+    conn: duckdb.DuckDBPyConnection,
+    entity: str,
+    rows: list[dict[str, Any]],
+    entity_cfg: EntityConfig,
+    window_start: datetime,
+    window_end: datetime,
+    pulled_at: datetime,
+    skip_unchanged: bool = True,
+    models: tuple[SilverModel, ...] = SILVER_MODELS,
+) -> IngestCounts:
+    if not rows:
+        return IngestCounts()
+    batch = pd.DataFrame({"record_json": [json.dumps(row, separators=(",", ":")) for row in rows]})
+    conn.register("bronze_batch", batch)
+    try:
+        return insert_bronze_source(
+            conn,
+            entity,
+            "bronze_batch",
+            entity_cfg,
+            window_start,
+            window_end,
+            pulled_at,
+            skip_unchanged,
+            models,
+        )
+    finally:
+        conn.unregister("bronze_batch")
+
+
+def insert_bronze_page(
+    conn: duckdb.DuckDBPyConnection,
+    entity: str,
+    body: str,
+    entity_cfg: EntityConfig,
+    window_start: datetime,
+    window_end: datetime,
+    pulled_at: datetime,
+    skip_unchanged: bool = True,
+    models: tuple[SilverModel, ...] = SILVER_MODELS,
+) -> IngestCounts:
+    _stage_records(
+        conn,
+        entity,
+        entity_cfg,
+        "(SELECT unnest(json_extract(?::JSON, ?))::VARCHAR AS record_json)",
+        [body, json_path(entity_cfg.root_path) + "[*]"],
+    )
+    counts = _ingest_stage(
+        conn, entity, window_start, window_end, pulled_at, skip_unchanged, models
+    )
+    if counts.fetched == 0:
+        root = conn.execute(
+            "SELECT json_type(?::JSON, ?)", [body, json_path(entity_cfg.root_path)]
+        ).fetchone()
+        if root is None or root[0] != "ARRAY":
+            raise GraphQLError(
+                f"Unable to read expected root path. root_path={entity_cfg.root_path}"
+            )
+    return counts
+
+
+_DISCARDED_ROWS = """
+    window_start = ?
+    AND window_end = ?
+    AND pulled_at >= (
+        SELECT started_at
+        FROM sync_checkpoints
+        WHERE entity = ? AND window_start = ? AND window_end = ?
+    )
+"""
+
+
+def discard_window_rows(
+    conn: duckdb.DuckDBPyConnection,
+    entity: str,
+    window: Window,
+    models: tuple[SilverModel, ...] = SILVER_MODELS,
+) -> int:
+    params = [window[0], window[1], entity, window[0], window[1]]
+    conn.execute(
+        f"""
+        CREATE OR REPLACE TEMP TABLE discarded_records AS
+        SELECT DISTINCT record_id
+        FROM bronze_events
+        WHERE entity = ? AND record_id IS NOT NULL AND {_DISCARDED_ROWS}
+        """,
+        [entity, *params],
+    )
+    row = conn.execute(
+        f"DELETE FROM bronze_events WHERE entity = ? AND {_DISCARDED_ROWS}", [entity, *params]
+    ).fetchone()
+    model = silver_model_for(entity, models)
+    if model is not None:
+        conn.execute(f"DELETE FROM {model.staging_table} WHERE {_DISCARDED_ROWS}", params)
+    conn.execute(
+        """
+        DELETE FROM bronze_fingerprints
+        WHERE entity = ? AND record_id IN (SELECT record_id FROM discarded_records)
+        """,
+        [entity],
+    )
+    conn.execute(
+        """
+        INSERT INTO bronze_fingerprints(entity, record_id, content_hash, pulled_at)
+        SELECT entity, record_id, content_hash, pulled_at
+        FROM bronze
+        WHERE entity = ?
+          AND content_hash IS NOT NULL
+          AND record_id IN (SELECT record_id FROM discarded_records)
+        QUALIFY row_number() OVER (
+            PARTITION BY record_id ORDER BY pulled_at DESC, record_updated_at DESC NULLS LAST
+        ) = 1
+        """,
+        [entity],
+    )
+    return int(row[0]) if row else 0
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import UTC, datetime
+
+import duckdb
+
+Window = tuple[datetime, datetime]
+
+
+@dataclass
+class WindowCheckpoint:
+    window: Window
+    end_cursor: str | None
+    pages: int
+    rows: int
+    started_at: datetime
+
+
+def as_utc(value: object) -> datetime | None:
+    if not isinstance(value, datetime):
+        return None
+    if value.tzinfo is None:
+        return value.replace(tzinfo=UTC)
+    return value
+
+
+def read_sync_state(
+    conn: duckdb.DuckDBPyConnection, entity: str
+) -> tuple[datetime | None, float | None]:
+    row = conn.execute(
+        "SELECT last_synced_at, rows_per_hour FROM sync_state WHERE entity = ?", [entity]
+    ).fetchone()
+    if not row:
+        return None, None
+    return as_utc(row[0]), row[1]
+
+
+def upsert_sync_state(
+    conn: duckdb.DuckDBPyConnection, entity: str, ts: datetime, rows_per_hour: float | None
+) -> None:
+    conn.execute(
+        """
+        INSERT INTO sync_state(entity, last_synced_at, rows_per_hour)
+        VALUES (?, ?, ?)
+        ON CONFLICT(entity) DO UPDATE SET
+            last_synced_at=excluded.last_synced_at,
+            rows_per_hour=COALESCE(excluded.rows_per_hour, sync_state.rows_per_hour)
+        """,
+        [entity, ts, rows_per_hour],
+    )
+
+
+def read_checkpoints(conn: duckdb.DuckDBPyConnection, entity: str) -> list[WindowCheckpoint]:
+    rows = conn.execute(
+        """
+        SELECT window_start, window_end, end_cursor, pages, rows_fetched, started_at
+        FROM sync_checkpoints
+        WHERE entity = ?
+        ORDER BY window_start
+        """,
+        [entity],
+    ).fetchall()
+    checkpoints: list[WindowCheckpoint] = []
+    for window_start, window_end, end_cursor, pages, rows_fetched, started_at in rows:
+        start = as_utc(window_start)
+        end = as_utc(window_end)
+        started = as_utc(started_at)
+        if start is None or end is None or started is None:
+            continue
+        checkpoints.append(
+            WindowCheckpoint((start, end), end_cursor, int(pages), int(rows_fetched), started)
+        )
+    return checkpoints
+
+
+def upsert_checkpoint(
+    conn: duckdb.DuckDBPyConnection, entity: str, checkpoint: WindowCheckpoint
+) -> None:
+    conn.execute(
+        """
+        INSERT INTO sync_checkpoints(
+            entity, window_start, window_end, end_cursor, pages, rows_fetched, started_at, updated_at
+        )
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(entity, window_start, window_end) DO UPDATE SET
+            end_cursor=excluded.end_cursor,
+            pages=excluded.pages,
+            rows_fetched=excluded.rows_fetched,
+            updated_at=excluded.updated_at
+        """,
+        [
+            entity,
+            checkpoint.window[0],
+            checkpoint.window[1],
+            checkpoint.end_cursor,
+            checkpoint.pages,
+            checkpoint.rows,
+            checkpoint.started_at,
+            datetime.now(tz=UTC),
+        ],
+    )
+
+
+def delete_checkpoint(conn: duckdb.DuckDBPyConnection, entity: str, window: Window) -> None:
+    conn.execute(
+        "DELETE FROM sync_checkpoints WHERE entity = ? AND window_start = ? AND window_end = ?",
+        [entity, window[0], window[1]],
+    )
@@ -1,151 +1,348 @@
 from __future__ import annotations
 
+import asyncio
 import json
+from collections.abc import AsyncGenerator, Callable
+from contextlib import aclosing
+from dataclasses import asdict, dataclass
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import Any
 
 import duckdb
 
-from ops_intelligence.config import EntityConfig, TenantConfig
-from ops_intelligence.graphql.client import GraphQLClient
+from ops_intelligence.config import TenantConfig
+from ops_intelligence.extraction.bronze import (
+    IngestCounts,
+    discard_window_rows,
+    insert_bronze_page,
+    insert_bronze_rows,
+)
+from ops_intelligence.extraction.state import (
+    Window,
+    WindowCheckpoint,
+    delete_checkpoint,
+    read_checkpoints,
+    read_sync_state,
+    upsert_checkpoint,
+    upsert_sync_state,
+)
+from ops_intelligence.extraction.windows import WindowPlanner
+from ops_intelligence.graphql.client import AsyncGraphQLClient, GraphQLPage, RawGraphQLPage
 from ops_intelligence.graphql.queries import load_query
+from ops_intelligence.graphql.transport import CircuitOpenError, GraphQLTransport
+from ops_intelligence.warehouse.columns import SilverModel, load_silver_models, projection_fields
+from ops_intelligence.warehouse.db import transaction
+from ops_intelligence.warehouse.lake import attach_bronze_lake, flush_bronze_buffer, lake_dir_for
+from ops_intelligence.warehouse.staging import ensure_staged_tables
 
 
-def _nested_value(payload: dict[str, Any], dotted: str) -> Any:
-    value: Any = payload
-    for key in dotted.split("."):
-        if not isinstance(value, dict):
-            return None
-        value = value.get(key)
-        if value is None:
-            return None
-    return value
-
-
-def _as_datetime(value: Any) -> datetime | None:
-    if not isinstance(value, str) or not value:
-        return None
-    return datetime.fromisoformat(value.replace("Z", "+00:00"))
-
-
-def _read_last_synced(conn: duckdb.DuckDBPyConnection, entity: str) -> datetime | None:
-    row = conn.execute("SELECT last_synced_at FROM sync_state WHERE entity = ?", [entity]).fetchone()
-    if not row or row[0] is None:
-        return None
-    val = row[0]
-    if isinstance(val, datetime):
-        return val
-    return None
-
-
-def _upsert_last_synced(conn: duckdb.DuckDBPyConnection, entity: str, ts: datetime) -> None:
-    conn.execute(
-        """
-        INSERT INTO sync_state(entity, last_synced_at)
-        VALUES (?, ?)
-        ON CONFLICT(entity) DO UPDATE SET last_synced_at=excluded.last_synced_at
-        """,
-        [entity, ts],
-    )
+def _commit_page(
+    conn: duckdb.DuckDBPyConnection,
+    cfg: TenantConfig,
+    entity: str,
+    window: Window,
+    started_at: datetime,
+    page: GraphQLPage | RawGraphQLPage,
+    rows_before: int,
+    models: tuple[SilverModel, ...],
+) -> IngestCounts:
+    entity_cfg = cfg.entities[entity]
+    pulled_at = datetime.now(tz=UTC)
+    with transaction(conn):
+        if isinstance(page, RawGraphQLPage):
+            counts = insert_bronze_page(
+                conn,
+                entity,
+                page.body,
+                entity_cfg,
+                window[0],
+                window[1],
+                pulled_at,
+                cfg.skip_unchanged_records,
+                models,
+            )
+        else:
+            counts = insert_bronze_rows(
+                conn,
+                entity,
+                page.rows,
+                entity_cfg,
+                window[0],
+                window[1],
+                pulled_at,
+                cfg.skip_unchanged_records,
+                models,
+            )
+        checkpoint = WindowCheckpoint(
+            window, page.end_cursor, page.number, rows_before + counts.fetched, started_at
+        )
+        upsert_checkpoint(conn, entity, checkpoint)
+    return counts
 
 
-def _window_range(
+def _commit_window(
     conn: duckdb.DuckDBPyConnection,
-    cfg: TenantConfig,
     entity: str,
-    start_at: datetime | None,
-    end_at: datetime,
-) -> list[tuple[datetime, datetime]]:
-    windows: list[tuple[datetime, datetime]] = []
-    cursor = start_at or _read_last_synced(conn, entity) or (end_at - timedelta(days=cfg.sync_window_days))
-    while cursor < end_at:
-        next_cursor = min(cursor + timedelta(days=cfg.sync_window_days), end_at)
-        windows.append((cursor, next_cursor))
-        cursor = next_cursor
-    return windows
+    window: Window,
+    watermark: datetime | None,
+    rows_per_hour: float | None,
+) -> None:
+    with transaction(conn):
+        delete_checkpoint(conn, entity, window)
+        if watermark is not None:
+            upsert_sync_state(conn, entity, watermark, rows_per_hour)
 
 
-def _insert_bronze_rows(
+def _rollback_window(
     conn: duckdb.DuckDBPyConnection,
     entity: str,
-    rows: list[dict[str, Any]],
-    entity_cfg: EntityConfig,
-    window_start: datetime,
-    window_end: datetime,
+    window: Window,
+    models: tuple[SilverModel, ...],
 ) -> int:
-    now = datetime.now(tz=UTC)
-    payload = []
-    for row in rows:
-        updated_at = _as_datetime(_nested_value(row, entity_cfg.updated_at_field))
-        payload.append(
-            [
-                entity,
-                now,
-                window_start,
-                window_end,
-                json.dumps(row, separators=(",", ":")),
-                updated_at,
-            ]
+    with transaction(conn):
+        discarded = discard_window_rows(conn, entity, window, models)
+        delete_checkpoint(conn, entity, window)
+    return discarded
+
+
+@dataclass
+class _PageBatch:
+    entity: str
+    window: Window
+    started_at: datetime
+    page: GraphQLPage | RawGraphQLPage
+    resumed_rows: int
+
+
+@dataclass
+class _WindowDone:
+    entity: str
+    window: Window
+    resumed_rows: int
+
+
+@dataclass
+class _WindowSplit:
+    entity: str
+    window: Window
+
+
+_WRITES_DONE = object()
+
+
+def _first_error(group: BaseExceptionGroup) -> BaseException:
+    error = group.exceptions[0]
+    if isinstance(error, BaseExceptionGroup):
+        return _first_error(error)
+    return error
+
+
+async def _fetch_windows(
+    client: AsyncGraphQLClient,
+    cfg: TenantConfig,
+    entity: str,
+    query: str,
+    planner: WindowPlanner,
+    writes: asyncio.Queue[Any],
+    global_limit: asyncio.Semaphore,
+    degraded: dict[str, CircuitOpenError],
+) -> None:
+    entity_cfg = cfg.entities[entity]
+    iter_pages: Callable[..., AsyncGenerator[GraphQLPage | RawGraphQLPage, None]] = (
+        client.iter_raw_pages if cfg.raw_page_ingest else client.iter_pages
+    )
+    while not degraded.get(entity) and (window := planner.next_window()) is not None:
+        resume = planner.resume_point(window)
+        resumed_rows = resume.rows if resume else 0
+        started_at = resume.started_at if resume else datetime.now(tz=UTC)
+        split = False
+        async with global_limit, aclosing(
+            iter_pages(
+                query=query,
+                entity_config=entity_cfg,
+                window_start=window[0],
+                window_end=window[1],
+                page_size=cfg.page_size,
+                max_pages=cfg.max_pages,
+                circuit=entity,
+                after=resume.end_cursor if resume else None,
+                start_page=resume.pages if resume else 0,
+            )
+        ) as page_iter:
+            try:
+                async for page in page_iter:
+                    await writes.put(_PageBatch(entity, window, started_at, page, resumed_rows))
+                    if (
+                        page.has_next_page
+                        and planner.over_budget(page.number, page.number * cfg.page_size)
+                        and planner.split(window)
+                    ):
+                        split = True
+                        break
+            except CircuitOpenError as exc:
+                degraded[entity] = exc
+                return
+        if split:
+            await writes.put(_WindowSplit(entity=entity, window=window))
+            continue
+        await writes.put(_WindowDone(entity, window, resumed_rows))
+
+
+async def _write_pages(
+    conn: duckdb.DuckDBPyConnection,
+    cfg: TenantConfig,
+    writes: asyncio.Queue[Any],
+    planners: dict[str, WindowPlanner],
+    counts: dict[str, IngestCounts],
+    models: tuple[SilverModel, ...],
+) -> None:
+    window_counts: dict[tuple[str, Window], IngestCounts] = {}
+    while True:
+        item = await writes.get()
+        if item is _WRITES_DONE:
+            return
+        if isinstance(item, _WindowSplit):
+            await asyncio.to_thread(
+                _rollback_window, conn, item.entity, item.window, models
+            )
+            counts[item.entity].add(
+                window_counts.pop((item.entity, item.window), IngestCounts()), sign=-1
+            )
+            continue
+        if isinstance(item, _WindowDone):
+            planner = planners[item.entity]
+            fetched = window_counts.pop((item.entity, item.window), IngestCounts()).fetched
+            planner.observe(item.window, item.resumed_rows + fetched)
+            watermark = planner.finish(item.window)
+            await asyncio.to_thread(
+                _commit_window, conn, item.entity, item.window, watermark, planner.rows_per_hour
+            )
+            continue
+        window_total = window_counts.setdefault((item.entity, item.window), IngestCounts())
+        page_counts = await asyncio.to_thread(
+            _commit_page,
+            conn,
+            cfg,
+            item.entity,
+            item.window,
+            item.started_at,
+            item.page,
+            item.resumed_rows + window_total.fetched,
+            models,
         )
+        window_total.add(page_counts)
+        counts[item.entity].add(page_counts)
 
-    if payload:
-        conn.executemany(
-            """
-            INSERT INTO bronze_events(entity, pulled_at, window_start, window_end, record_json, record_updated_at)
-            VALUES (?, ?, ?, ?, ?, ?)
-            """,
-            payload,
+
+def entity_query(cfg: TenantConfig, entity: str) -> str:
+    entity_cfg = cfg.entities[entity]
+    fields = (
+        projection_fields(
+            entity,
+            entity_cfg.updated_at_field,
+            entity_cfg.id_field,
+            models=load_silver_models(cfg.silver_mapping_path),
         )
-    return len(payload)
+        if cfg.prune_queries
+        else None
+    )
+    return load_query(entity_cfg.query_file, fields, cfg.schema_snapshot_path)
 
 
-def sync_entities(
+def _planner_for(
+    conn: duckdb.DuckDBPyConnection,
+    cfg: TenantConfig,
+    entity: str,
+    start_at: datetime | None,
+    end_at: datetime,
+) -> WindowPlanner:
+    last_synced, rows_per_hour = read_sync_state(conn, entity)
+    checkpoints = read_checkpoints(conn, entity)
+    default_start = min(
+        [c.window[0] for c in checkpoints], default=end_at - timedelta(days=cfg.sync_window_days)
+    )
+    start = start_at or last_synced or default_start
+    return WindowPlanner(cfg, start, end_at, rows_per_hour, checkpoints)
+
+
+async def sync_entities_async(
     conn: duckdb.DuckDBPyConnection,
     cfg: TenantConfig,
     entities: list[str] | None = None,
     start_at: datetime | None = None,
     end_at: datetime | None = None,
-) -> dict[str, int]:
+) -> dict[str, dict[str, int]]:
     wanted = entities or list(cfg.entities.keys())
     missing = [e for e in wanted if e not in cfg.entities]
     if missing:
         raise ValueError(f"Entities missing from config: {', '.join(missing)}")
 
     end_ts = end_at or datetime.now(tz=UTC)
-    counts: dict[str, int] = {e: 0 for e in wanted}
+    attach_bronze_lake(conn, cfg)
+    models = load_silver_models(cfg.silver_mapping_path)
+    ensure_staged_tables(conn, models=models)
+    counts = {e: IngestCounts() for e in wanted}
+    planners = {e: _planner_for(conn, cfg, e, start_at, end_ts) for e in wanted}
+    writes: asyncio.Queue[Any] = asyncio.Queue(maxsize=max(1, cfg.prefetch_pages * cfg.max_concurrency))
+    global_limit = asyncio.Semaphore(max(1, cfg.max_concurrency))
+    degraded: dict[str, CircuitOpenError] = {}
 
-    with GraphQLClient(
+    async with AsyncGraphQLClient(
         endpoint=cfg.graphql_endpoint,
         api_key=cfg.api_key(),
         timeout_seconds=cfg.timeout_seconds,
+        max_connections=max(1, cfg.max_concurrency),
+        transport=GraphQLTransport(cfg.transport),
     ) as client:
-        for entity in wanted:
-            entity_cfg = cfg.entities[entity]
-            query = load_query(entity_cfg.query_file)
-            for window_start, window_end in _window_range(conn, cfg, entity, start_at, end_ts):
-                rows = client.fetch_all_pages(
-                    query=query,
-                    entity_config=entity_cfg,
-                    window_start=window_start,
-                    window_end=window_end,
-                    page_size=cfg.page_size,
-                    max_pages=cfg.max_pages,
-                )
-                inserted = _insert_bronze_rows(
-                    conn=conn,
-                    entity=entity,
-                    rows=rows,
-                    entity_cfg=entity_cfg,
-                    window_start=window_start,
-                    window_end=window_end,
-                )
-                counts[entity] += inserted
-                _upsert_last_synced(conn, entity, window_end)
-    return counts
+
+        async def _fetch_all() -> None:
+            async with asyncio.TaskGroup() as fetchers:
+                for entity in wanted:
+                    query = entity_query(cfg, entity)
+                    for _ in range(max(1, cfg.entities[entity].max_concurrency)):
+                        fetchers.create_task(
+                            _fetch_windows(
+                                client,
+                                cfg,
+                                entity,
+                                query,
+                                planners[entity],
+                                writes,
+                                global_limit,
+                                degraded,
+                            )
+                        )
+            await writes.put(_WRITES_DONE)
+
+        try:
+            async with asyncio.TaskGroup() as group:
+                group.create_task(_write_pages(conn, cfg, writes, planners, counts, models))
+                group.create_task(_fetch_all())
+        except BaseExceptionGroup as group_error:
+            raise _first_error(group_error) from None
+    if (lake_dir := lake_dir_for(cfg)) is not None:
+        flush_bronze_buffer(conn, lake_dir)
+    summary = {entity: asdict(entity_counts) for entity, entity_counts in counts.items()}
+    if degraded:
+        details = "; ".join(f"{entity}: {exc}" for entity, exc in sorted(degraded.items()))
+        raise CircuitOpenError(f"Sync stopped for degraded entities ({details}); counts={summary}")
+    return summary
+
+
+def sync_entities(
+    conn: duckdb.DuckDBPyConnection,
+    cfg: TenantConfig,
+    entities: list[str] | None = None,
+    start_at: datetime | None = None,
+    end_at: datetime | None = None,
+) -> dict[str, dict[str, int]]:
+    return asyncio.run(
+        sync_entities_async(conn=conn, cfg=cfg, entities=entities, start_at=start_at, end_at=end_at)
+    )
 
 
-def write_sync_manifest(path: str, counts: dict[str, int]) -> None:
+def write_sync_manifest(path: str, counts: dict[str, dict[str, int]]) -> None:
     out = Path(path)
     out.parent.mkdir(parents=True, exist_ok=True)
     out.write_text(json.dumps(counts, indent=2, sort_keys=True), encoding="utf-8")
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from collections import deque
+from datetime import datetime, timedelta
+
+from ops_intelligence.config import TenantConfig
+from ops_intelligence.extraction.state import Window, WindowCheckpoint
+
+
+class WindowPlanner:
+    def __init__(
+        self,
+        cfg: TenantConfig,
+        start_at: datetime,
+        end_at: datetime,
+        rows_per_hour: float | None,
+        checkpoints: list[WindowCheckpoint] | None = None,
+    ) -> None:
+        self._cfg = cfg
+        self._cursor = start_at
+        self._end = end_at
+        self._min_size = timedelta(minutes=cfg.min_window_minutes)
+        self._max_size = timedelta(days=cfg.max_window_days)
+        self._size = timedelta(days=cfg.sync_window_days)
+        self._resume = {
+            c.window: c for c in checkpoints or [] if start_at <= c.window[0] and c.window[1] <= end_at
+        }
+        self._reserved = sorted(self._resume)
+        self._retry: deque[Window] = deque(self._reserved)
+        self._open: set[Window] = set()
+        self._watermark = start_at
+        self.rows_per_hour = rows_per_hour
+        if cfg.adaptive_windows and rows_per_hour is not None:
+            self._size = self._sized_for(rows_per_hour)
+
+    def _sized_for(self, rows_per_hour: float) -> timedelta:
+        if rows_per_hour <= 0:
+            return self._max_size
+        ideal = timedelta(hours=self._cfg.window_target_rows / rows_per_hour)
+        return max(self._min_size, min(ideal, self._max_size))
+
+    def _next_planned(self) -> Window | None:
+        for start, end in self._reserved:
+            if start <= self._cursor < end:
+                self._cursor = end
+        if self._cursor >= self._end:
+            return None
+        stop = min(self._cursor + self._size, self._end)
+        for start, _ in self._reserved:
+            if self._cursor < start < stop:
+                stop = start
+                break
+        window = (self._cursor, stop)
+        self._cursor = stop
+        return window
+
+    def next_window(self) -> Window | None:
+        window = self._retry.popleft() if self._retry else self._next_planned()
+        if window is not None:
+            self._open.add(window)
+        return window
+
+    def resume_point(self, window: Window) -> WindowCheckpoint | None:
+        return self._resume.pop(window, None)
+
+    def over_budget(self, pages: int, rows: int) -> bool:
+        return pages >= self._cfg.window_page_budget or rows >= self._cfg.window_row_budget
+
+    def split(self, window: Window) -> bool:
+        half = (window[1] - window[0]) / 2
+        if not self._cfg.adaptive_windows or half < self._min_size:
+            return False
+        self._open.discard(window)
+        self._retry.extendleft([(window[0] + half, window[1]), (window[0], window[0] + half)])
+        self._size = min(self._size, half)
+        return True
+
+    def observe(self, window: Window, rows: int) -> None:
+        hours = (window[1] - window[0]).total_seconds() / 3600
+        if hours <= 0:
+            return
+        observed = rows / hours
+        if self.rows_per_hour is None:
+            self.rows_per_hour = observed
+        else:
+            self.rows_per_hour = (self.rows_per_hour + observed) / 2
+        if self._cfg.adaptive_windows:
+            self._size = max(self._size / 4, min(self._sized_for(self.rows_per_hour), self._size * 2))
+
+    def finish(self, window: Window) -> datetime | None:
+        self._open.discard(window)
+        pending = [w[0] for w in self._open] + [w[0] for w in self._retry]
+        watermark = min(pending) if pending else self._cursor
+        if watermark <= self._watermark:
+            return None
+        self._watermark = watermark
+        return watermark
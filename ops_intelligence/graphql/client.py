@@ -1,31 +1,149 @@
 from __future__ import annotations
 
+import asyncio
+import json
+import re
+import time
+from collections.abc import AsyncGenerator, Callable, Iterator
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
 
 import httpx
-from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
 
 from ops_intelligence.config import EntityConfig
+from ops_intelligence.graphql.transport import (
+    CircuitBreaker,
+    GraphQLError,
+    GraphQLTransport,
+    TransientGraphQLError,
+    check_payload,
+    check_response,
+    classify_http_error,
+)
 from ops_intelligence.utils import deep_get
 
 
-class GraphQLError(RuntimeError):
-    pass
+@dataclass
+class GraphQLPage:
+    rows: list[dict[str, Any]]
+    end_cursor: str | None
+    has_next_page: bool
+    number: int
+
+
+@dataclass
+class RawGraphQLPage:
+    body: str
+    end_cursor: str | None
+    has_next_page: bool
+    number: int
+
+
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _auth_headers(api_key: str) -> dict[str, str]:
+    return {
+        "Authorization": f"Bearer {api_key}",
+        "Content-Type": "application/json",
+        "Accept": "application/json",
+    }
+
+
+def _decode(response: httpx.Response) -> dict[str, Any]:
+    check_response(response)
+    try:
+        payload = response.json()
+    except ValueError as exc:
+        raise TransientGraphQLError(f"Invalid JSON response: {exc}") from exc
+    return check_payload(payload)
+
+
+def _decode_raw(response: httpx.Response) -> str:
+    check_response(response)
+    body = response.text
+    if '"errors"' in body or '"data"' not in body:
+        try:
+            payload = json.loads(body)
+        except ValueError as exc:
+            raise TransientGraphQLError(f"Invalid JSON response: {exc}") from exc
+        if not isinstance(payload, dict):
+            raise TransientGraphQLError("GraphQL response is not a JSON object")
+        check_payload(payload)
+    return body
+
+
+def _page_variables(
+    entity_config: EntityConfig,
+    window_start: datetime,
+    window_end: datetime,
+    page_size: int,
+    after: str | None,
+) -> dict[str, Any]:
+    return {
+        entity_config.first_variable: page_size,
+        entity_config.after_variable: after,
+        entity_config.updated_after_variable: window_start.isoformat(),
+        entity_config.updated_before_variable: window_end.isoformat(),
+    }
+
+
+def _read_page(
+    payload: dict[str, Any], entity_config: EntityConfig
+) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+    page_rows = deep_get(payload, entity_config.root_path)
+    page_info = deep_get(payload, entity_config.page_info_path)
+
+    if page_rows is None or page_info is None:
+        raise GraphQLError(
+            "Unable to read expected root/pageInfo path. "
+            f"root_path={entity_config.root_path}, page_info_path={entity_config.page_info_path}"
+        )
+    if not isinstance(page_rows, list) or not isinstance(page_info, dict):
+        raise GraphQLError("Invalid root/pageInfo payload types")
+    return page_rows, page_info
+
+
+def _read_raw_page_info(body: str, entity_config: EntityConfig) -> dict[str, Any]:
+    key = entity_config.page_info_path.rsplit(".", 1)[-1]
+    pattern = re.compile(rf'"{re.escape(key)}"\s*:\s*')
+    index = body.rfind(f'"{key}"')
+    while index >= 0:
+        match = pattern.match(body, index)
+        if match is not None:
+            try:
+                page_info, _ = _JSON_DECODER.raw_decode(body, match.end())
+            except ValueError:
+                break
+            if isinstance(page_info, dict):
+                return page_info
+            break
+        index = body.rfind(f'"{key}"', 0, index)
+    raise GraphQLError(
+        f"Unable to read expected pageInfo path. page_info_path={entity_config.page_info_path}"
+    )
+
+
+def _check_page_budget(pages: int, max_pages: int, entity_config: EntityConfig) -> None:
+    if pages > max_pages:
+        raise GraphQLError(
+            f"Pagination exceeded max pages ({max_pages}) for {entity_config.query_file}"
+        )
 
 
 class GraphQLClient:
-    def __init__(self, endpoint: str, api_key: str, timeout_seconds: int = 45) -> None:
+    def __init__(
+        self,
+        endpoint: str,
+        api_key: str,
+        timeout_seconds: int = 45,
+        transport: GraphQLTransport | None = None,
+    ) -> None:
         self.endpoint = endpoint
         self.timeout_seconds = timeout_seconds
-        self._http = httpx.Client(
-            timeout=timeout_seconds,
-            headers={
-                "Authorization": f"Bearer {api_key}",
-                "Content-Type": "application/json",
-                "Accept": "application/json",
-            },
-        )
+        self.transport = transport or GraphQLTransport()
+        self._http = httpx.Client(timeout=timeout_seconds, headers=_auth_headers(api_key))
 
     def close(self) -> None:
         self._http.close()
@@ -36,22 +154,60 @@ class GraphQLClient:
     def __exit__(self, *_: object) -> None:
         self.close()
 
-    @retry(
-        retry=retry_if_exception_type((httpx.HTTPError, GraphQLError)),
-        stop=stop_after_attempt(4),
-        wait=wait_exponential(multiplier=1, min=1, max=8),
-        reraise=True,
-    )
-    def execute(self, query: str, variables: dict[str, Any]) -> dict[str, Any]:
-        response = self._http.post(self.endpoint, json={"query": query, "variables": variables})
-        response.raise_for_status()
-        payload = response.json()
-        if payload.get("errors"):
-            raise GraphQLError(str(payload["errors"]))
-        if "data" not in payload:
-            raise GraphQLError("GraphQL response missing 'data'")
+    def _execute_once(
+        self, query: str, variables: dict[str, Any], breaker: CircuitBreaker
+    ) -> dict[str, Any]:
+        breaker.check()
+        time.sleep(self.transport.bucket.reserve())
+        try:
+            response = self._http.post(self.endpoint, json={"query": query, "variables": variables})
+            payload = _decode(response)
+        except httpx.HTTPError as exc:
+            breaker.record_failure()
+            raise classify_http_error(exc) from exc
+        except TransientGraphQLError:
+            breaker.record_failure()
+            raise
+        breaker.record_success()
+        return payload
+
+    def execute(
+        self, query: str, variables: dict[str, Any], circuit: str | None = None
+    ) -> dict[str, Any]:
+        breaker = self.transport.breaker(circuit or self.endpoint)
+        payload: dict[str, Any] = {}
+        for attempt in self.transport.retrying():
+            with attempt:
+                payload = self._execute_once(query, variables, breaker)
         return payload
 
+    def iter_pages(
+        self,
+        query: str,
+        entity_config: EntityConfig,
+        window_start: datetime,
+        window_end: datetime,
+        page_size: int,
+        max_pages: int,
+        circuit: str | None = None,
+        after: str | None = None,
+        start_page: int = 0,
+    ) -> Iterator[GraphQLPage]:
+        pages = start_page
+
+        while True:
+            pages += 1
+            _check_page_budget(pages, max_pages, entity_config)
+            variables = _page_variables(entity_config, window_start, window_end, page_size, after)
+            payload = self.execute(query=query, variables=variables, circuit=circuit)
+            page_rows, page_info = _read_page(payload, entity_config)
+
+            has_next = bool(page_info.get("hasNextPage"))
+            after = page_info.get("endCursor")
+            yield GraphQLPage(rows=page_rows, end_cursor=after, has_next_page=has_next, number=pages)
+            if not has_next:
+                break
+
     def fetch_all_pages(
         self,
         query: str,
@@ -61,40 +217,145 @@ class GraphQLClient:
         page_size: int,
         max_pages: int,
     ) -> list[dict[str, Any]]:
-        after: str | None = None
-        pages = 0
         rows: list[dict[str, Any]] = []
+        for page in self.iter_pages(
+            query=query,
+            entity_config=entity_config,
+            window_start=window_start,
+            window_end=window_end,
+            page_size=page_size,
+            max_pages=max_pages,
+        ):
+            rows.extend(page.rows)
+        return rows
+
+
+class AsyncGraphQLClient:
+    def __init__(
+        self,
+        endpoint: str,
+        api_key: str,
+        timeout_seconds: int = 45,
+        max_connections: int = 4,
+        transport: GraphQLTransport | None = None,
+    ) -> None:
+        self.endpoint = endpoint
+        self.timeout_seconds = timeout_seconds
+        self.transport = transport or GraphQLTransport()
+        self._http = httpx.AsyncClient(
+            timeout=timeout_seconds,
+            headers=_auth_headers(api_key),
+            limits=httpx.Limits(max_connections=max_connections),
+        )
+
+    async def aclose(self) -> None:
+        await self._http.aclose()
+
+    async def __aenter__(self) -> AsyncGraphQLClient:
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        await self.aclose()
+
+    async def _execute_once(
+        self,
+        query: str,
+        variables: dict[str, Any],
+        breaker: CircuitBreaker,
+        decode: Callable[[httpx.Response], Any],
+    ) -> Any:
+        breaker.check()
+        await asyncio.sleep(self.transport.bucket.reserve())
+        try:
+            response = await self._http.post(
+                self.endpoint, json={"query": query, "variables": variables}
+            )
+            payload = decode(response)
+        except httpx.HTTPError as exc:
+            breaker.record_failure()
+            raise classify_http_error(exc) from exc
+        except TransientGraphQLError:
+            breaker.record_failure()
+            raise
+        breaker.record_success()
+        return payload
+
+    async def _execute(
+        self,
+        query: str,
+        variables: dict[str, Any],
+        circuit: str | None,
+        decode: Callable[[httpx.Response], Any],
+    ) -> Any:
+        breaker = self.transport.breaker(circuit or self.endpoint)
+        payload: Any = None
+        async for attempt in self.transport.async_retrying():
+            with attempt:
+                payload = await self._execute_once(query, variables, breaker, decode)
+        return payload
+
+    async def execute(
+        self, query: str, variables: dict[str, Any], circuit: str | None = None
+    ) -> dict[str, Any]:
+        payload: dict[str, Any] = await self._execute(query, variables, circuit, _decode)
+        return payload
+
+    async def execute_raw(
+        self, query: str, variables: dict[str, Any], circuit: str | None = None
+    ) -> str:
+        body: str = await self._execute(query, variables, circuit, _decode_raw)
+        return body
+
+    async def iter_pages(
+        self,
+        query: str,
+        entity_config: EntityConfig,
+        window_start: datetime,
+        window_end: datetime,
+        page_size: int,
+        max_pages: int,
+        circuit: str | None = None,
+        after: str | None = None,
+        start_page: int = 0,
+    ) -> AsyncGenerator[GraphQLPage, None]:
+        pages = start_page
 
         while True:
             pages += 1
-            if pages > max_pages:
-                raise GraphQLError(
-                    f"Pagination exceeded max pages ({max_pages}) for {entity_config.query_file}"
-                )
-
-            variables: dict[str, Any] = {
-                entity_config.first_variable: page_size,
-                entity_config.after_variable: after,
-                entity_config.updated_after_variable: window_start.isoformat(),
-                entity_config.updated_before_variable: window_end.isoformat(),
-            }
-
-            payload = self.execute(query=query, variables=variables)
-            page_rows = deep_get(payload, entity_config.root_path)
-            page_info = deep_get(payload, entity_config.page_info_path)
-
-            if page_rows is None or page_info is None:
-                raise GraphQLError(
-                    "Unable to read expected root/pageInfo path. "
-                    f"root_path={entity_config.root_path}, page_info_path={entity_config.page_info_path}"
-                )
-            if not isinstance(page_rows, list) or not isinstance(page_info, dict):
-                raise GraphQLError("Invalid root/pageInfo payload types")
-
-            rows.extend(page_rows)
+            _check_page_budget(pages, max_pages, entity_config)
+            variables = _page_variables(entity_config, window_start, window_end, page_size, after)
+            payload = await self.execute(query=query, variables=variables, circuit=circuit)
+            page_rows, page_info = _read_page(payload, entity_config)
+
             has_next = bool(page_info.get("hasNextPage"))
             after = page_info.get("endCursor")
+            yield GraphQLPage(rows=page_rows, end_cursor=after, has_next_page=has_next, number=pages)
             if not has_next:
                 break
 
-        return rows
+    async def iter_raw_pages(
+        self,
+        query: str,
+        entity_config: EntityConfig,
+        window_start: datetime,
+        window_end: datetime,
+        page_size: int,
+        max_pages: int,
+        circuit: str | None = None,
+        after: str | None = None,
+        start_page: int = 0,
+    ) -> AsyncGenerator[RawGraphQLPage, None]:
+        pages = start_page
+
+        while True:
+            pages += 1
+            _check_page_budget(pages, max_pages, entity_config)
+            variables = _page_variables(entity_config, window_start, window_end, page_size, after)
+            body = await self.execute_raw(query=query, variables=variables, circuit=circuit)
+            page_info = _read_raw_page_info(body, entity_config)
+
+            has_next = bool(page_info.get("hasNextPage"))
+            after = page_info.get("endCursor")
+            yield RawGraphQLPage(body=body, end_cursor=after, has_next_page=has_next, number=pages)
+            if not has_next:
+                break
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+from typing import Any
+
+from graphql import (
+    DocumentNode,
+    FieldNode,
+    NameNode,
+    OperationDefinitionNode,
+    SelectionSetNode,
+    Visitor,
+    parse,
+    print_ast,
+    visit,
+)
+
+FieldTree = dict[str, Any]
+
+
+class ProjectionError(ValueError):
+    pass
+
+
+def _named_type(type_ref: dict[str, Any] | None) -> str | None:
+    while type_ref is not None:
+        if type_ref.get("name"):
+            return str(type_ref["name"])
+        type_ref = type_ref.get("ofType")
+    return None
+
+
+def _schema_types(schema: dict[str, Any]) -> dict[str, dict[str, str | None]]:
+    types: dict[str, dict[str, str | None]] = {}
+    for type_obj in schema.get("types", []):
+        name = type_obj.get("name")
+        fields = type_obj.get("fields")
+        if name and isinstance(fields, list):
+            types[name] = {f["name"]: _named_type(f.get("type")) for f in fields if f.get("name")}
+    return types
+
+
+def _query_type_name(schema: dict[str, Any]) -> str:
+    query_type = schema.get("queryType") or {}
+    return str(query_type.get("name") or "Query")
+
+
+def schema_node_type(schema: dict[str, Any], root_field: str) -> str | None:
+    types = _schema_types(schema)
+    connection = types.get(_query_type_name(schema), {}).get(root_field)
+    if connection is None:
+        return None
+    return types.get(connection, {}).get("nodes")
+
+
+def _schema_has_path(types: dict[str, dict[str, str | None]], type_name: str, path: str) -> bool:
+    current: str | None = type_name
+    for part in path.split("."):
+        fields = types.get(current or "")
+        if fields is None or part not in fields:
+            return False
+        current = fields[part]
+    return True
+
+
+def _tree_has_path(tree: FieldTree, path: str) -> bool:
+    current: Any = tree
+    for part in path.split("."):
+        if not isinstance(current, dict) or part not in current:
+            return False
+        current = current[part]
+    return True
+
+
+def _selection_tree(selection_set: SelectionSetNode | None) -> FieldTree:
+    tree: FieldTree = {}
+    if selection_set is None:
+        return tree
+    for selection in selection_set.selections:
+        if isinstance(selection, FieldNode) and selection.alias is None:
+            tree[selection.name.value] = _selection_tree(selection.selection_set)
+    return tree
+
+
+def _selection_set(tree: FieldTree) -> SelectionSetNode:
+    return SelectionSetNode(
+        selections=tuple(
+            FieldNode(
+                name=NameNode(value=name),
+                arguments=(),
+                directives=(),
+                selection_set=_selection_set(children) if children else None,
+            )
+            for name, children in tree.items()
+        )
+    )
+
+
+def _nodes_field(document: DocumentNode) -> tuple[FieldNode, FieldNode]:
+    operation = next(
+        (d for d in document.definitions if isinstance(d, OperationDefinitionNode)), None
+    )
+    if operation is None:
+        raise ProjectionError("Query template has no operation")
+    root = next((s for s in operation.selection_set.selections if isinstance(s, FieldNode)), None)
+    if root is None or root.selection_set is None:
+        raise ProjectionError("Query template has no root connection field")
+    nodes = next(
+        (
+            s
+            for s in root.selection_set.selections
+            if isinstance(s, FieldNode) and s.name.value == "nodes"
+        ),
+        None,
+    )
+    if nodes is None:
+        raise ProjectionError(f"Query template root '{root.name.value}' has no 'nodes' selection")
+    return root, nodes
+
+
+def select_paths(
+    alternatives: tuple[tuple[str, ...], ...],
+    template_tree: FieldTree,
+    schema: dict[str, Any] | None,
+    root_field: str,
+) -> list[str]:
+    types = _schema_types(schema) if schema else {}
+    node_type = schema_node_type(schema, root_field) if schema else None
+
+    def available(path: str) -> bool:
+        if node_type is not None:
+            return _schema_has_path(types, node_type, path)
+        return _tree_has_path(template_tree, path)
+
+    selected: list[str] = []
+    for paths in alternatives:
+        selected += [p for p in paths if available(p) and p not in selected]
+    return selected
+
+
+def prune_query(
+    template: str,
+    alternatives: tuple[tuple[str, ...], ...],
+    schema: dict[str, Any] | None = None,
+) -> str:
+    document = parse(template)
+    root, nodes = _nodes_field(document)
+    selected = select_paths(alternatives, _selection_tree(nodes.selection_set), schema, root.name.value)
+    if not selected:
+        raise ProjectionError(f"No silver fields are available on '{root.name.value}.nodes'")
+
+    tree: FieldTree = {}
+    for path in selected:
+        branch = tree
+        for part in path.split("."):
+            branch = branch.setdefault(part, {})
+    pruned_nodes = FieldNode(
+        name=nodes.name,
+        alias=nodes.alias,
+        arguments=nodes.arguments,
+        directives=nodes.directives,
+        selection_set=_selection_set(tree),
+    )
+
+    class _ReplaceNodes(Visitor):
+        def enter_field(self, node: FieldNode, *_: Any) -> FieldNode | None:
+            return pruned_nodes if node is nodes else None
+
+    return print_ast(visit(document, _ReplaceNodes()))
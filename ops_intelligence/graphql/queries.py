@@ -1,17 +1,42 @@
 from __future__ import annotations
 
+import json
+from functools import lru_cache
 from pathlib import Path
+from typing import Any
+
+from ops_intelligence.graphql.projection import ProjectionError, prune_query
 
 
 class QueryLoadError(RuntimeError):
     pass
 
 
-def load_query(path: str) -> str:
+@lru_cache(maxsize=8)
+def _load_schema(path: str) -> dict[str, Any] | None:
+    schema_path = Path(path)
+    if not schema_path.exists():
+        return None
+    schema = json.loads(schema_path.read_text(encoding="utf-8"))
+    return schema if isinstance(schema, dict) else None
+
+
+@lru_cache(maxsize=64)
+def load_query(
+    path: str,
+    fields: tuple[tuple[str, ...], ...] | None = None,
+    schema_path: str | None = None,
+) -> str:
     query_path = Path(path)
     if not query_path.exists():
         raise QueryLoadError(f"Query file not found: {path}")
     content = query_path.read_text(encoding="utf-8").strip()
     if not content:
         raise QueryLoadError(f"Query file is empty: {path}")
-    return content
+    if not fields:
+        return content
+    schema = _load_schema(schema_path) if schema_path else None
+    try:
+        return prune_query(content, fields, schema)
+    except ProjectionError as exc:
+        raise QueryLoadError(f"Unable to prune {path}: {exc}") from exc
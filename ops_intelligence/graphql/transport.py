@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+import httpx
+from tenacity import (
+    AsyncRetrying,
+    RetryCallState,
+    Retrying,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential,
+)
+
+from ops_intelligence.config import TransportConfig
+
+TRANSIENT_STATUS_CODES = {408, 425, 500, 502, 503, 504}
+TRANSIENT_GRAPHQL_CODES = {
+    "INTERNAL_SERVER_ERROR",
+    "RATE_LIMITED",
+    "SERVICE_UNAVAILABLE",
+    "THROTTLED",
+    "TIMEOUT",
+}
+
+
+class GraphQLError(RuntimeError):
+    pass
+
+
+class TransientGraphQLError(GraphQLError):
+    pass
+
+
+class RateLimitedError(TransientGraphQLError):
+    def __init__(self, message: str, retry_after: float | None = None) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class PermanentGraphQLError(GraphQLError):
+    pass
+
+
+class CircuitOpenError(GraphQLError):
+    pass
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+def check_response(response: httpx.Response) -> None:
+    if response.is_success:
+        return
+    message = f"HTTP {response.status_code} from {response.request.url}"
+    if response.status_code == 429:
+        raise RateLimitedError(message, parse_retry_after(response.headers.get("Retry-After")))
+    if response.status_code in TRANSIENT_STATUS_CODES:
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        if retry_after is not None:
+            raise RateLimitedError(message, retry_after)
+        raise TransientGraphQLError(message)
+    raise PermanentGraphQLError(message)
+
+
+def check_payload(payload: dict[str, Any]) -> dict[str, Any]:
+    errors = payload.get("errors")
+    if errors:
+        codes = {
+            str((error.get("extensions") or {}).get("code", "")).upper()
+            for error in errors
+            if isinstance(error, dict)
+        }
+        if codes & {"RATE_LIMITED", "THROTTLED"}:
+            raise RateLimitedError(str(errors))
+        if codes & TRANSIENT_GRAPHQL_CODES:
+            raise TransientGraphQLError(str(errors))
+        raise PermanentGraphQLError(str(errors))
+    if "data" not in payload:
+        raise TransientGraphQLError("GraphQL response missing 'data'")
+    return payload
+
+
+def classify_http_error(exc: httpx.HTTPError) -> GraphQLError:
+    if isinstance(exc, httpx.TransportError):
+        return TransientGraphQLError(f"{type(exc).__name__}: {exc}")
+    return PermanentGraphQLError(f"{type(exc).__name__}: {exc}")
+
+
+class TokenBucket:
+    def __init__(self, rate_per_second: float, burst: int) -> None:
+        self.rate_per_second = rate_per_second
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate_per_second)
+        self._updated = now
+
+    def try_acquire(self) -> bool:
+        if self.rate_per_second <= 0:
+            return True
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+    def reserve(self) -> float:
+        if self.rate_per_second <= 0:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= 1
+            wait = 0.0 if self._tokens >= 0 else -self._tokens / self.rate_per_second
+            return max(wait, self._paused_until - now)
+
+    def pause(self, seconds: float) -> None:
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+
+class CircuitBreaker:
+    def __init__(self, name: str, failure_threshold: int, reset_seconds: float) -> None:
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_seconds = reset_seconds
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        with self._lock:
+            return self._opened_at is not None and (
+                time.monotonic() - self._opened_at < self.reset_seconds
+            )
+
+    def check(self) -> None:
+        if self.is_open:
+            raise CircuitOpenError(
+                f"Circuit '{self.name}' is open after {self._failures} consecutive transient "
+                f"failures; retrying after {self.reset_seconds:.0f}s"
+            )
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+
+
+class GraphQLTransport:
+    def __init__(self, settings: TransportConfig | None = None) -> None:
+        self.settings = settings or TransportConfig()
+        self.bucket = TokenBucket(self.settings.requests_per_second, self.settings.burst)
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def breaker(self, circuit: str) -> CircuitBreaker:
+        with self._lock:
+            if circuit not in self._breakers:
+                self._breakers[circuit] = CircuitBreaker(
+                    circuit,
+                    self.settings.circuit_failure_threshold,
+                    self.settings.circuit_reset_seconds,
+                )
+            return self._breakers[circuit]
+
+    def _wait(self, retry_state: RetryCallState) -> float:
+        exc = retry_state.outcome.exception() if retry_state.outcome else None
+        if isinstance(exc, RateLimitedError) and exc.retry_after is not None:
+            delay = min(exc.retry_after, self.settings.max_retry_after_seconds)
+            self.bucket.pause(delay)
+            return delay
+        return float(wait_exponential(multiplier=1, min=1, max=8)(retry_state))
+
+    def _retry_kwargs(self) -> dict[str, Any]:
+        return {
+            "retry": retry_if_exception_type(TransientGraphQLError),
+            "stop": stop_after_attempt(self.settings.max_attempts),
+            "wait": self._wait,
+            "reraise": True,
+        }
+
+    def retrying(self) -> Retrying:
+        return Retrying(**self._retry_kwargs())
+
+    def async_retrying(self) -> AsyncRetrying:
+        return AsyncRetrying(**self._retry_kwargs())
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+from dataclasses import asdict
 from datetime import UTC, datetime
 from pathlib import Path
 
+import duckdb
+
 from ops_intelligence.alerts.engine import run_alert_engine
 from ops_intelligence.config import TenantConfig
 from ops_intelligence.extraction.sync import sync_entities, write_sync_manifest
@@ -12,16 +15,58 @@ from ops_intelligence.reports.exporter import (
     send_email_reports,
     send_webhook_report,
 )
-from ops_intelligence.warehouse.modeling import run_gold_models, run_silver_models
+from ops_intelligence.warehouse.columns import load_silver_models
+from ops_intelligence.warehouse.lake import attach_bronze_lake
+from ops_intelligence.warehouse.modeling import run_models
+from ops_intelligence.warehouse.resources import StageUsage, governed_stage, record_stage_runs
+from ops_intelligence.warehouse.snapshot import (
+    open_read_snapshot,
+    publish_read_snapshot,
+    snapshot_path_for,
+)
 
 
-def run_modeling(cfg: TenantConfig, conn) -> None:  # type: ignore[no-untyped-def]
-    run_silver_models(conn)
-    run_gold_models(conn)
+def run_modeling(
+    cfg: TenantConfig,
+    conn: duckdb.DuckDBPyConnection,
+    full_refresh: bool = False,
+    select: list[str] | None = None,
+) -> dict[str, object]:
+    attach_bronze_lake(conn, cfg)
+    runs = run_models(
+        conn,
+        select,
+        full_refresh=full_refresh,
+        threads=cfg.model_threads,
+        models=load_silver_models(cfg.silver_mapping_path),
+        trips=cfg.trips,
+    )
+    payload: dict[str, dict[str, object]] = {"silver": {}, "gold": {}}
+    for run in runs:
+        payload[run.layer][run.name] = {
+            **run.details,
+            "status": run.status,
+            "seconds": run.seconds,
+            "table_rows": run.rows,
+            "table_bytes": run.bytes,
+        }
+    result: dict[str, object] = dict(payload)
+    snapshot = snapshot_path_for(cfg)
+    if snapshot is not None:
+        result["read_snapshot"] = publish_read_snapshot(conn, snapshot)
+    return result
 
 
-def run_reporting(cfg: TenantConfig, conn) -> dict[str, object]:  # type: ignore[no-untyped-def]
-    exported = export_csv_reports(conn, cfg.output_dir)
+def run_reporting(cfg: TenantConfig, conn: duckdb.DuckDBPyConnection) -> dict[str, object]:
+    snapshot = snapshot_path_for(cfg)
+    if snapshot is not None and not snapshot.exists():
+        publish_read_snapshot(conn, snapshot)
+    reader = open_read_snapshot(cfg, cfg.resources.report) if snapshot is not None else conn
+    try:
+        exported = export_csv_reports(reader, cfg.output_dir, cfg.report_grains)
+    finally:
+        if reader is not conn:
+            reader.close()
     copied = push_to_shared_drive(exported, cfg.shared_drive_path)
     emailed = send_email_reports(cfg, exported)
     webhook_sent = send_webhook_report(cfg, exported)
@@ -35,24 +80,40 @@ def run_reporting(cfg: TenantConfig, conn) -> dict[str, object]:  # type: ignore
 
 def run_full_pipeline(
     cfg: TenantConfig,
-    conn,
+    conn: duckdb.DuckDBPyConnection,
     entities: list[str] | None = None,
     start_at: datetime | None = None,
     end_at: datetime | None = None,
-) -> dict[str, object]:  # type: ignore[no-untyped-def]
+    full_refresh: bool = False,
+) -> dict[str, object]:
     end_ts = end_at or datetime.now(tz=UTC)
-    sync_counts = sync_entities(conn=conn, cfg=cfg, entities=entities, start_at=start_at, end_at=end_ts)
+    usages: list[StageUsage] = []
+    try:
+        with governed_stage(conn, "sync", cfg.resources.sync) as usage:
+            usages.append(usage)
+            sync_counts = sync_entities(
+                conn=conn, cfg=cfg, entities=entities, start_at=start_at, end_at=end_ts
+            )
 
-    manifest_path = Path(cfg.output_dir) / "manifests" / f"sync_{end_ts.strftime('%Y%m%d_%H%M%S')}.json"
-    write_sync_manifest(str(manifest_path), sync_counts)
+        manifest_path = Path(cfg.output_dir) / "manifests" / f"sync_{end_ts.strftime('%Y%m%d_%H%M%S')}.json"
+        write_sync_manifest(str(manifest_path), sync_counts)
 
-    run_modeling(cfg, conn)
-    report_status = run_reporting(cfg, conn)
-    alerts = run_alert_engine(conn, cfg)
+        with governed_stage(conn, "model", cfg.resources.model) as usage:
+            usages.append(usage)
+            modeling = run_modeling(cfg, conn, full_refresh=full_refresh)
+        with governed_stage(conn, "report", cfg.resources.report) as usage:
+            usages.append(usage)
+            report_status = run_reporting(cfg, conn)
+            alerts = run_alert_engine(conn, cfg)
+    finally:
+        if usages:
+            record_stage_runs(conn, usages)
 
     return {
         "sync_counts": sync_counts,
         "manifest": str(manifest_path),
+        "modeling": modeling,
         "reports": report_status,
         "alerts": [a.__dict__ for a in alerts],
+        "resources": {usage.stage: asdict(usage) for usage in usages},
     }
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from ops_intelligence.config import TenantConfig
+from ops_intelligence.extraction.sync import sync_entities
+from ops_intelligence.replay.server import ReplaySettings, StandInGraphQLServer
+from ops_intelligence.warehouse.db import connect_warehouse
+
+
+@dataclass
+class ExtractionBenchmarkResult:
+    label: str
+    run: int
+    rows: int
+    seconds: float
+    requests: int
+    throttled: int
+    errors: int
+    peak_rss_mb: float | None
+    error: str | None = None
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds > 0 else 0.0
+
+
+def parse_variant(spec: str) -> tuple[str, dict[str, Any]]:
+    label, _, assignments = spec.partition(":")
+    overrides: dict[str, Any] = {}
+    for assignment in filter(None, (a.strip() for a in assignments.split(","))):
+        key, sep, value = assignment.partition("=")
+        if not sep:
+            raise ValueError(f"Variant override '{assignment}' must look like key=value")
+        overrides[key.strip()] = yaml.safe_load(value)
+    return label.strip() or "baseline", overrides
+
+
+def apply_overrides(cfg: TenantConfig, overrides: dict[str, Any]) -> TenantConfig:
+    payload = cfg.model_dump()
+    for dotted, value in overrides.items():
+        *parents, leaf = dotted.split(".")
+        target = payload
+        for key in parents:
+            if not isinstance(target.get(key), dict):
+                raise ValueError(f"Override '{dotted}' does not name a nested config section")
+            target = target[key]
+        target[leaf] = value
+    return TenantConfig.model_validate(payload)
+
+
+def _workdir_overrides(cfg: TenantConfig, workdir: str) -> dict[str, Any]:
+    root = Path(workdir)
+    overrides: dict[str, Any] = {
+        "warehouse_path": str(root / "bench.duckdb"),
+        "read_snapshot_path": str(root / "bench_read.duckdb"),
+        "bronze_lake_dir": str(root / "bronze"),
+        "output_dir": workdir,
+    }
+    for stage, profile in cfg.resources:
+        if profile.temp_directory is not None:
+            overrides[f"resources.{stage}.temp_directory"] = str(root / "spill" / stage)
+    return overrides
+
+
+def _peak_rss_mb() -> float | None:
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _timed_sync(
+    cfg_payload: dict[str, Any],
+    entities: list[str] | None,
+    start_at: datetime,
+    end_at: datetime,
+) -> tuple[int, float, float | None]:
+    cfg = TenantConfig.model_validate(cfg_payload)
+    conn = connect_warehouse(cfg.warehouse_path, cfg.resources.sync)
+    began = time.perf_counter()
+    try:
+        counts = sync_entities(conn, cfg, entities, start_at, end_at)
+    finally:
+        conn.close()
+    elapsed = time.perf_counter() - began
+    return sum(c["fetched"] for c in counts.values()), elapsed, _peak_rss_mb()
+
+
+def benchmark_extraction(
+    cfg: TenantConfig,
+    settings: ReplaySettings,
+    start_at: datetime,
+    end_at: datetime,
+    variants: dict[str, dict[str, Any]] | None = None,
+    entities: list[str] | None = None,
+    repeat: int = 1,
+) -> list[ExtractionBenchmarkResult]:
+    os.environ.setdefault(cfg.api_key_env, "replay")
+    context = multiprocessing.get_context("spawn")
+    results: list[ExtractionBenchmarkResult] = []
+    for label, overrides in (variants or {"baseline": {}}).items():
+        for run in range(1, max(1, repeat) + 1):
+            with tempfile.TemporaryDirectory() as workdir, StandInGraphQLServer(settings) as server:
+                run_cfg = apply_overrides(
+                    cfg,
+                    {
+                        "graphql_endpoint": server.url,
+                        **_workdir_overrides(cfg, workdir),
+                        "transport.requests_per_second": 0.0,
+                        **overrides,
+                    },
+                )
+                began = time.perf_counter()
+                rows, seconds, peak, error = 0, 0.0, None, None
+                try:
+                    with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+                        rows, seconds, peak = pool.submit(
+                            _timed_sync, run_cfg.model_dump(), entities, start_at, end_at
+                        ).result()
+                except Exception as exc:
+                    seconds = time.perf_counter() - began
+                    error = f"{type(exc).__name__}: {exc}"
+                results.append(
+                    ExtractionBenchmarkResult(
+                        label=label,
+                        run=run,
+                        rows=rows,
+                        seconds=seconds,
+                        requests=server.stats.requests,
+                        throttled=server.stats.throttled,
+                        errors=server.stats.errors,
+                        peak_rss_mb=peak,
+                        error=error,
+                    )
+                )
+    return results
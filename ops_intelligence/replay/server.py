@@ -0,0 +1,393 @@
+from __future__ import annotations
+
+import json
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+from graphql import (
+    FieldNode,
+    ObjectFieldNode,
+    ObjectValueNode,
+    OperationDefinitionNode,
+    SelectionSetNode,
+    VariableNode,
+    parse,
+)
+
+from ops_intelligence.graphql.transport import TokenBucket
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+
+@dataclass
+class ReplaySettings:
+    rows_per_hour: float = 200.0
+    requests_per_second: float = 0.0
+    burst: int = 5
+    retry_after_seconds: float = 1.0
+    latency_ms: float = 0.0
+    latency_jitter_ms: float = 0.0
+    max_page_size: int | None = None
+    error_rate: float = 0.0
+    graphql_error_rate: float = 0.0
+    recordings_dir: str | None = None
+    updated_at_fields: tuple[str, ...] = ("lastUpdatedAt", "updatedAt")
+    seed: int | None = None
+
+
+@dataclass
+class ReplayStats:
+    requests: int = 0
+    throttled: int = 0
+    errors: int = 0
+    rows_served: int = 0
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+
+@dataclass
+class _ParsedQuery:
+    root: str
+    node_fields: dict[str, Any]
+    first_var: str | None
+    after_var: str | None
+    gte_var: str | None
+    lte_var: str | None
+
+
+def _selection_tree(selection_set: SelectionSetNode | None) -> dict[str, Any]:
+    tree: dict[str, Any] = {}
+    if selection_set is None:
+        return tree
+    for selection in selection_set.selections:
+        if isinstance(selection, FieldNode):
+            key = selection.alias.value if selection.alias else selection.name.value
+            tree[key] = _selection_tree(selection.selection_set) or None
+    return tree
+
+
+def _variable_name(value: Any) -> str | None:
+    return value.name.value if isinstance(value, VariableNode) else None
+
+
+def _filter_variables(value: Any) -> tuple[str | None, str | None]:
+    gte: str | None = None
+    lte: str | None = None
+    if isinstance(value, ObjectValueNode):
+        for object_field in value.fields:
+            if not isinstance(object_field, ObjectFieldNode):
+                continue
+            name = object_field.name.value
+            if name in {"gte", "gt"}:
+                gte = _variable_name(object_field.value)
+            elif name in {"lte", "lt"}:
+                lte = _variable_name(object_field.value)
+            else:
+                nested_gte, nested_lte = _filter_variables(object_field.value)
+                gte = gte or nested_gte
+                lte = lte or nested_lte
+    return gte, lte
+
+
+@lru_cache(maxsize=64)
+def _parse_query(query: str) -> _ParsedQuery:
+    document = parse(query)
+    operation = next(d for d in document.definitions if isinstance(d, OperationDefinitionNode))
+    root = next(s for s in operation.selection_set.selections if isinstance(s, FieldNode))
+    arguments = {arg.name.value: arg.value for arg in root.arguments or ()}
+    gte_var, lte_var = _filter_variables(arguments.get("filter"))
+    connection = _selection_tree(root.selection_set)
+    return _ParsedQuery(
+        root=root.name.value,
+        node_fields=connection.get("nodes") or {"id": None},
+        first_var=_variable_name(arguments.get("first")),
+        after_var=_variable_name(arguments.get("after")),
+        gte_var=gte_var,
+        lte_var=lte_var,
+    )
+
+
+def _as_utc(ts: datetime) -> datetime:
+    return ts if ts.tzinfo is not None else ts.replace(tzinfo=UTC)
+
+
+def _parse_ts(value: Any) -> datetime | None:
+    if not isinstance(value, str) or not value:
+        return None
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def _synthetic_value(name: str, root: str, index: int, ts: datetime) -> Any:
+    lowered = name.lower()
+    if lowered == "id":
+        return f"{root}-{index}"
+    if lowered.endswith("_id"):
+        return f"{name[:-3]}-{index % 97}"
+    if name.endswith("Id"):
+        return f"{name[:-2]}-{index % 97}"
+    if lowered.endswith(("timestamp", "at")):
+        return ts.isoformat().replace("+00:00", "Z")
+    if lowered.endswith("date"):
+        return ts.date().isoformat()
+    if "latitude" in lowered:
+        return 35.0 + (index % 100) / 1000
+    if "longitude" in lowered:
+        return -90.0 - (index % 100) / 1000
+    if "weight" in lowered or "amount" in lowered or "balance" in lowered or "freight" in lowered:
+        return float(20 + index % 7)
+    if lowered == "status":
+        return "COMPLETE"
+    return f"{name}-{index % 13}"
+
+
+def _synthetic_node(tree: dict[str, Any], root: str, index: int, ts: datetime) -> dict[str, Any]:
+    node: dict[str, Any] = {}
+    for name, children in tree.items():
+        if children:
+            node[name] = _synthetic_node(children, root, index, ts)
+        else:
+            node[name] = _synthetic_value(name, root, index, ts)
+    return node
+
+
+def _window(
+    parsed: _ParsedQuery, variables: dict[str, Any], settings: ReplaySettings
+) -> tuple[int, int, datetime | None, datetime | None]:
+    first = int(variables.get(parsed.first_var or "first") or 100)
+    if settings.max_page_size is not None:
+        first = min(first, settings.max_page_size)
+    after = int(variables.get(parsed.after_var or "after") or 0)
+    start = _parse_ts(variables.get(parsed.gte_var or "updatedAfter"))
+    end = _parse_ts(variables.get(parsed.lte_var or "updatedBefore"))
+    return first, after, start, end
+
+
+def _connection(root: str, nodes: list[dict[str, Any]], stop: int, total: int) -> dict[str, Any]:
+    return {
+        "data": {
+            root: {
+                "nodes": nodes,
+                "pageInfo": {"hasNextPage": stop < total, "endCursor": str(stop)},
+            }
+        }
+    }
+
+
+def synthetic_page(
+    query: str, variables: dict[str, Any], settings: ReplaySettings
+) -> tuple[dict[str, Any], int]:
+    parsed = _parse_query(query)
+    first, after, start, end = _window(parsed, variables, settings)
+    if start is None or end is None or end <= start or settings.rows_per_hour <= 0:
+        first_slot, total, step = 0, 0, timedelta(0)
+    else:
+        step = max(timedelta(hours=1) / settings.rows_per_hour, timedelta(microseconds=1))
+        first_slot = -(-(_as_utc(start) - _EPOCH) // step)
+        total = max(0, (_as_utc(end) - _EPOCH) // step - first_slot + 1)
+
+    stop = min(after + first, total)
+    nodes = [
+        _synthetic_node(parsed.node_fields, parsed.root, slot, _EPOCH + step * slot)
+        for slot in range(first_slot + after, first_slot + stop)
+    ]
+    return _connection(parsed.root, nodes, stop, total), len(nodes)
+
+
+def _recorded_nodes(payload: Any, root: str) -> list[dict[str, Any]]:
+    if isinstance(payload, list):
+        nodes: list[dict[str, Any]] = []
+        for item in payload:
+            if isinstance(item, dict) and "data" in item:
+                nodes.extend(_recorded_nodes(item, root))
+            elif isinstance(item, dict):
+                nodes.append(item)
+        return nodes
+    if isinstance(payload, dict):
+        connection = (payload.get("data") or {}).get(root) or {}
+        return [n for n in connection.get("nodes") or [] if isinstance(n, dict)]
+    return []
+
+
+def load_recording(path: Path, root: str) -> list[dict[str, Any]]:
+    text = path.read_text(encoding="utf-8")
+    if path.suffix == ".jsonl":
+        payload: Any = [json.loads(line) for line in text.splitlines() if line.strip()]
+    else:
+        payload = json.loads(text)
+    return _recorded_nodes(payload, root)
+
+
+def _recorded_ts(node: dict[str, Any], fields: tuple[str, ...]) -> datetime | None:
+    for name in fields:
+        value: Any = node
+        for part in name.split("."):
+            value = value.get(part) if isinstance(value, dict) else None
+        if isinstance(value, str) and value:
+            parsed = _parse_ts(value)
+            if parsed is not None and parsed.tzinfo is None:
+                return parsed.replace(tzinfo=UTC)
+            return parsed
+    return None
+
+
+def _project(node: Any, tree: dict[str, Any] | None) -> Any:
+    if not tree or not isinstance(node, dict):
+        return node
+    return {name: _project(node.get(name), children) for name, children in tree.items()}
+
+
+class RecordedPages:
+    def __init__(self, directory: str, updated_at_fields: tuple[str, ...]) -> None:
+        self.directory = Path(directory)
+        self.updated_at_fields = updated_at_fields
+        self._nodes: dict[str, list[tuple[datetime | None, dict[str, Any]]]] = {}
+        self._lock = threading.Lock()
+
+    def nodes(self, root: str) -> list[tuple[datetime | None, dict[str, Any]]]:
+        with self._lock:
+            if root not in self._nodes:
+                nodes: list[dict[str, Any]] = []
+                for suffix in (".json", ".jsonl"):
+                    path = self.directory / f"{root}{suffix}"
+                    if path.exists():
+                        nodes.extend(load_recording(path, root))
+                stamped = [(_recorded_ts(n, self.updated_at_fields), n) for n in nodes]
+                self._nodes[root] = sorted(
+                    stamped, key=lambda item: (item[0] is None, item[0] or datetime.min)
+                )
+            return self._nodes[root]
+
+    def page(
+        self, query: str, variables: dict[str, Any], settings: ReplaySettings
+    ) -> tuple[dict[str, Any], int]:
+        parsed = _parse_query(query)
+        first, after, start, end = _window(parsed, variables, settings)
+        matching = [
+            node
+            for ts, node in self.nodes(parsed.root)
+            if start is None or end is None or (ts is not None and start <= ts <= end)
+        ]
+        stop = min(after + first, len(matching))
+        nodes = [_project(node, parsed.node_fields) for node in matching[after:stop]]
+        return _connection(parsed.root, nodes, stop, len(matching)), len(nodes)
+
+
+class StandInGraphQLServer:
+    def __init__(
+        self, settings: ReplaySettings | None = None, host: str = "127.0.0.1", port: int = 0
+    ) -> None:
+        self.settings = settings or ReplaySettings()
+        self.stats = ReplayStats()
+        self._bucket = TokenBucket(self.settings.requests_per_second, self.settings.burst)
+        self._random = random.Random(self.settings.seed)
+        self._random_lock = threading.Lock()
+        self._recorded = (
+            RecordedPages(self.settings.recordings_dir, self.settings.updated_at_fields)
+            if self.settings.recordings_dir
+            else None
+        )
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        if isinstance(host, bytes):
+            host = host.decode()
+        return f"http://{host}:{port}/"
+
+    def _handler_class(self) -> type[BaseHTTPRequestHandler]:
+        server = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            def log_message(self, *_: Any) -> None:
+                return
+
+            def _send(self, status: int, body: dict[str, Any], headers: dict[str, str]) -> None:
+                raw = json.dumps(body, separators=(",", ":")).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(raw)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(raw)
+
+            def do_POST(self) -> None:
+                length = int(self.headers.get("Content-Length", "0"))
+                request = json.loads(self.rfile.read(length) or b"{}")
+                status, body, headers = server.handle(
+                    request.get("query", ""), request.get("variables") or {}
+                )
+                self._send(status, body, headers)
+
+        return _Handler
+
+    def _roll(self) -> float:
+        with self._random_lock:
+            return self._random.random()
+
+    def _delay(self) -> None:
+        latency = self.settings.latency_ms
+        if self.settings.latency_jitter_ms > 0:
+            latency += self._roll() * self.settings.latency_jitter_ms
+        if latency > 0:
+            time.sleep(latency / 1000)
+
+    def handle(
+        self, query: str, variables: dict[str, Any]
+    ) -> tuple[int, dict[str, Any], dict[str, str]]:
+        with self.stats.lock:
+            self.stats.requests += 1
+        self._delay()
+        if self.settings.requests_per_second > 0 and not self._bucket.try_acquire():
+            with self.stats.lock:
+                self.stats.throttled += 1
+            retry_after = f"{self.settings.retry_after_seconds:g}"
+            return 429, {"errors": [{"message": "Too many requests"}]}, {"Retry-After": retry_after}
+        roll = self._roll()
+        if roll < self.settings.error_rate:
+            with self.stats.lock:
+                self.stats.errors += 1
+            return 503, {"errors": [{"message": "Service unavailable"}]}, {}
+        if roll < self.settings.error_rate + self.settings.graphql_error_rate:
+            with self.stats.lock:
+                self.stats.errors += 1
+            error = {"message": "Internal error", "extensions": {"code": "INTERNAL_SERVER_ERROR"}}
+            return 200, {"data": None, "errors": [error]}, {}
+        try:
+            if self._recorded is not None:
+                page, served = self._recorded.page(query, variables, self.settings)
+            else:
+                page, served = synthetic_page(query, variables, self.settings)
+        except Exception as exc:
+            return 400, {"errors": [{"message": str(exc)}]}, {}
+        with self.stats.lock:
+            self.stats.rows_served += served
+        return 200, page, {}
+
+    def start(self) -> StandInGraphQLServer:
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        self._httpd.serve_forever()
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> StandInGraphQLServer:
+        return self.start()
+
+    def __exit__(self, *_: object) -> None:
+        self.stop()
@@ -3,6 +3,7 @@ from __future__ import annotations
 import json
 import shutil
 import smtplib
+from collections.abc import Sequence
 from datetime import datetime
 from email.message import EmailMessage
 from pathlib import Path
@@ -11,16 +12,22 @@ import duckdb
 import httpx
 
 from ops_intelligence.config import TenantConfig, env_or_empty
+from ops_intelligence.warehouse.rollups import LANE_HOURLY_TABLE, ROLLUP_RATIOS, rollup_query
+from ops_intelligence.warehouse.sketches import plain_columns
 
 REPORT_TABLES = [
     "gold_plant_ops_daily",
     "gold_dispatch_daily",
     "gold_billing_ar_daily",
+    "gold_ar_snapshot_daily",
     "gold_hauler_productivity_daily",
+    "gold_truck_trips_daily",
 ]
 
 
-def export_csv_reports(conn: duckdb.DuckDBPyConnection, output_dir: str) -> list[Path]:
+def export_csv_reports(
+    conn: duckdb.DuckDBPyConnection, output_dir: str, grains: Sequence[str] | None = None
+) -> list[Path]:
     ts = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
     target = Path(output_dir) / "reports" / ts
     target.mkdir(parents=True, exist_ok=True)
@@ -28,8 +35,25 @@ def export_csv_reports(conn: duckdb.DuckDBPyConnection, output_dir: str) -> list
 
     for table in REPORT_TABLES:
         file_path = target / f"{table}.csv"
-        conn.execute(f"COPY (SELECT * FROM {table}) TO '{file_path.as_posix()}' (HEADER, DELIMITER ',')")
+        conn.execute(f"COPY ({plain_columns(table)}) TO '{file_path.as_posix()}' (HEADER, DELIMITER ',')")
         files.append(file_path)
+
+    for grain in grains or []:
+        exports: list[tuple[str, str | None, Path]]
+        if grain == "hour":
+            exports = [(LANE_HOURLY_TABLE, None, target / f"{LANE_HOURLY_TABLE}.csv")]
+        else:
+            exports = [
+                (table, grain, target / f"{table}_{grain}.csv")
+                for table in ROLLUP_RATIOS
+                if table != LANE_HOURLY_TABLE
+            ]
+        for table, table_grain, file_path in exports:
+            sql, params = rollup_query(table, table_grain)
+            conn.execute(
+                f"COPY ({sql}) TO '{file_path.as_posix()}' (HEADER, DELIMITER ',')", params
+            )
+            files.append(file_path)
     return files
 
 
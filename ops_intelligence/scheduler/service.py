@@ -14,7 +14,7 @@ def start_scheduler(cfg: TenantConfig, cron: str) -> None:
     scheduler = BlockingScheduler(timezone=cfg.timezone)
 
     def _run_job() -> None:
-        conn = connect_warehouse(cfg.warehouse_path)
+        conn = connect_warehouse(cfg.warehouse_path, cfg.resources.sync)
         try:
             run_full_pipeline(cfg=cfg, conn=conn, end_at=datetime.now(tz=UTC))
         finally:
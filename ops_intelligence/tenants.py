@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import json
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, cast
+
+from ops_intelligence.config import (
+    ConfigError,
+    discover_tenant_configs,
+    parse_config,
+    read_config,
+)
+from ops_intelligence.extraction.sync import sync_entities
+from ops_intelligence.pipeline import run_full_pipeline
+from ops_intelligence.warehouse.db import connect_warehouse
+
+RUN_MODES = ("sync", "pipeline")
+
+
+@dataclass
+class TenantRunResult:
+    config_path: str
+    tenant_name: str | None
+    status: str
+    started_at: str
+    duration_seconds: float
+    sync_counts: dict[str, dict[str, int]] = field(default_factory=dict)
+    details: dict[str, Any] = field(default_factory=dict)
+    error: str | None = None
+
+
+def run_tenant(
+    config_path: str,
+    mode: str = "pipeline",
+    entities: list[str] | None = None,
+    start_at: datetime | None = None,
+    end_at: datetime | None = None,
+) -> TenantRunResult:
+    started = datetime.now(tz=UTC)
+    began = time.perf_counter()
+    tenant_name: str | None = None
+    counts: dict[str, dict[str, int]]
+    try:
+        cfg = read_config(config_path)
+        tenant_name = cfg.tenant_name
+        conn = connect_warehouse(cfg.warehouse_path, cfg.resources.sync)
+        try:
+            if mode == "sync":
+                counts = sync_entities(
+                    conn=conn, cfg=cfg, entities=entities, start_at=start_at, end_at=end_at
+                )
+                details: dict[str, Any] = {}
+            else:
+                details = run_full_pipeline(
+                    cfg=cfg, conn=conn, entities=entities, start_at=start_at, end_at=end_at
+                )
+                counts = cast(dict[str, dict[str, int]], details.pop("sync_counts"))
+        finally:
+            conn.close()
+    except Exception as exc:
+        return _failed_result(config_path, exc, started, began, tenant_name)
+    return TenantRunResult(
+        config_path=config_path,
+        tenant_name=tenant_name,
+        status="succeeded",
+        started_at=started.isoformat(),
+        duration_seconds=round(time.perf_counter() - began, 3),
+        sync_counts=counts,
+        details=json.loads(json.dumps(details, default=str)),
+    )
+
+
+def _failed_result(
+    config_path: str,
+    exc: BaseException,
+    started: datetime,
+    began: float,
+    tenant_name: str | None = None,
+) -> TenantRunResult:
+    return TenantRunResult(
+        config_path=config_path,
+        tenant_name=tenant_name,
+        status="failed",
+        started_at=started.isoformat(),
+        duration_seconds=round(time.perf_counter() - began, 3),
+        error=f"{type(exc).__name__}: {exc}",
+    )
+
+
+def _check_distinct_warehouses(paths: list[Path]) -> dict[Path, Exception]:
+    owners: dict[Path, Path] = {}
+    rejected: dict[Path, Exception] = {}
+    for path in paths:
+        try:
+            warehouse = Path(parse_config(str(path)).warehouse_path).resolve()
+        except Exception as exc:
+            rejected[path] = exc
+            continue
+        if warehouse in owners:
+            rejected[path] = ConfigError(
+                f"Tenant configs {owners[warehouse]} and {path} share warehouse {warehouse}"
+            )
+            continue
+        owners[warehouse] = path
+    return rejected
+
+
+def run_tenants(
+    config_dir: str,
+    mode: str = "pipeline",
+    workers: int = 4,
+    entities: list[str] | None = None,
+    start_at: datetime | None = None,
+    end_at: datetime | None = None,
+) -> list[TenantRunResult]:
+    if mode not in RUN_MODES:
+        raise ValueError(f"Unknown run mode '{mode}'; expected one of {', '.join(RUN_MODES)}")
+    paths = discover_tenant_configs(config_dir)
+    started = datetime.now(tz=UTC)
+    began = time.perf_counter()
+    rejected = _check_distinct_warehouses(paths)
+    runnable = [path for path in paths if path not in rejected]
+    end_ts = end_at or datetime.now(tz=UTC)
+
+    results = [_failed_result(str(path), exc, started, began) for path, exc in rejected.items()]
+    if not runnable:
+        return sorted(results, key=lambda r: r.config_path)
+    with ProcessPoolExecutor(
+        max_workers=max(1, min(workers, len(runnable))),
+        mp_context=multiprocessing.get_context("spawn"),
+    ) as pool:
+        futures = {
+            pool.submit(run_tenant, str(path), mode, entities, start_at, end_ts): path
+            for path in runnable
+        }
+        for future in as_completed(futures):
+            try:
+                results.append(future.result())
+            except Exception as exc:
+                results.append(_failed_result(str(futures[future]), exc, started, began))
+    return sorted(results, key=lambda r: r.config_path)
+
+
+def tenant_run_report(results: list[TenantRunResult], mode: str) -> dict[str, Any]:
+    failed = [r for r in results if r.status != "succeeded"]
+    inserted = sum(
+        entity_counts.get("inserted", 0)
+        for r in results
+        for entity_counts in r.sync_counts.values()
+    )
+    return {
+        "generated_at": datetime.now(tz=UTC).isoformat(),
+        "mode": mode,
+        "tenants": len(results),
+        "succeeded": len(results) - len(failed),
+        "failed": len(failed),
+        "rows_inserted": inserted,
+        "results": [asdict(r) for r in results],
+    }
+
+
+def write_tenant_run_report(path: str, report: dict[str, Any]) -> None:
+    out = Path(path)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(report, indent=2, sort_keys=True), encoding="utf-8")
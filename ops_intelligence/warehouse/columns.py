@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Literal
+
+import yaml
+from pydantic import BaseModel, Field, ValidationError
+
+from ops_intelligence.config import ConfigError
+
+DEFAULT_SILVER_MAPPING = Path(__file__).with_name("silver_mapping.yaml")
+UPDATED_AT_COLUMN = "updated_at"
+
+
+@dataclass(frozen=True)
+class SilverColumn:
+    name: str
+    paths: tuple[str, ...]
+    sql_type: str = "TEXT"
+    default: str | None = None
+
+
+@dataclass(frozen=True)
+class SilverModel:
+    table: str
+    entity: str
+    key: str
+    columns: tuple[SilverColumn, ...]
+
+    @property
+    def staging_table(self) -> str:
+        return f"staged_{self.entity}"
+
+    @property
+    def json_paths(self) -> tuple[str, ...]:
+        return tuple(dict.fromkeys(path for c in self.columns for path in c.paths))
+
+    @property
+    def mapping_hash(self) -> str:
+        spec = [self.table, self.entity, self.key, [list(vars(c).values()) for c in self.columns]]
+        return hashlib.sha256(json.dumps(spec).encode("utf-8")).hexdigest()[:16]
+
+
+class _ColumnSpec(BaseModel):
+    paths: list[str] = Field(min_length=1)
+    type: Literal["TEXT", "DOUBLE", "BIGINT", "BOOLEAN", "DATE", "TIMESTAMP"] = "TEXT"
+    default: str | int | float | None = None
+
+
+class _ModelSpec(BaseModel):
+    entity: str
+    key: str
+    columns: dict[str, list[str] | _ColumnSpec] = Field(min_length=1)
+
+
+def _read_mapping(path: Path) -> dict[str, Any]:
+    try:
+        content = yaml.safe_load(path.read_text(encoding="utf-8"))
+    except FileNotFoundError as exc:
+        raise ConfigError(f"Silver mapping not found: {path}") from exc
+    if not isinstance(content, dict):
+        raise ConfigError(f"Silver mapping {path} is empty or invalid")
+    return {table: spec for table, spec in content.items() if not str(table).startswith("x-")}
+
+
+def _overlay(base: dict[str, Any], override: dict[str, Any]) -> dict[str, Any]:
+    merged = dict(base)
+    for table, spec in override.items():
+        current = merged.get(table)
+        if isinstance(current, dict) and isinstance(spec, dict):
+            columns = {**current.get("columns", {}), **spec.get("columns", {})}
+            merged[table] = {**current, **spec, "columns": columns}
+        else:
+            merged[table] = spec
+    return merged
+
+
+def _sql_literal(value: str | int | float) -> str:
+    if isinstance(value, str):
+        return "'" + value.replace("'", "''") + "'"
+    return repr(value)
+
+
+def _compile_model(table: str, payload: Any) -> SilverModel:
+    try:
+        spec = _ModelSpec.model_validate(payload)
+    except ValidationError as exc:
+        raise ConfigError(f"Invalid silver mapping for {table}: {exc}") from exc
+    columns = []
+    for name, column in spec.columns.items():
+        if isinstance(column, list):
+            column = _ColumnSpec(paths=column)
+        default = None if column.default is None else _sql_literal(column.default)
+        columns.append(SilverColumn(name, tuple(column.paths), column.type, default))
+    names = {c.name for c in columns}
+    for required in (spec.key, UPDATED_AT_COLUMN):
+        if required not in names:
+            raise ConfigError(f"Silver mapping for {table} has no '{required}' column")
+    return SilverModel(table, spec.entity, spec.key, tuple(columns))
+
+
+_COMPILED_MAPPINGS: dict[str, tuple[SilverModel, ...]] = {}
+_COMPILED_EXTRACTIONS: dict[str, tuple[str, str]] = {}
+
+
+def load_silver_models(mapping_path: str | None = None) -> tuple[SilverModel, ...]:
+    payload = _read_mapping(DEFAULT_SILVER_MAPPING)
+    if mapping_path:
+        payload = _overlay(payload, _read_mapping(Path(mapping_path)))
+    digest = hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+    if digest not in _COMPILED_MAPPINGS:
+        models = tuple(_compile_model(table, spec) for table, spec in payload.items())
+        entities = [m.entity for m in models]
+        duplicated = sorted({e for e in entities if entities.count(e) > 1})
+        if duplicated:
+            raise ConfigError(f"Silver mapping maps entity more than once: {', '.join(duplicated)}")
+        _COMPILED_MAPPINGS[digest] = models
+    return _COMPILED_MAPPINGS[digest]
+
+
+SILVER_MODELS = load_silver_models()
+
+
+def silver_model_for(
+    entity: str, models: tuple[SilverModel, ...] = SILVER_MODELS
+) -> SilverModel | None:
+    return next((m for m in models if m.entity == entity), None)
+
+
+def projection_fields(
+    entity: str, *required: str, models: tuple[SilverModel, ...] = SILVER_MODELS
+) -> tuple[tuple[str, ...], ...] | None:
+    model = silver_model_for(entity, models)
+    if model is None:
+        return None
+    return tuple(c.paths for c in model.columns) + tuple((path,) for path in required)
+
+
+def _column_value(column: SilverColumn, positions: dict[str, int], source: str) -> str:
+    parts = [f"{source}[{positions[path]}]" for path in column.paths]
+    if column.default is not None:
+        parts.append(column.default)
+    expression = parts[0] if len(parts) == 1 else f"COALESCE({', '.join(parts)})"
+    if column.sql_type != "TEXT":
+        expression = f"TRY_CAST({expression} AS {column.sql_type})"
+    return expression
+
+
+def compile_extraction(model: SilverModel, source: str = "mapped") -> tuple[str, str]:
+    key = f"{model.mapping_hash}:{source}"
+    if key not in _COMPILED_EXTRACTIONS:
+        positions = {path: index for index, path in enumerate(model.json_paths, start=1)}
+        paths = ", ".join("'$." + path.replace("'", "''") + "'" for path in model.json_paths)
+        values = ",\n            ".join(_column_value(c, positions, source) for c in model.columns)
+        _COMPILED_EXTRACTIONS[key] = (f"json_extract_string(record_json, [{paths}])", values)
+    return _COMPILED_EXTRACTIONS[key]
+
+
+def silver_select_sql(model: SilverModel, predicate: str = "") -> str:
+    select_list = ",\n            ".join(c.name for c in model.columns)
+    return f"""
+        SELECT
+            {select_list},
+            pulled_at AS bronze_pulled_at
+        FROM {model.staging_table}
+        WHERE TRUE{predicate}
+        QUALIFY {model.key} IS NULL OR row_number() OVER (
+            PARTITION BY {model.key}
+            ORDER BY {UPDATED_AT_COLUMN} DESC NULLS LAST, pulled_at DESC
+        ) = 1
+        """
+
+
+def silver_model_sql(model: SilverModel, predicate: str = "") -> str:
+    return f"CREATE OR REPLACE TABLE {model.table} AS {silver_select_sql(model, predicate)}"
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import duckdb
+
+from ops_intelligence.config import TenantConfig
+from ops_intelligence.warehouse.columns import (
+    SILVER_MODELS,
+    SilverModel,
+    load_silver_models,
+    silver_select_sql,
+)
+from ops_intelligence.warehouse.db import BRONZE_COLUMNS, transaction
+from ops_intelligence.warehouse.lake import (
+    attach_bronze_lake,
+    flush_bronze_buffer,
+    lake_bytes,
+    lake_dir_for,
+    rewrite_lake,
+)
+from ops_intelligence.warehouse.staging import ensure_staged_tables
+
+
+@dataclass
+class CompactionReport:
+    history_depth: int
+    rows_before: int
+    rows_after: int
+    used_bytes_before: int
+    used_bytes_after: int
+    file_bytes_before: int | None
+    file_bytes_after: int | None
+    scan_seconds_before: float
+    scan_seconds_after: float
+
+    @property
+    def rows_removed(self) -> int:
+        return self.rows_before - self.rows_after
+
+    @property
+    def bytes_reclaimed(self) -> int:
+        return self.used_bytes_before - self.used_bytes_after
+
+
+def _bronze_rows(conn: duckdb.DuckDBPyConnection) -> int:
+    row = conn.execute("SELECT COUNT(*) FROM bronze").fetchone()
+    return int(row[0]) if row else 0
+
+
+def _used_bytes(conn: duckdb.DuckDBPyConnection) -> int:
+    row = conn.execute(
+        """
+        SELECT used_blocks * block_size
+        FROM pragma_database_size()
+        WHERE database_name = current_database()
+        """
+    ).fetchone()
+    return int(row[0]) if row and row[0] is not None else 0
+
+
+def _file_bytes(cfg: TenantConfig) -> int | None:
+    path = Path(cfg.warehouse_path)
+    lake_dir = lake_dir_for(cfg)
+    if not path.is_file() and lake_dir is None:
+        return None
+    size = path.stat().st_size if path.is_file() else 0
+    return size + (lake_bytes(lake_dir) if lake_dir is not None else 0)
+
+
+def scan_seconds(
+    conn: duckdb.DuckDBPyConnection, models: tuple[SilverModel, ...] = SILVER_MODELS
+) -> float:
+    began = time.perf_counter()
+    for model in models:
+        conn.execute(f"SELECT COUNT(*) FROM ({silver_select_sql(model)})").fetchone()
+    return time.perf_counter() - began
+
+
+def _backfill_record_keys(conn: duckdb.DuckDBPyConnection, cfg: TenantConfig) -> None:
+    for entity, entity_cfg in cfg.entities.items():
+        conn.execute(
+            """
+            UPDATE bronze_events
+            SET
+                record_id = json_extract_string(record_json, ?),
+                content_hash = md5_number(record_json)
+            WHERE entity = ? AND (record_id IS NULL OR content_hash IS NULL)
+            """,
+            ["$." + entity_cfg.id_field, entity],
+        )
+
+
+_KEEP_RECENT = """
+    QUALIFY record_id IS NULL OR row_number() OVER (
+        PARTITION BY entity, record_id
+        ORDER BY record_updated_at DESC NULLS LAST, pulled_at DESC
+    ) <= ?
+    ORDER BY entity, record_updated_at, record_id
+"""
+
+
+def compact_bronze(
+    conn: duckdb.DuckDBPyConnection, cfg: TenantConfig, history_depth: int | None = None
+) -> CompactionReport:
+    depth = history_depth if history_depth is not None else cfg.compact_history_depth
+    if depth < 1:
+        raise ValueError("history_depth must keep at least one version per record")
+
+    attach_bronze_lake(conn, cfg)
+    models = load_silver_models(cfg.silver_mapping_path)
+    conn.execute("CHECKPOINT")
+    rows_before = _bronze_rows(conn)
+    used_before = _used_bytes(conn)
+    file_before = _file_bytes(cfg)
+    scan_before = scan_seconds(conn, models)
+
+    lake_dir = lake_dir_for(cfg)
+    with transaction(conn):
+        _backfill_record_keys(conn, cfg)
+        if lake_dir is None:
+            conn.execute(
+                f"CREATE OR REPLACE TABLE bronze_events AS SELECT * FROM bronze_events {_KEEP_RECENT}",
+                [depth],
+            )
+    if lake_dir is not None:
+        flush_bronze_buffer(conn, lake_dir)
+        rewrite_lake(
+            conn,
+            lake_dir,
+            f"SELECT {', '.join(BRONZE_COLUMNS)}, record_date FROM bronze_lake {_KEEP_RECENT}",
+            [depth],
+        )
+    ensure_staged_tables(conn, force=True, models=models)
+    conn.execute("CHECKPOINT")
+
+    return CompactionReport(
+        history_depth=depth,
+        rows_before=rows_before,
+        rows_after=_bronze_rows(conn),
+        used_bytes_before=used_before,
+        used_bytes_after=_used_bytes(conn),
+        file_bytes_before=file_before,
+        file_bytes_after=_file_bytes(cfg),
+        scan_seconds_before=scan_before,
+        scan_seconds_after=scan_seconds(conn, models),
+    )
@@ -1,19 +1,85 @@
 from __future__ import annotations
 
+import logging
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 
 import duckdb
 
+from ops_intelligence.config import ResourceProfile
 
-def connect_warehouse(db_path: str) -> duckdb.DuckDBPyConnection:
+logger = logging.getLogger(__name__)
+
+BRONZE_COLUMNS = (
+    "entity",
+    "pulled_at",
+    "window_start",
+    "window_end",
+    "record_json",
+    "record_updated_at",
+    "record_id",
+    "content_hash",
+)
+
+
+def empty_lake_sql() -> str:
+    return f"SELECT {', '.join(BRONZE_COLUMNS)}, NULL::DATE AS record_date FROM bronze_events WHERE false"
+
+
+def apply_resource_profile(conn: duckdb.DuckDBPyConnection, profile: ResourceProfile) -> None:
+    for setting, value in profile.model_dump(exclude={"temp_directory"}).items():
+        if value is None:
+            conn.execute(f"RESET {setting}")
+        else:
+            conn.execute(f"SET {setting} = ?", [value])
+    if profile.temp_directory is None:
+        return
+    current = conn.execute("SELECT current_setting('temp_directory')").fetchone()
+    if current and current[0] == profile.temp_directory:
+        return
+    Path(profile.temp_directory).mkdir(parents=True, exist_ok=True)
+    try:
+        conn.execute("SET temp_directory = ?", [profile.temp_directory])
+    except duckdb.NotImplementedException as exc:
+        logger.warning(
+            "Keeping DuckDB temp_directory %s instead of %s: %s",
+            current[0] if current else None,
+            profile.temp_directory,
+            exc,
+        )
+
+
+def connect_warehouse(
+    db_path: str, profile: ResourceProfile | None = None
+) -> duckdb.DuckDBPyConnection:
     Path(db_path).parent.mkdir(parents=True, exist_ok=True)
     conn = duckdb.connect(db_path)
+    if profile is not None:
+        apply_resource_profile(conn, profile)
     conn.execute("PRAGMA enable_object_cache")
     conn.execute(
         """
         CREATE TABLE IF NOT EXISTS sync_state (
             entity TEXT PRIMARY KEY,
-            last_synced_at TIMESTAMP
+            last_synced_at TIMESTAMP,
+            rows_per_hour DOUBLE
+        )
+        """
+    )
+    conn.execute("ALTER TABLE sync_state ADD COLUMN IF NOT EXISTS rows_per_hour DOUBLE")
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS sync_checkpoints (
+            entity TEXT,
+            window_start TIMESTAMP,
+            window_end TIMESTAMP,
+            end_cursor TEXT,
+            pages INTEGER,
+            rows_fetched BIGINT,
+            started_at TIMESTAMP,
+            updated_at TIMESTAMP,
+            PRIMARY KEY (entity, window_start, window_end)
         )
         """
     )
@@ -25,7 +91,83 @@ def connect_warehouse(db_path: str) -> duckdb.DuckDBPyConnection:
             window_start TIMESTAMP,
             window_end TIMESTAMP,
             record_json TEXT,
-            record_updated_at TIMESTAMP
+            record_updated_at TIMESTAMP,
+            record_id TEXT,
+            content_hash UHUGEINT
+        )
+        """
+    )
+    conn.execute("ALTER TABLE bronze_events ADD COLUMN IF NOT EXISTS record_id TEXT")
+    conn.execute("ALTER TABLE bronze_events ADD COLUMN IF NOT EXISTS content_hash UHUGEINT")
+    conn.execute(f"CREATE VIEW IF NOT EXISTS bronze_lake AS {empty_lake_sql()}")
+    columns = ", ".join(BRONZE_COLUMNS)
+    conn.execute(
+        f"""
+        CREATE OR REPLACE VIEW bronze AS
+        SELECT {columns}, CAST(record_updated_at AS DATE) AS record_date FROM bronze_events
+        UNION ALL
+        SELECT {columns}, record_date FROM bronze_lake
+        """
+    )
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS bronze_fingerprints (
+            entity TEXT,
+            record_id TEXT,
+            content_hash UHUGEINT,
+            pulled_at TIMESTAMP,
+            PRIMARY KEY (entity, record_id)
+        )
+        """
+    )
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS model_state (
+            model TEXT PRIMARY KEY,
+            last_pulled_at TIMESTAMP,
+            definition_hash TEXT,
+            refreshed_at TIMESTAMP
+        )
+        """
+    )
+    conn.execute("ALTER TABLE model_state ADD COLUMN IF NOT EXISTS rebuilt_at TIMESTAMP")
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS model_runs (
+            run_id TEXT,
+            model TEXT,
+            layer TEXT,
+            status TEXT,
+            started_at TIMESTAMP,
+            seconds DOUBLE,
+            table_rows BIGINT,
+            table_bytes BIGINT,
+            details TEXT,
+            error TEXT
+        )
+        """
+    )
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS stage_runs (
+            run_id TEXT,
+            stage TEXT,
+            started_at TIMESTAMP,
+            seconds DOUBLE,
+            threads INTEGER,
+            memory_limit TEXT,
+            peak_memory_bytes BIGINT,
+            peak_spill_bytes BIGINT
+        )
+        """
+    )
+    conn.execute("ALTER TABLE stage_runs ADD COLUMN IF NOT EXISTS temp_directory TEXT")
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS gold_partition_log (
+            table_name TEXT,
+            partition_date DATE,
+            refreshed_at TIMESTAMP
         )
         """
     )
@@ -39,4 +181,27 @@ def connect_warehouse(db_path: str) -> duckdb.DuckDBPyConnection:
         )
         """
     )
+    conn.execute("ALTER TABLE alert_events ADD COLUMN IF NOT EXISTS location_id TEXT")
+    conn.execute("ALTER TABLE alert_events ADD COLUMN IF NOT EXISTS alert_date DATE")
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS alert_runs (
+            evaluated_at TIMESTAMP,
+            mode TEXT,
+            partitions BIGINT,
+            findings INTEGER
+        )
+        """
+    )
     return conn
+
+
+@contextmanager
+def transaction(conn: duckdb.DuckDBPyConnection) -> Iterator[None]:
+    conn.begin()
+    try:
+        yield
+    except BaseException:
+        conn.rollback()
+        raise
+    conn.commit()
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import shutil
+from pathlib import Path
+from typing import Any
+
+import duckdb
+
+from ops_intelligence.config import TenantConfig
+from ops_intelligence.warehouse.db import BRONZE_COLUMNS, empty_lake_sql, transaction
+
+_SETTLED_ROWS = """
+    NOT EXISTS (
+        SELECT 1
+        FROM sync_checkpoints AS c
+        WHERE c.entity = b.entity AND c.window_start = b.window_start AND c.window_end = b.window_end
+    )
+"""
+
+
+def _literal(value: str) -> str:
+    return "'" + value.replace("'", "''") + "'"
+
+
+def lake_dir_for(cfg: TenantConfig) -> str | None:
+    return cfg.bronze_lake_dir if cfg.bronze_storage == "parquet" else None
+
+
+def lake_files(lake_dir: str) -> list[Path]:
+    root = Path(lake_dir)
+    return sorted(root.rglob("*.parquet")) if root.is_dir() else []
+
+
+def lake_bytes(lake_dir: str) -> int:
+    return sum(path.stat().st_size for path in lake_files(lake_dir))
+
+
+def refresh_lake_view(conn: duckdb.DuckDBPyConnection, lake_dir: str) -> None:
+    if lake_files(lake_dir):
+        pattern = str(Path(lake_dir).resolve() / "**" / "*.parquet")
+        source = f"""
+            SELECT {", ".join(BRONZE_COLUMNS)}, record_date
+            FROM read_parquet(
+                {_literal(pattern)},
+                hive_partitioning = true,
+                hive_types = {{'entity': 'VARCHAR', 'record_date': 'DATE'}},
+                union_by_name = true
+            )
+            """
+    else:
+        source = empty_lake_sql()
+    conn.execute(f"CREATE OR REPLACE VIEW bronze_lake AS {source}")
+
+
+def attach_bronze_lake(conn: duckdb.DuckDBPyConnection, cfg: TenantConfig) -> None:
+    lake_dir = lake_dir_for(cfg)
+    if lake_dir is not None:
+        refresh_lake_view(conn, lake_dir)
+
+
+def _copy_to_lake(
+    conn: duckdb.DuckDBPyConnection, select_sql: str, lake_dir: str, params: list[Any] | None = None
+) -> None:
+    Path(lake_dir).mkdir(parents=True, exist_ok=True)
+    conn.execute(
+        f"""
+        COPY ({select_sql}) TO {_literal(str(Path(lake_dir).resolve()))} (
+            FORMAT parquet,
+            COMPRESSION zstd,
+            PARTITION_BY (entity, record_date),
+            APPEND,
+            FILENAME_PATTERN 'bronze_{{uuid}}'
+        )
+        """,
+        params or [],
+    )
+
+
+def flush_bronze_buffer(conn: duckdb.DuckDBPyConnection, lake_dir: str) -> int:
+    row = conn.execute(f"SELECT COUNT(*) FROM bronze_events AS b WHERE {_SETTLED_ROWS}").fetchone()
+    settled = int(row[0]) if row else 0
+    if settled:
+        with transaction(conn):
+            _copy_to_lake(
+                conn,
+                f"""
+                SELECT {", ".join(BRONZE_COLUMNS)}, CAST(record_updated_at AS DATE) AS record_date
+                FROM bronze_events AS b
+                WHERE {_SETTLED_ROWS}
+                ORDER BY entity, record_updated_at, record_id
+                """,
+                lake_dir,
+            )
+            conn.execute(f"DELETE FROM bronze_events AS b WHERE {_SETTLED_ROWS}")
+    refresh_lake_view(conn, lake_dir)
+    return settled
+
+
+def rewrite_lake(
+    conn: duckdb.DuckDBPyConnection, lake_dir: str, select_sql: str, params: list[Any] | None = None
+) -> None:
+    root = Path(lake_dir).resolve()
+    staged = root.with_name(root.name + ".rewrite")
+    retired = root.with_name(root.name + ".retired")
+    for leftover in (staged, retired):
+        shutil.rmtree(leftover, ignore_errors=True)
+    _copy_to_lake(conn, select_sql, str(staged), params)
+    if root.exists():
+        root.rename(retired)
+    staged.rename(root)
+    shutil.rmtree(retired, ignore_errors=True)
+    refresh_lake_view(conn, lake_dir)
@@ -1,301 +1,732 @@
 from __future__ import annotations
 
+import hashlib
+from datetime import UTC, date, datetime, timedelta
+from functools import partial
+from typing import Any
+
 import duckdb
 
+from ops_intelligence.config import TripConfig
+from ops_intelligence.warehouse.columns import (
+    SILVER_MODELS,
+    SilverModel,
+    silver_model_sql,
+    silver_select_sql,
+)
+from ops_intelligence.warehouse.db import transaction
+from ops_intelligence.warehouse.partitions import partition_filter, scope_partitions
+from ops_intelligence.warehouse.rollups import (
+    LANE_HOURLY_TABLE,
+    ROLLUP_DEPENDENCIES,
+    ROLLUP_PARTITION_KEY,
+    ROLLUP_PARTITIONS,
+    ROLLUP_PERIODS,
+    ROLLUP_SCOPES,
+    rollup_sql,
+)
+from ops_intelligence.warehouse.runner import (
+    ModelNode,
+    ModelRun,
+    ModelRunError,
+    execute_models,
+    record_model_runs,
+    select_models,
+)
+from ops_intelligence.warehouse.sketches import distinct_sketch, quantile_sketch
+from ops_intelligence.warehouse.staging import ensure_staged_tables, staging_definition_hash
+from ops_intelligence.warehouse.trips import (
+    TRIPS_PARTITION,
+    TRIPS_SCOPE,
+    TRIPS_SOURCE,
+    TRIPS_TABLE,
+    trips_sql,
+)
+
+GOLD_PARTITIONS: dict[str, tuple[tuple[str, str], ...]] = {
+    "gold_plant_ops_daily": (
+        ("silver_tickets", "DATE(COALESCE(ticket_ts, loaded_ts, check_in_ts))"),
+    ),
+    "gold_dispatch_daily": (
+        ("silver_tickets", "DATE(COALESCE(pod_ts, dispatch_assigned_ts, ticket_ts))"),
+    ),
+    "gold_hauler_productivity_daily": (
+        ("silver_tickets", "DATE(COALESCE(pod_ts, ticket_ts, loaded_ts))"),
+        ("silver_hauler_pay", "DATE(pay_date)"),
+    ),
+    LANE_HOURLY_TABLE: (
+        ("silver_tickets", "DATE(COALESCE(ticket_ts, loaded_ts, check_in_ts))"),
+    ),
+    TRIPS_TABLE: ((TRIPS_SOURCE, TRIPS_PARTITION),),
+    **ROLLUP_PARTITIONS,
+}
+PARTITION_SCOPES: dict[str, dict[str, str]] = {
+    TRIPS_TABLE: {TRIPS_SOURCE: TRIPS_SCOPE},
+    **ROLLUP_SCOPES,
+}
+DAILY_PARTITION_KEY = ("service_date", "SELECT service_date FROM gold_partitions")
+PARTITION_KEYS: dict[str, tuple[str, str]] = dict.fromkeys(
+    ROLLUP_PARTITIONS, (ROLLUP_PARTITION_KEY, ROLLUP_PERIODS)
+)
+AR_SNAPSHOT_TABLE = "gold_ar_snapshot_daily"
+PARTITION_COLUMNS: dict[str, str] = {
+    **dict.fromkeys(
+        (table for table in GOLD_PARTITIONS if table not in PARTITION_KEYS), "service_date"
+    ),
+    "gold_billing_ar_daily": "as_of_date",
+}
+GOLD_CHANGE_SOURCES: dict[str, tuple[str, ...]] = {
+    **{
+        table: tuple(dict.fromkeys(source for source, _ in parts))
+        for table, parts in GOLD_PARTITIONS.items()
+    },
+    AR_SNAPSHOT_TABLE: ("silver_invoices",),
+}
+CHANGE_TRACKED = {source for sources in GOLD_CHANGE_SOURCES.values() for source in sources}
+GOLD_DEPENDENCIES: dict[str, tuple[str, ...]] = {
+    **GOLD_CHANGE_SOURCES,
+    **ROLLUP_DEPENDENCIES,
+    "gold_billing_ar_daily": ("silver_invoices",),
+}
 
-def run_silver_models(conn: duckdb.DuckDBPyConnection) -> None:
-    conn.execute(
-        """
-        CREATE OR REPLACE TABLE silver_tickets AS
-        SELECT
-            COALESCE(json_extract_string(record_json, '$.id'), json_extract_string(record_json, '$.ticketId')) AS ticket_id,
-            COALESCE(json_extract_string(record_json, '$.orderId'), json_extract_string(record_json, '$.order.id')) AS order_id,
-            COALESCE(json_extract_string(record_json, '$.customerId'), json_extract_string(record_json, '$.customer.id')) AS customer_id,
-            COALESCE(json_extract_string(record_json, '$.locationId'), json_extract_string(record_json, '$.yardId')) AS location_id,
-            COALESCE(json_extract_string(record_json, '$.laneId'), json_extract_string(record_json, '$.scaleLaneId')) AS lane_id,
-            COALESCE(json_extract_string(record_json, '$.productId'), json_extract_string(record_json, '$.product.id')) AS product_id,
-            COALESCE(json_extract_string(record_json, '$.productName'), json_extract_string(record_json, '$.product.name')) AS product_name,
-            COALESCE(json_extract_string(record_json, '$.unitOfMeasure'), json_extract_string(record_json, '$.uom')) AS unit_of_measure,
-            TRY_CAST(COALESCE(json_extract_string(record_json, '$.targetWeight'), json_extract_string(record_json, '$.targetNetWeight')) AS DOUBLE) AS target_weight,
-            TRY_CAST(COALESCE(json_extract_string(record_json, '$.netWeight'), json_extract_string(record_json, '$.actualNetWeight')) AS DOUBLE) AS net_weight,
-            TRY_CAST(COALESCE(json_extract_string(record_json, '$.checkInTimestamp'), json_extract_string(record_json, '$.inYard.checkInAt')) AS TIMESTAMP) AS check_in_ts,
-            TRY_CAST(COALESCE(json_extract_string(record_json, '$.loadedTimestamp'), json_extract_string(record_json, '$.loadedAt')) AS TIMESTAMP) AS loaded_ts,
-            TRY_CAST(COALESCE(json_extract_string(record_json, '$.ticketTimestamp'), json_extract_string(record_json, '$.issuedAt')) AS TIMESTAMP) AS ticket_ts,
-            TRY_CAST(COALESCE(json_extract_string(record_json, '$.dispatchAssignedTimestamp'), json_extract_string(record_json, '$.dispatch.assignedAt')) AS TIMESTAMP) AS dispatch_assigned_ts,
-            TRY_CAST(COALESCE(json_extract_string(record_json, '$.podTimestamp'), json_extract_string(record_json, '$.proofOfDelivery.deliveredAt')) AS TIMESTAMP) AS pod_ts,
-            COALESCE(json_extract_string(record_json, '$.status'), 'UNKNOWN') AS status,
-            COALESCE(json_extract_string(record_json, '$.truckId'), json_extract_string(record_json, '$.truck.id')) AS truck_id,
-            COALESCE(json_extract_string(record_json, '$.haulerId'), json_extract_string(record_json, '$.hauler.id')) AS hauler_id,
-            TRY_CAST(COALESCE(json_extract_string(record_json, '$.lastUpdatedAt'), json_extract_string(record_json, '$.updatedAt')) AS TIMESTAMP) AS updated_at
-        FROM bronze_events
-        WHERE entity = 'tickets'
-        """
-    )
 
+def _hash(definition: str) -> str:
+    return hashlib.sha256(definition.encode("utf-8")).hexdigest()[:16]
+
+
+def _definition_hash(model: SilverModel) -> str:
+    return _hash(silver_model_sql(model) + staging_definition_hash(model))
+
+
+def _upsert_model_state(
+    conn: duckdb.DuckDBPyConnection,
+    model: str,
+    watermark: datetime | None,
+    definition: str,
+    rebuilt_at: datetime | None,
+) -> None:
     conn.execute(
         """
-        CREATE OR REPLACE TABLE silver_orders AS
-        SELECT
-            COALESCE(json_extract_string(record_json, '$.id'), json_extract_string(record_json, '$.orderId')) AS order_id,
-            COALESCE(json_extract_string(record_json, '$.jobId'), json_extract_string(record_json, '$.job.id')) AS job_id,
-            COALESCE(json_extract_string(record_json, '$.phaseId'), json_extract_string(record_json, '$.phase.id')) AS phase_id,
-            COALESCE(json_extract_string(record_json, '$.customerId'), json_extract_string(record_json, '$.customer.id')) AS customer_id,
-            COALESCE(json_extract_string(record_json, '$.status'), 'UNKNOWN') AS status,
-            TRY_CAST(COALESCE(json_extract_string(record_json, '$.scheduledDate'), json_extract_string(record_json, '$.dispatchDate')) AS DATE) AS scheduled_date,
-            TRY_CAST(COALESCE(json_extract_string(record_json, '$.lastUpdatedAt'), json_extract_string(record_json, '$.updatedAt')) AS TIMESTAMP) AS updated_at
-        FROM bronze_events
-        WHERE entity = 'orders'
-        """
+        INSERT INTO model_state(model, last_pulled_at, definition_hash, refreshed_at, rebuilt_at)
+        VALUES (?, ?, ?, ?, ?)
+        ON CONFLICT(model) DO UPDATE SET
+            last_pulled_at=excluded.last_pulled_at,
+            definition_hash=excluded.definition_hash,
+            refreshed_at=excluded.refreshed_at,
+            rebuilt_at=COALESCE(excluded.rebuilt_at, model_state.rebuilt_at)
+        """,
+        [model, watermark, definition, datetime.now(tz=UTC), rebuilt_at],
     )
 
+
+def _table_exists(conn: duckdb.DuckDBPyConnection, table: str) -> bool:
+    row = conn.execute(
+        "SELECT COUNT(*) FROM duckdb_tables() WHERE table_name = ? AND NOT temporary", [table]
+    ).fetchone()
+    return bool(row and row[0])
+
+
+def _create_change_log(conn: duckdb.DuckDBPyConnection, table: str, replace: bool) -> None:
+    verb = "CREATE OR REPLACE TABLE" if replace else "CREATE TABLE IF NOT EXISTS"
     conn.execute(
-        """
-        CREATE OR REPLACE TABLE silver_dispatch_events AS
-        SELECT
-            COALESCE(json_extract_string(record_json, '$.id'), json_extract_string(record_json, '$.eventId')) AS dispatch_event_id,
-            COALESCE(json_extract_string(record_json, '$.ticketId'), json_extract_string(record_json, '$.ticket.id')) AS ticket_id,
-            COALESCE(json_extract_string(record_json, '$.truckId'), json_extract_string(record_json, '$.truck.id')) AS truck_id,
-            COALESCE(json_extract_string(record_json, '$.haulerId'), json_extract_string(record_json, '$.hauler.id')) AS hauler_id,
-            COALESCE(json_extract_string(record_json, '$.eventType'), 'UNKNOWN') AS event_type,
-            TRY_CAST(COALESCE(json_extract_string(record_json, '$.eventTimestamp'), json_extract_string(record_json, '$.createdAt')) AS TIMESTAMP) AS event_ts,
-            TRY_CAST(COALESCE(json_extract_string(record_json, '$.latitude'), json_extract_string(record_json, '$.position.latitude')) AS DOUBLE) AS latitude,
-            TRY_CAST(COALESCE(json_extract_string(record_json, '$.longitude'), json_extract_string(record_json, '$.position.longitude')) AS DOUBLE) AS longitude,
-            TRY_CAST(COALESCE(json_extract_string(record_json, '$.lastUpdatedAt'), json_extract_string(record_json, '$.updatedAt')) AS TIMESTAMP) AS updated_at
-        FROM bronze_events
-        WHERE entity = 'dispatch_events'
-        """
+        f"{verb} {table}_changes AS SELECT *, NULL::TIMESTAMP AS changed_at FROM {table} LIMIT 0"
     )
 
+
+def _merge_silver_batch(
+    conn: duckdb.DuckDBPyConnection,
+    model: SilverModel,
+    last_pulled_at: datetime | None,
+    high_pulled_at: datetime,
+    run_at: datetime,
+) -> int:
+    predicate = " AND pulled_at <= ?" if last_pulled_at is None else " AND pulled_at > ? AND pulled_at <= ?"
+    params = [high_pulled_at] if last_pulled_at is None else [last_pulled_at, high_pulled_at]
     conn.execute(
-        """
-        CREATE OR REPLACE TABLE silver_customers AS
-        SELECT
-            COALESCE(json_extract_string(record_json, '$.id'), json_extract_string(record_json, '$.customerId')) AS customer_id,
-            COALESCE(json_extract_string(record_json, '$.name'), json_extract_string(record_json, '$.customerName')) AS customer_name,
-            COALESCE(json_extract_string(record_json, '$.segment'), 'Unclassified') AS customer_segment,
-            COALESCE(json_extract_string(record_json, '$.region'), 'Unknown') AS region,
-            TRY_CAST(COALESCE(json_extract_string(record_json, '$.lastUpdatedAt'), json_extract_string(record_json, '$.updatedAt')) AS TIMESTAMP) AS updated_at
-        FROM bronze_events
-        WHERE entity = 'customers'
-        """
+        f"CREATE OR REPLACE TEMP TABLE silver_batch AS {silver_select_sql(model, predicate)}", params
     )
-
     conn.execute(
-        """
-        CREATE OR REPLACE TABLE silver_invoices AS
-        SELECT
-            COALESCE(json_extract_string(record_json, '$.id'), json_extract_string(record_json, '$.invoiceId')) AS invoice_id,
-            COALESCE(json_extract_string(record_json, '$.customerId'), json_extract_string(record_json, '$.customer.id')) AS customer_id,
-            TRY_CAST(COALESCE(json_extract_string(record_json, '$.invoiceDate'), json_extract_string(record_json, '$.issuedDate')) AS DATE) AS invoice_date,
-            TRY_CAST(COALESCE(json_extract_string(record_json, '$.dueDate'), json_extract_string(record_json, '$.paymentDueDate')) AS DATE) AS due_date,
-            TRY_CAST(COALESCE(json_extract_string(record_json, '$.amount'), json_extract_string(record_json, '$.invoiceAmount')) AS DOUBLE) AS invoice_amount,
-            TRY_CAST(COALESCE(json_extract_string(record_json, '$.openBalance'), json_extract_string(record_json, '$.balanceDue')) AS DOUBLE) AS open_balance,
-            COALESCE(json_extract_string(record_json, '$.status'), 'UNKNOWN') AS status,
-            TRY_CAST(COALESCE(json_extract_string(record_json, '$.lastUpdatedAt'), json_extract_string(record_json, '$.updatedAt')) AS TIMESTAMP) AS updated_at
-        FROM bronze_events
-        WHERE entity = 'invoices'
+        f"""
+        DELETE FROM silver_batch AS b
+        WHERE EXISTS (
+            SELECT 1
+            FROM {model.table} AS t
+            WHERE t.{model.key} = b.{model.key}
+              AND (
+                  COALESCE(t.updated_at, '-infinity'::TIMESTAMP)
+                      > COALESCE(b.updated_at, '-infinity'::TIMESTAMP)
+                  OR (
+                      COALESCE(t.updated_at, '-infinity'::TIMESTAMP)
+                          = COALESCE(b.updated_at, '-infinity'::TIMESTAMP)
+                      AND t.bronze_pulled_at > b.bronze_pulled_at
+                  )
+              )
+        )
         """
     )
+    replaced = f"{model.key} IN (SELECT {model.key} FROM silver_batch)"
+    if model.table in CHANGE_TRACKED:
+        conn.execute(
+            f"INSERT INTO {model.table}_changes SELECT *, ? FROM {model.table} WHERE {replaced}",
+            [run_at],
+        )
+        conn.execute(f"INSERT INTO {model.table}_changes SELECT *, ? FROM silver_batch", [run_at])
+    conn.execute(f"DELETE FROM {model.table} WHERE {replaced}")
+    row = conn.execute(f"INSERT INTO {model.table} SELECT * FROM silver_batch").fetchone()
+    conn.execute("DROP TABLE silver_batch")
+    return int(row[0]) if row else 0
 
-    conn.execute(
-        """
-        CREATE OR REPLACE TABLE silver_hauler_pay AS
-        SELECT
-            COALESCE(json_extract_string(record_json, '$.id'), json_extract_string(record_json, '$.payItemId')) AS pay_item_id,
-            COALESCE(json_extract_string(record_json, '$.haulerId'), json_extract_string(record_json, '$.hauler.id')) AS hauler_id,
-            COALESCE(json_extract_string(record_json, '$.ticketId'), json_extract_string(record_json, '$.ticket.id')) AS ticket_id,
-            TRY_CAST(COALESCE(json_extract_string(record_json, '$.expectedAmount'), json_extract_string(record_json, '$.calculatedFreight')) AS DOUBLE) AS expected_amount,
-            TRY_CAST(COALESCE(json_extract_string(record_json, '$.paidAmount'), json_extract_string(record_json, '$.actualPaidAmount')) AS DOUBLE) AS paid_amount,
-            TRY_CAST(COALESCE(json_extract_string(record_json, '$.payDate'), json_extract_string(record_json, '$.paidAt')) AS DATE) AS pay_date,
-            TRY_CAST(COALESCE(json_extract_string(record_json, '$.lastUpdatedAt'), json_extract_string(record_json, '$.updatedAt')) AS TIMESTAMP) AS updated_at
-        FROM bronze_events
-        WHERE entity = 'hauler_pay'
-        """
+
+def run_silver_model(
+    conn: duckdb.DuckDBPyConnection, model: SilverModel, full_refresh: bool = False
+) -> dict[str, Any]:
+    run_at = datetime.now(tz=UTC)
+    high = conn.execute(f"SELECT MAX(pulled_at) FROM {model.staging_table}").fetchone()
+    high_pulled_at = high[0] if high else None
+    state = conn.execute(
+        "SELECT last_pulled_at, definition_hash FROM model_state WHERE model = ?", [model.table]
+    ).fetchone()
+    definition = _definition_hash(model)
+    incremental = (
+        not full_refresh
+        and state is not None
+        and state[1] == definition
+        and _table_exists(conn, model.table)
     )
+    last_pulled_at = state[0] if state else None
 
+    with transaction(conn):
+        if incremental and model.table in CHANGE_TRACKED:
+            _create_change_log(conn, model.table, replace=False)
+        if not incremental:
+            predicate = " AND pulled_at <= ?" if high_pulled_at is not None else ""
+            conn.execute(
+                silver_model_sql(model, predicate),
+                [high_pulled_at] if high_pulled_at is not None else [],
+            )
+            count = conn.execute(f"SELECT COUNT(*) FROM {model.table}").fetchone()
+            merged = int(count[0]) if count else 0
+            watermark = high_pulled_at
+            if model.table in CHANGE_TRACKED:
+                _create_change_log(conn, model.table, replace=True)
+        elif high_pulled_at is not None and (
+            last_pulled_at is None or high_pulled_at > last_pulled_at
+        ):
+            merged = _merge_silver_batch(conn, model, last_pulled_at, high_pulled_at, run_at)
+            watermark = high_pulled_at
+        else:
+            merged = 0
+            watermark = last_pulled_at
+        _upsert_model_state(
+            conn, model.table, watermark, definition, None if incremental else run_at
+        )
+    return {
+        "mode": "incremental" if incremental else "full",
+        "rows": merged,
+        "last_pulled_at": watermark.isoformat() if watermark else None,
+    }
 
-def run_gold_models(conn: duckdb.DuckDBPyConnection, late_sla_minutes: int = 90) -> None:
-    conn.execute(
-        """
-        CREATE OR REPLACE TABLE gold_plant_ops_daily AS
-        WITH base AS (
+
+def _gold_sql(late_sla_minutes: int) -> dict[str, str]:
+    return {
+        "gold_plant_ops_daily": f"""
+            WITH base AS (
+                SELECT
+                    DATE(COALESCE(ticket_ts, loaded_ts, check_in_ts)) AS service_date,
+                    COALESCE(location_id, 'Unknown') AS location_id,
+                    lane_id,
+                    ticket_id,
+                    check_in_ts,
+                    loaded_ts,
+                    ticket_ts,
+                    target_weight,
+                    net_weight,
+                    CASE
+                        WHEN check_in_ts IS NOT NULL AND loaded_ts IS NOT NULL
+                            THEN DATE_DIFF('minute', check_in_ts, loaded_ts)
+                        ELSE NULL
+                    END AS time_in_yard_minutes,
+                    CASE
+                        WHEN loaded_ts IS NOT NULL AND ticket_ts IS NOT NULL
+                            THEN DATE_DIFF('minute', loaded_ts, ticket_ts)
+                        ELSE NULL
+                    END AS time_to_ticket_minutes,
+                    CASE
+                        WHEN target_weight IS NOT NULL AND target_weight <> 0 AND net_weight IS NOT NULL
+                            THEN ABS((net_weight - target_weight) / target_weight) * 100
+                        ELSE NULL
+                    END AS load_variance_pct
+                FROM silver_tickets
+                WHERE COALESCE(ticket_ts, loaded_ts, check_in_ts) IS NOT NULL
+                    AND {partition_filter("silver_tickets")}
+            ),
+            lane_hours AS (
+                SELECT
+                    service_date,
+                    location_id,
+                    lane_id,
+                    GREATEST(1, DATE_DIFF('hour', MIN(COALESCE(check_in_ts, loaded_ts, ticket_ts)), MAX(COALESCE(ticket_ts, loaded_ts, check_in_ts)))) AS active_hours,
+                    COUNT(*) AS lane_tickets
+                FROM base
+                GROUP BY 1,2,3
+            )
             SELECT
-                DATE(COALESCE(ticket_ts, loaded_ts, check_in_ts)) AS service_date,
-                COALESCE(location_id, 'Unknown') AS location_id,
-                lane_id,
-                ticket_id,
-                check_in_ts,
-                loaded_ts,
-                ticket_ts,
-                target_weight,
-                net_weight,
-                CASE
-                    WHEN check_in_ts IS NOT NULL AND loaded_ts IS NOT NULL
-                        THEN DATE_DIFF('minute', check_in_ts, loaded_ts)
-                    ELSE NULL
-                END AS time_in_yard_minutes,
-                CASE
-                    WHEN loaded_ts IS NOT NULL AND ticket_ts IS NOT NULL
-                        THEN DATE_DIFF('minute', loaded_ts, ticket_ts)
-                    ELSE NULL
-                END AS time_to_ticket_minutes,
-                CASE
-                    WHEN target_weight IS NOT NULL AND target_weight <> 0 AND net_weight IS NOT NULL
-                        THEN ABS((net_weight - target_weight) / target_weight) * 100
-                    ELSE NULL
-                END AS load_variance_pct
-            FROM silver_tickets
-            WHERE COALESCE(ticket_ts, loaded_ts, check_in_ts) IS NOT NULL
-        ),
-        lane_hours AS (
+                b.service_date,
+                b.location_id,
+                COUNT(DISTINCT b.ticket_id) AS tickets_count,
+                AVG(b.time_in_yard_minutes) AS avg_time_in_yard_minutes,
+                AVG(b.time_to_ticket_minutes) AS avg_time_to_ticket_minutes,
+                AVG(b.load_variance_pct) AS avg_load_variance_pct,
+                SUM(CASE WHEN b.load_variance_pct > 5 THEN 1 ELSE 0 END)::DOUBLE / NULLIF(COUNT(*), 0) AS high_variance_rate,
+                COUNT(DISTINCT b.lane_id) AS active_lanes,
+                SUM(l.active_hours) AS total_lane_hours,
+                COUNT(DISTINCT b.ticket_id)::DOUBLE / NULLIF(SUM(l.active_hours), 0) AS tickets_per_lane_hour,
+                {quantile_sketch("b.time_in_yard_minutes")} AS yard_minutes_sketch,
+                {quantile_sketch("b.time_to_ticket_minutes")} AS ticket_minutes_sketch
+            FROM base b
+            LEFT JOIN lane_hours l
+                ON b.service_date = l.service_date
+                AND b.location_id = l.location_id
+                AND b.lane_id = l.lane_id
+            GROUP BY 1,2
+            ORDER BY 1,2
+            """,
+        "gold_dispatch_daily": f"""
+            WITH dispatch_base AS (
+                SELECT
+                    DATE(COALESCE(t.pod_ts, t.dispatch_assigned_ts, t.ticket_ts)) AS service_date,
+                    COALESCE(t.location_id, 'Unknown') AS location_id,
+                    t.ticket_id,
+                    t.truck_id,
+                    t.hauler_id,
+                    t.dispatch_assigned_ts,
+                    t.pod_ts,
+                    CASE
+                        WHEN t.dispatch_assigned_ts IS NOT NULL AND t.pod_ts IS NOT NULL
+                            THEN DATE_DIFF('minute', t.dispatch_assigned_ts, t.pod_ts)
+                        ELSE NULL
+                    END AS delivery_minutes,
+                    CASE
+                        WHEN t.dispatch_assigned_ts IS NOT NULL AND t.pod_ts IS NOT NULL
+                             AND DATE_DIFF('minute', t.dispatch_assigned_ts, t.pod_ts) <= {late_sla_minutes}
+                            THEN 1
+                        ELSE 0
+                    END AS on_time_flag
+                FROM silver_tickets t
+                WHERE COALESCE(t.pod_ts, t.dispatch_assigned_ts, t.ticket_ts) IS NOT NULL
+                    AND {partition_filter("silver_tickets")}
+            )
             SELECT
                 service_date,
                 location_id,
-                lane_id,
-                GREATEST(1, DATE_DIFF('hour', MIN(COALESCE(check_in_ts, loaded_ts, ticket_ts)), MAX(COALESCE(ticket_ts, loaded_ts, check_in_ts)))) AS active_hours,
-                COUNT(*) AS lane_tickets
-            FROM base
-            GROUP BY 1,2,3
-        )
-        SELECT
-            b.service_date,
-            b.location_id,
-            COUNT(DISTINCT b.ticket_id) AS tickets_count,
-            AVG(b.time_in_yard_minutes) AS avg_time_in_yard_minutes,
-            AVG(b.time_to_ticket_minutes) AS avg_time_to_ticket_minutes,
-            AVG(b.load_variance_pct) AS avg_load_variance_pct,
-            SUM(CASE WHEN b.load_variance_pct > 5 THEN 1 ELSE 0 END)::DOUBLE / NULLIF(COUNT(*), 0) AS high_variance_rate,
-            COUNT(DISTINCT b.lane_id) AS active_lanes,
-            SUM(l.active_hours) AS total_lane_hours,
-            COUNT(DISTINCT b.ticket_id)::DOUBLE / NULLIF(SUM(l.active_hours), 0) AS tickets_per_lane_hour
-        FROM base b
-        LEFT JOIN lane_hours l
-            ON b.service_date = l.service_date
-            AND b.location_id = l.location_id
-            AND b.lane_id = l.lane_id
-        GROUP BY 1,2
-        ORDER BY 1,2
-        """
-    )
+                COUNT(DISTINCT ticket_id) AS deliveries,
+                AVG(delivery_minutes) AS avg_delivery_minutes,
+                SUM(on_time_flag)::DOUBLE / NULLIF(COUNT(*), 0) AS on_time_delivery_rate,
+                COUNT(DISTINCT truck_id) AS active_trucks,
+                COUNT(DISTINCT hauler_id) AS active_haulers,
+                {quantile_sketch("delivery_minutes")} AS delivery_minutes_sketch,
+                {distinct_sketch("truck_id")} AS trucks_sketch,
+                {distinct_sketch("hauler_id")} AS haulers_sketch
+            FROM dispatch_base
+            GROUP BY 1,2
+            ORDER BY 1,2
+            """,
+        "gold_billing_ar_daily": """
+            WITH aged AS (
+                SELECT
+                    CURRENT_DATE AS as_of_date,
+                    customer_id,
+                    open_balance,
+                    CASE
+                        WHEN due_date IS NULL THEN 'unknown'
+                        WHEN due_date >= CURRENT_DATE THEN 'current'
+                        WHEN due_date < CURRENT_DATE AND due_date >= CURRENT_DATE - INTERVAL 30 DAY THEN '1_30'
+                        WHEN due_date < CURRENT_DATE - INTERVAL 30 DAY AND due_date >= CURRENT_DATE - INTERVAL 60 DAY THEN '31_60'
+                        WHEN due_date < CURRENT_DATE - INTERVAL 60 DAY AND due_date >= CURRENT_DATE - INTERVAL 90 DAY THEN '61_90'
+                        ELSE '90_plus'
+                    END AS aging_bucket
+                FROM silver_invoices
+                WHERE COALESCE(open_balance, 0) > 0
+            )
+            SELECT
+                as_of_date,
+                SUM(open_balance) AS total_open_ar,
+                SUM(CASE WHEN aging_bucket = 'current' THEN open_balance ELSE 0 END) AS ar_current,
+                SUM(CASE WHEN aging_bucket = '1_30' THEN open_balance ELSE 0 END) AS ar_1_30,
+                SUM(CASE WHEN aging_bucket = '31_60' THEN open_balance ELSE 0 END) AS ar_31_60,
+                SUM(CASE WHEN aging_bucket = '61_90' THEN open_balance ELSE 0 END) AS ar_61_90,
+                SUM(CASE WHEN aging_bucket = '90_plus' THEN open_balance ELSE 0 END) AS ar_90_plus,
+                COUNT(DISTINCT customer_id) AS customers_with_open_ar
+            FROM aged
+            GROUP BY 1
+            """,
+        "gold_hauler_productivity_daily": f"""
+            WITH base AS (
+                SELECT
+                    DATE(COALESCE(t.pod_ts, t.ticket_ts, t.loaded_ts)) AS service_date,
+                    t.hauler_id,
+                    t.truck_id,
+                    t.ticket_id,
+                    t.dispatch_assigned_ts,
+                    t.pod_ts,
+                    CASE
+                        WHEN t.dispatch_assigned_ts IS NOT NULL AND t.pod_ts IS NOT NULL
+                            THEN DATE_DIFF('minute', t.dispatch_assigned_ts, t.pod_ts)
+                        ELSE NULL
+                    END AS active_delivery_minutes
+                FROM silver_tickets t
+                WHERE COALESCE(t.pod_ts, t.ticket_ts, t.loaded_ts) IS NOT NULL
+                    AND {partition_filter("silver_tickets")}
+            ),
+            pay AS (
+                SELECT
+                    DATE(pay_date) AS service_date,
+                    hauler_id,
+                    SUM(expected_amount) AS expected_pay,
+                    SUM(paid_amount) AS paid_pay
+                FROM silver_hauler_pay
+                WHERE {partition_filter("silver_hauler_pay")}
+                GROUP BY 1,2
+            )
+            SELECT
+                b.service_date,
+                b.hauler_id,
+                COUNT(DISTINCT b.ticket_id) AS loads_completed,
+                COUNT(DISTINCT b.truck_id) AS trucks_used,
+                SUM(b.active_delivery_minutes) AS active_delivery_minutes,
+                p.expected_pay,
+                p.paid_pay,
+                CASE
+                    WHEN p.expected_pay IS NULL OR p.expected_pay = 0 THEN NULL
+                    ELSE ABS((COALESCE(p.paid_pay, 0) - p.expected_pay) / p.expected_pay) * 100
+                END AS pay_variance_pct,
+                {distinct_sketch("b.truck_id")} AS trucks_sketch
+            FROM base b
+            LEFT JOIN pay p
+                ON b.service_date = p.service_date
+                AND b.hauler_id = p.hauler_id
+            GROUP BY 1,2,6,7
+            ORDER BY 1,2
+            """,
+    }
 
+
+def _partition_dates(conn: duckdb.DuckDBPyConnection, table: str, since: datetime | None) -> int:
+    sources = " UNION ".join(
+        f"SELECT {expression} AS service_date FROM {source}_changes WHERE changed_at > ?"
+        for source, expression in GOLD_PARTITIONS[table]
+    )
     conn.execute(
         f"""
-        CREATE OR REPLACE TABLE gold_dispatch_daily AS
-        WITH dispatch_base AS (
-            SELECT
-                DATE(COALESCE(t.pod_ts, t.dispatch_assigned_ts, t.ticket_ts)) AS service_date,
-                COALESCE(t.location_id, 'Unknown') AS location_id,
-                t.ticket_id,
-                t.truck_id,
-                t.hauler_id,
-                t.dispatch_assigned_ts,
-                t.pod_ts,
-                CASE
-                    WHEN t.dispatch_assigned_ts IS NOT NULL AND t.pod_ts IS NOT NULL
-                        THEN DATE_DIFF('minute', t.dispatch_assigned_ts, t.pod_ts)
-                    ELSE NULL
-                END AS delivery_minutes,
-                CASE
-                    WHEN t.dispatch_assigned_ts IS NOT NULL AND t.pod_ts IS NOT NULL
-                         AND DATE_DIFF('minute', t.dispatch_assigned_ts, t.pod_ts) <= {late_sla_minutes}
-                        THEN 1
-                    ELSE 0
-                END AS on_time_flag
-            FROM silver_tickets t
-            WHERE COALESCE(t.pod_ts, t.dispatch_assigned_ts, t.ticket_ts) IS NOT NULL
-        )
-        SELECT
-            service_date,
-            location_id,
-            COUNT(DISTINCT ticket_id) AS deliveries,
-            AVG(delivery_minutes) AS avg_delivery_minutes,
-            SUM(on_time_flag)::DOUBLE / NULLIF(COUNT(*), 0) AS on_time_delivery_rate,
-            COUNT(DISTINCT truck_id) AS active_trucks,
-            COUNT(DISTINCT hauler_id) AS active_haulers
-        FROM dispatch_base
-        GROUP BY 1,2
-        ORDER BY 1,2
-        """
+        CREATE OR REPLACE TEMP TABLE gold_partitions AS
+        SELECT DISTINCT service_date FROM ({sources}) WHERE service_date IS NOT NULL
+        """,
+        [since] * len(GOLD_PARTITIONS[table]),
     )
+    row = conn.execute("SELECT COUNT(*) FROM gold_partitions").fetchone()
+    return int(row[0]) if row else 0
+
+
+def _count_rows(conn: duckdb.DuckDBPyConnection, query: str) -> int:
+    row = conn.execute(f"SELECT COUNT(*) FROM ({query})").fetchone()
+    return int(row[0]) if row else 0
 
+
+def _partition_predicates(table: str) -> dict[str, str]:
+    if table in PARTITION_SCOPES:
+        return PARTITION_SCOPES[table]
+    return {
+        source: f"{expression} IN (SELECT service_date FROM gold_partitions)"
+        for source, expression in GOLD_PARTITIONS[table]
+    }
+
+
+def _log_partitions(
+    conn: duckdb.DuckDBPyConnection, table: str, source: str, run_at: datetime
+) -> None:
     conn.execute(
-        """
-        CREATE OR REPLACE TABLE gold_billing_ar_daily AS
-        WITH aged AS (
-            SELECT
-                CURRENT_DATE AS as_of_date,
-                customer_id,
-                open_balance,
-                CASE
-                    WHEN due_date IS NULL THEN 'unknown'
-                    WHEN due_date >= CURRENT_DATE THEN 'current'
-                    WHEN due_date < CURRENT_DATE AND due_date >= CURRENT_DATE - INTERVAL 30 DAY THEN '1_30'
-                    WHEN due_date < CURRENT_DATE - INTERVAL 30 DAY AND due_date >= CURRENT_DATE - INTERVAL 60 DAY THEN '31_60'
-                    WHEN due_date < CURRENT_DATE - INTERVAL 60 DAY AND due_date >= CURRENT_DATE - INTERVAL 90 DAY THEN '61_90'
-                    ELSE '90_plus'
-                END AS aging_bucket
-            FROM silver_invoices
-            WHERE COALESCE(open_balance, 0) > 0
-        )
-        SELECT
-            as_of_date,
-            SUM(open_balance) AS total_open_ar,
-            SUM(CASE WHEN aging_bucket = 'current' THEN open_balance ELSE 0 END) AS ar_current,
-            SUM(CASE WHEN aging_bucket = '1_30' THEN open_balance ELSE 0 END) AS ar_1_30,
-            SUM(CASE WHEN aging_bucket = '31_60' THEN open_balance ELSE 0 END) AS ar_31_60,
-            SUM(CASE WHEN aging_bucket = '61_90' THEN open_balance ELSE 0 END) AS ar_61_90,
-            SUM(CASE WHEN aging_bucket = '90_plus' THEN open_balance ELSE 0 END) AS ar_90_plus,
-            COUNT(DISTINCT customer_id) AS customers_with_open_ar
-        FROM aged
-        GROUP BY 1
-        """
+        f"""
+        INSERT INTO gold_partition_log(table_name, partition_date, refreshed_at)
+        SELECT DISTINCT ?, {PARTITION_COLUMNS[table]}, ?
+        FROM {source}
+        WHERE {PARTITION_COLUMNS[table]} IS NOT NULL
+        """,
+        [table, run_at],
     )
 
-    conn.execute(
-        """
-        CREATE OR REPLACE TABLE gold_hauler_productivity_daily AS
-        WITH base AS (
-            SELECT
-                DATE(COALESCE(t.pod_ts, t.ticket_ts, t.loaded_ts)) AS service_date,
-                t.hauler_id,
-                t.truck_id,
-                t.ticket_id,
-                t.dispatch_assigned_ts,
-                t.pod_ts,
-                CASE
-                    WHEN t.dispatch_assigned_ts IS NOT NULL AND t.pod_ts IS NOT NULL
-                        THEN DATE_DIFF('minute', t.dispatch_assigned_ts, t.pod_ts)
-                    ELSE NULL
-                END AS active_delivery_minutes
-            FROM silver_tickets t
-            WHERE COALESCE(t.pod_ts, t.ticket_ts, t.loaded_ts) IS NOT NULL
-        ),
-        pay AS (
-            SELECT
-                DATE(pay_date) AS service_date,
-                hauler_id,
-                SUM(expected_amount) AS expected_pay,
-                SUM(paid_amount) AS paid_pay
-            FROM silver_hauler_pay
-            GROUP BY 1,2
+
+def _sources_rebuilt_since(
+    conn: duckdb.DuckDBPyConnection, table: str, since: datetime | None
+) -> bool:
+    sources = GOLD_CHANGE_SOURCES[table]
+    row = conn.execute(
+        f"""
+        SELECT COUNT(*) FILTER (WHERE rebuilt_at >= ?), COUNT(*)
+        FROM model_state
+        WHERE model IN ({", ".join("?" for _ in sources)})
+        """,
+        [since, *sources],
+    ).fetchone()
+    return since is None or not row or row[0] > 0 or row[1] < len(sources)
+
+
+def _gold_incremental(
+    conn: duckdb.DuckDBPyConnection,
+    table: str,
+    state: tuple[Any, ...] | None,
+    definition: str,
+) -> bool:
+    if table not in GOLD_CHANGE_SOURCES or state is None or state[1] != definition:
+        return False
+    return _table_exists(conn, table) and not _sources_rebuilt_since(conn, table, state[0])
+
+
+def _changed_rows(conn: duckdb.DuckDBPyConnection, source: str, since: datetime | None) -> int:
+    row = conn.execute(
+        f"SELECT COUNT(*) FROM {source}_changes WHERE changed_at > ?", [since]
+    ).fetchone()
+    return int(row[0]) if row else 0
+
+
+def _prune_change_logs(conn: duckdb.DuckDBPyConnection) -> None:
+    for source in sorted(CHANGE_TRACKED):
+        if not _table_exists(conn, f"{source}_changes"):
+            continue
+        consumers = [table for table, sources in GOLD_CHANGE_SOURCES.items() if source in sources]
+        conn.execute(
+            f"""
+            DELETE FROM {source}_changes
+            WHERE changed_at <= (
+                SELECT MIN(COALESCE(last_pulled_at, '-infinity'::TIMESTAMP))
+                FROM model_state
+                WHERE model IN ({", ".join("?" for _ in consumers)})
+            )
+            """,
+            consumers,
         )
+
+
+_AR_SNAPSHOT_SQL = """
+    WITH versions AS (
+        SELECT invoice_id, customer_id, invoice_date, due_date, open_balance, updated_at
+        FROM staged_invoices
+        WHERE invoice_id IS NOT NULL
+        QUALIFY row_number() OVER (
+            PARTITION BY invoice_id, updated_at ORDER BY pulled_at DESC
+        ) = 1
+    ),
+    intervals AS (
         SELECT
-            b.service_date,
-            b.hauler_id,
-            COUNT(DISTINCT b.ticket_id) AS loads_completed,
-            COUNT(DISTINCT b.truck_id) AS trucks_used,
-            SUM(b.active_delivery_minutes) AS active_delivery_minutes,
-            p.expected_pay,
-            p.paid_pay,
+            customer_id,
+            due_date,
+            open_balance,
             CASE
-                WHEN p.expected_pay IS NULL OR p.expected_pay = 0 THEN NULL
-                ELSE ABS((COALESCE(p.paid_pay, 0) - p.expected_pay) / p.expected_pay) * 100
-            END AS pay_variance_pct
-        FROM base b
-        LEFT JOIN pay p
-            ON b.service_date = p.service_date
-            AND b.hauler_id = p.hauler_id
-        GROUP BY 1,2,6,7
-        ORDER BY 1,2
-        """
+                WHEN row_number() OVER w = 1
+                    THEN LEAST(invoice_date, DATE(updated_at))
+                ELSE DATE(updated_at)
+            END AS valid_from,
+            COALESCE(DATE(lead(updated_at) OVER w), DATE '9999-12-31') AS valid_to
+        FROM versions
+        WINDOW w AS (PARTITION BY invoice_id ORDER BY updated_at NULLS FIRST)
+    ),
+    days AS (
+        SELECT CAST(day AS DATE) AS as_of_date
+        FROM range(CAST(? AS TIMESTAMP), CAST(? AS TIMESTAMP) + INTERVAL 1 DAY, INTERVAL 1 DAY)
+            AS t(day)
+    ),
+    aged AS (
+        SELECT
+            d.as_of_date,
+            i.customer_id,
+            i.open_balance,
+            CASE
+                WHEN i.due_date IS NULL THEN 'unknown'
+                WHEN i.due_date >= d.as_of_date THEN 'current'
+                WHEN i.due_date >= d.as_of_date - INTERVAL 30 DAY THEN '1_30'
+                WHEN i.due_date >= d.as_of_date - INTERVAL 60 DAY THEN '31_60'
+                WHEN i.due_date >= d.as_of_date - INTERVAL 90 DAY THEN '61_90'
+                ELSE '90_plus'
+            END AS aging_bucket
+        FROM days d
+        JOIN intervals i
+            ON i.valid_from <= d.as_of_date
+            AND d.as_of_date < i.valid_to
+        WHERE COALESCE(i.open_balance, 0) > 0
+    )
+    SELECT
+        as_of_date,
+        SUM(open_balance) AS total_open_ar,
+        SUM(CASE WHEN aging_bucket = 'current' THEN open_balance ELSE 0 END) AS ar_current,
+        SUM(CASE WHEN aging_bucket = '1_30' THEN open_balance ELSE 0 END) AS ar_1_30,
+        SUM(CASE WHEN aging_bucket = '31_60' THEN open_balance ELSE 0 END) AS ar_31_60,
+        SUM(CASE WHEN aging_bucket = '61_90' THEN open_balance ELSE 0 END) AS ar_61_90,
+        SUM(CASE WHEN aging_bucket = '90_plus' THEN open_balance ELSE 0 END) AS ar_90_plus,
+        COUNT(DISTINCT customer_id) AS customers_with_open_ar
+    FROM aged
+    GROUP BY 1
+    ORDER BY 1
+"""
+
+
+def run_ar_snapshots(
+    conn: duckdb.DuckDBPyConnection, full_refresh: bool = False, as_of: date | None = None
+) -> dict[str, Any]:
+    run_at = datetime.now(tz=UTC)
+    current = conn.execute("SELECT CURRENT_DATE").fetchone()
+    today = as_of or (current[0] if current else run_at.date())
+    definition = _hash(_AR_SNAPSHOT_SQL)
+    state = conn.execute(
+        "SELECT last_pulled_at, definition_hash FROM model_state WHERE model = ?",
+        [AR_SNAPSHOT_TABLE],
+    ).fetchone()
+    incremental = not full_refresh and _gold_incremental(conn, AR_SNAPSHOT_TABLE, state, definition)
+    with transaction(conn):
+        if incremental:
+            last = conn.execute(f"SELECT MAX(as_of_date) FROM {AR_SNAPSHOT_TABLE}").fetchone()
+            start = last[0] if last and last[0] is not None else today
+            changed = _changed_rows(conn, "silver_invoices", state[0] if state else None)
+            if start == today and not changed:
+                start = today + timedelta(days=1)
+            if start <= today:
+                conn.execute(f"DELETE FROM {AR_SNAPSHOT_TABLE} WHERE as_of_date >= ?", [start])
+                conn.execute(f"INSERT INTO {AR_SNAPSHOT_TABLE} {_AR_SNAPSHOT_SQL}", [start, today])
+        else:
+            first = conn.execute(
+                "SELECT MIN(LEAST(invoice_date, DATE(updated_at))) FROM staged_invoices"
+            ).fetchone()
+            start = min(first[0], today) if first and first[0] is not None else today
+            if _table_exists(conn, AR_SNAPSHOT_TABLE):
+                conn.execute(f"DELETE FROM {AR_SNAPSHOT_TABLE} WHERE as_of_date >= ?", [today])
+                conn.execute(
+                    f"""
+                    INSERT INTO {AR_SNAPSHOT_TABLE}
+                    SELECT * FROM ({_AR_SNAPSHOT_SQL})
+                    WHERE as_of_date NOT IN (SELECT as_of_date FROM {AR_SNAPSHOT_TABLE})
+                    """,
+                    [start, today],
+                )
+            else:
+                conn.execute(f"CREATE TABLE {AR_SNAPSHOT_TABLE} AS {_AR_SNAPSHOT_SQL}", [start, today])
+        _upsert_model_state(
+            conn, AR_SNAPSHOT_TABLE, run_at, definition, None if incremental else run_at
+        )
+    return {
+        "mode": "append" if incremental else "backfill",
+        "snapshot_days": max(0, (today - start).days + 1),
+    }
+
+
+def run_gold_model(
+    conn: duckdb.DuckDBPyConnection, table: str, sql: str, full_refresh: bool = False
+) -> dict[str, Any]:
+    run_at = datetime.now(tz=UTC)
+    definition = _hash(sql)
+    state = conn.execute(
+        "SELECT last_pulled_at, definition_hash FROM model_state WHERE model = ?", [table]
+    ).fetchone()
+    incremental = not full_refresh and _gold_incremental(conn, table, state, definition)
+    key, partitions = PARTITION_KEYS.get(table, DAILY_PARTITION_KEY)
+    with transaction(conn):
+        if incremental:
+            recomputed = 0
+            if _partition_dates(conn, table, state[0] if state else None):
+                recomputed = _count_rows(conn, partitions)
+                scoped = f"({key}) IN ({partitions})"
+                conn.execute(f"DELETE FROM {table} WHERE {scoped}")
+                scoped_sql = scope_partitions(sql, _partition_predicates(table))
+                conn.execute(f"INSERT INTO {table} SELECT * FROM ({scoped_sql}) WHERE {scoped}")
+                if table in PARTITION_COLUMNS:
+                    _log_partitions(conn, table, "gold_partitions", run_at)
+            conn.execute("DROP TABLE gold_partitions")
+            skipped = max(0, _count_rows(conn, f"SELECT DISTINCT {key} FROM {table}") - recomputed)
+        else:
+            conn.execute(f"CREATE OR REPLACE TABLE {table} AS {sql}")
+            if table in PARTITION_COLUMNS:
+                _log_partitions(conn, table, table, run_at)
+            skipped = 0
+            if table in GOLD_PARTITIONS:
+                recomputed = _count_rows(conn, f"SELECT DISTINCT {key} FROM {table}")
+            else:
+                recomputed = 1
+        _upsert_model_state(conn, table, run_at, definition, None if incremental else run_at)
+    return {
+        "mode": "partitions" if incremental else "full",
+        "partitions_recomputed": recomputed,
+        "partitions_skipped": skipped,
+    }
+
+
+def model_registry(
+    full_refresh: bool = False,
+    late_sla_minutes: int = 90,
+    models: tuple[SilverModel, ...] = SILVER_MODELS,
+    trips: TripConfig | None = None,
+) -> dict[str, ModelNode]:
+    nodes = [
+        ModelNode(
+            model.table,
+            "silver",
+            (),
+            partial(run_silver_model, model=model, full_refresh=full_refresh),
+        )
+        for model in models
+    ]
+    nodes += [
+        ModelNode(
+            table,
+            "gold",
+            GOLD_DEPENDENCIES[table],
+            partial(run_gold_model, table=table, sql=sql, full_refresh=full_refresh),
+        )
+        for table, sql in {
+            **_gold_sql(late_sla_minutes),
+            **rollup_sql(late_sla_minutes),
+            **trips_sql(trips),
+        }.items()
+    ]
+    nodes.append(
+        ModelNode(
+            AR_SNAPSHOT_TABLE,
+            "gold",
+            GOLD_DEPENDENCIES[AR_SNAPSHOT_TABLE],
+            partial(run_ar_snapshots, full_refresh=full_refresh),
+        )
     )
+    return {node.name: node for node in nodes}
+
+
+def run_models(
+    conn: duckdb.DuckDBPyConnection,
+    select: list[str] | None = None,
+    full_refresh: bool = False,
+    late_sla_minutes: int = 90,
+    threads: int = 4,
+    models: tuple[SilverModel, ...] = SILVER_MODELS,
+    trips: TripConfig | None = None,
+) -> list[ModelRun]:
+    registry = model_registry(full_refresh, late_sla_minutes, models, trips)
+    selected = select_models(registry, select)
+    ensure_staged_tables(conn, models=models)
+    runs = execute_models(conn, registry, selected, threads)
+    if any(run.layer == "gold" and run.status == "succeeded" for run in runs):
+        _prune_change_logs(conn)
+    record_model_runs(conn, runs)
+    failed = [run for run in runs if run.status != "succeeded"]
+    if failed:
+        details = "; ".join(f"{run.name}: {run.error}" for run in failed)
+        raise ModelRunError(f"{len(failed)} model(s) did not complete ({details})")
+    return runs
+
+
+def run_silver_models(
+    conn: duckdb.DuckDBPyConnection, full_refresh: bool = False
+) -> dict[str, dict[str, Any]]:
+    runs = run_models(conn, ["silver"], full_refresh=full_refresh)
+    return {run.name: run.details for run in runs}
+
+
+def run_gold_models(
+    conn: duckdb.DuckDBPyConnection, late_sla_minutes: int = 90, full_refresh: bool = False
+) -> dict[str, dict[str, Any]]:
+    runs = run_models(conn, ["gold"], full_refresh=full_refresh, late_sla_minutes=late_sla_minutes)
+    return {run.name: run.details for run in runs}
@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+
+
+def partition_filter(source: str) -> str:
+    return f"/* partition_filter:{source} */ TRUE"
+
+
+def scope_partitions(sql: str, predicates: Mapping[str, str]) -> str:
+    for source, predicate in predicates.items():
+        sql = sql.replace(partition_filter(source), predicate)
+    return sql
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import threading
+import time
+import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import UTC, datetime
+
+import duckdb
+
+from ops_intelligence.config import ResourceProfile
+from ops_intelligence.warehouse.db import apply_resource_profile, transaction
+
+
+@dataclass
+class StageUsage:
+    stage: str
+    started_at: datetime
+    threads: int | None = None
+    memory_limit: str | None = None
+    temp_directory: str | None = None
+    seconds: float = 0.0
+    peak_memory_bytes: int = 0
+    peak_spill_bytes: int = 0
+
+    def observe(self, conn: duckdb.DuckDBPyConnection) -> None:
+        rows = conn.execute(
+            "SELECT SUM(memory_usage_bytes), SUM(temporary_storage_bytes) FROM duckdb_memory()"
+        ).fetchall()
+        for row in rows:
+            self.peak_memory_bytes = max(self.peak_memory_bytes, int(row[0] or 0))
+            self.peak_spill_bytes = max(self.peak_spill_bytes, int(row[1] or 0))
+
+
+@contextmanager
+def governed_stage(
+    conn: duckdb.DuckDBPyConnection,
+    stage: str,
+    profile: ResourceProfile,
+    sample_seconds: float = 0.1,
+) -> Iterator[StageUsage]:
+    apply_resource_profile(conn, profile)
+    settings = conn.execute(
+        """
+        SELECT
+            current_setting('threads'),
+            current_setting('memory_limit'),
+            current_setting('temp_directory')
+        """
+    ).fetchone()
+    usage = StageUsage(stage, datetime.now(tz=UTC))
+    if settings:
+        usage.threads, usage.memory_limit = int(settings[0]), str(settings[1])
+        usage.temp_directory = str(settings[2]) if settings[2] else None
+    cursor = conn.cursor()
+    stop = threading.Event()
+
+    def _sample() -> None:
+        while not stop.wait(sample_seconds):
+            usage.observe(cursor)
+
+    sampler = threading.Thread(target=_sample, name=f"{stage}-resources", daemon=True)
+    began = time.perf_counter()
+    sampler.start()
+    try:
+        yield usage
+    finally:
+        stop.set()
+        sampler.join()
+        usage.observe(cursor)
+        cursor.close()
+        usage.seconds = round(time.perf_counter() - began, 3)
+
+
+def record_stage_runs(conn: duckdb.DuckDBPyConnection, usages: list[StageUsage]) -> str:
+    run_id = uuid.uuid4().hex
+    with transaction(conn):
+        conn.executemany(
+            """
+            INSERT INTO stage_runs(
+                run_id, stage, started_at, seconds, threads, memory_limit,
+                peak_memory_bytes, peak_spill_bytes, temp_directory
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            [
+                [
+                    run_id,
+                    usage.stage,
+                    usage.started_at,
+                    usage.seconds,
+                    usage.threads,
+                    usage.memory_limit,
+                    usage.peak_memory_bytes,
+                    usage.peak_spill_bytes,
+                    usage.temp_directory,
+                ]
+                for usage in usages
+            ],
+        )
+    return run_id
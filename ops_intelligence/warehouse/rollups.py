@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+from typing import Any
+
+from ops_intelligence.warehouse.partitions import partition_filter
+
+ROLLUP_GRAINS = ("day", "week", "month")
+LANE_HOURLY_TABLE = "gold_lane_hourly"
+
+_PLANT_RATIOS = {
+    "avg_time_in_yard_minutes": "yard_minutes_sum / NULLIF(yard_minutes_count, 0)",
+    "avg_time_to_ticket_minutes": "ticket_minutes_sum / NULLIF(ticket_minutes_count, 0)",
+    "avg_load_variance_pct": "load_variance_pct_sum / NULLIF(load_variance_pct_count, 0)",
+    "high_variance_rate": "high_variance_count::DOUBLE / NULLIF(ticket_rows, 0)",
+}
+
+ROLLUP_RATIOS: dict[str, dict[str, str]] = {
+    LANE_HOURLY_TABLE: _PLANT_RATIOS,
+    "gold_location_rollup": {
+        **_PLANT_RATIOS,
+        "avg_delivery_minutes": "delivery_minutes_sum / NULLIF(delivery_minutes_count, 0)",
+        "on_time_delivery_rate": "on_time_count::DOUBLE / NULLIF(delivery_rows, 0)",
+    },
+    "gold_hauler_rollup": {
+        "pay_variance_pct": (
+            "ABS((COALESCE(paid_pay, 0) - expected_pay) / NULLIF(expected_pay, 0)) * 100"
+        ),
+    },
+}
+
+ROLLUP_DEPENDENCIES: dict[str, tuple[str, ...]] = {
+    LANE_HOURLY_TABLE: ("silver_tickets",),
+    "gold_location_rollup": (LANE_HOURLY_TABLE, "silver_tickets"),
+    "gold_hauler_rollup": ("silver_tickets", "silver_hauler_pay"),
+}
+
+_GRAINS_SQL = ", ".join(f"('{grain}')" for grain in ROLLUP_GRAINS)
+_LANE_DATE = "DATE(COALESCE(ticket_ts, loaded_ts, check_in_ts))"
+_DELIVERY_DATE = "DATE(COALESCE(pod_ts, dispatch_assigned_ts, ticket_ts))"
+_LOAD_DATE = "DATE(COALESCE(pod_ts, ticket_ts, loaded_ts))"
+_PAY_DATE = "DATE(pay_date)"
+
+ROLLUP_PARTITION_KEY = "grain, period_start"
+ROLLUP_PERIODS = f"""
+    SELECT DISTINCT g.grain, DATE_TRUNC(g.grain, service_date)::DATE AS period_start
+    FROM gold_partitions
+    CROSS JOIN (VALUES {_GRAINS_SQL}) AS g(grain)
+"""
+
+
+def period_scope(expression: str) -> str:
+    periods = " OR ".join(
+        f"DATE_TRUNC('{grain}', {expression}) IN "
+        f"(SELECT DATE_TRUNC('{grain}', service_date) FROM gold_partitions)"
+        for grain in ROLLUP_GRAINS
+    )
+    return f"({periods})"
+
+
+ROLLUP_PARTITIONS: dict[str, tuple[tuple[str, str], ...]] = {
+    "gold_location_rollup": (("silver_tickets", _LANE_DATE), ("silver_tickets", _DELIVERY_DATE)),
+    "gold_hauler_rollup": (("silver_tickets", _LOAD_DATE), ("silver_hauler_pay", _PAY_DATE)),
+}
+ROLLUP_SCOPES: dict[str, dict[str, str]] = {
+    "gold_location_rollup": {
+        LANE_HOURLY_TABLE: period_scope("service_date"),
+        "silver_tickets": period_scope(_DELIVERY_DATE),
+    },
+    "gold_hauler_rollup": {
+        "silver_tickets": period_scope(_LOAD_DATE),
+        "silver_hauler_pay": period_scope(_PAY_DATE),
+    },
+}
+
+
+def rollup_sql(late_sla_minutes: int) -> dict[str, str]:
+    return {
+        LANE_HOURLY_TABLE: f"""
+            WITH base AS (
+                SELECT
+                    COALESCE(ticket_ts, loaded_ts, check_in_ts) AS service_ts,
+                    COALESCE(location_id, 'Unknown') AS location_id,
+                    lane_id,
+                    ticket_id,
+                    net_weight,
+                    CASE
+                        WHEN check_in_ts IS NOT NULL AND loaded_ts IS NOT NULL
+                            THEN DATE_DIFF('minute', check_in_ts, loaded_ts)
+                    END AS yard_minutes,
+                    CASE
+                        WHEN loaded_ts IS NOT NULL AND ticket_ts IS NOT NULL
+                            THEN DATE_DIFF('minute', loaded_ts, ticket_ts)
+                    END AS ticket_minutes,
+                    CASE
+                        WHEN target_weight IS NOT NULL AND target_weight <> 0 AND net_weight IS NOT NULL
+                            THEN ABS((net_weight - target_weight) / target_weight) * 100
+                    END AS load_variance_pct
+                FROM silver_tickets
+                WHERE COALESCE(ticket_ts, loaded_ts, check_in_ts) IS NOT NULL
+                    AND {partition_filter("silver_tickets")}
+            )
+            SELECT
+                DATE(service_ts) AS service_date,
+                DATE_TRUNC('hour', service_ts) AS service_hour,
+                location_id,
+                lane_id,
+                COUNT(DISTINCT ticket_id) AS tickets_count,
+                COUNT(*) AS ticket_rows,
+                SUM(net_weight) AS net_weight_sum,
+                SUM(yard_minutes) AS yard_minutes_sum,
+                COUNT(yard_minutes) AS yard_minutes_count,
+                SUM(ticket_minutes) AS ticket_minutes_sum,
+                COUNT(ticket_minutes) AS ticket_minutes_count,
+                SUM(load_variance_pct) AS load_variance_pct_sum,
+                COUNT(load_variance_pct) AS load_variance_pct_count,
+                COUNT(*) FILTER (WHERE load_variance_pct > 5) AS high_variance_count
+            FROM base
+            GROUP BY 1, 2, 3, 4
+            ORDER BY 1, 2, 3, 4
+            """,
+        "gold_location_rollup": f"""
+            WITH plant AS (
+                SELECT
+                    service_date,
+                    location_id,
+                    SUM(tickets_count) AS tickets_count,
+                    SUM(ticket_rows) AS ticket_rows,
+                    SUM(net_weight_sum) AS net_weight_sum,
+                    SUM(yard_minutes_sum) AS yard_minutes_sum,
+                    SUM(yard_minutes_count) AS yard_minutes_count,
+                    SUM(ticket_minutes_sum) AS ticket_minutes_sum,
+                    SUM(ticket_minutes_count) AS ticket_minutes_count,
+                    SUM(load_variance_pct_sum) AS load_variance_pct_sum,
+                    SUM(load_variance_pct_count) AS load_variance_pct_count,
+                    SUM(high_variance_count) AS high_variance_count
+                FROM {LANE_HOURLY_TABLE}
+                WHERE {partition_filter(LANE_HOURLY_TABLE)}
+                GROUP BY 1, 2
+            ),
+            delivery_base AS (
+                SELECT
+                    DATE(COALESCE(pod_ts, dispatch_assigned_ts, ticket_ts)) AS service_date,
+                    COALESCE(location_id, 'Unknown') AS location_id,
+                    ticket_id,
+                    CASE
+                        WHEN dispatch_assigned_ts IS NOT NULL AND pod_ts IS NOT NULL
+                            THEN DATE_DIFF('minute', dispatch_assigned_ts, pod_ts)
+                    END AS delivery_minutes
+                FROM silver_tickets
+                WHERE COALESCE(pod_ts, dispatch_assigned_ts, ticket_ts) IS NOT NULL
+                    AND {partition_filter("silver_tickets")}
+            ),
+            delivery AS (
+                SELECT
+                    service_date,
+                    location_id,
+                    COUNT(DISTINCT ticket_id) AS deliveries,
+                    COUNT(*) AS delivery_rows,
+                    SUM(delivery_minutes) AS delivery_minutes_sum,
+                    COUNT(delivery_minutes) AS delivery_minutes_count,
+                    COUNT(*) FILTER (WHERE delivery_minutes <= {late_sla_minutes}) AS on_time_count
+                FROM delivery_base
+                GROUP BY 1, 2
+            ),
+            daily AS (
+                SELECT *
+                FROM plant
+                FULL OUTER JOIN delivery USING (service_date, location_id)
+            )
+            SELECT
+                g.grain,
+                DATE_TRUNC(g.grain, d.service_date)::DATE AS period_start,
+                d.location_id,
+                COALESCE(SUM(d.tickets_count), 0) AS tickets_count,
+                COALESCE(SUM(d.ticket_rows), 0) AS ticket_rows,
+                SUM(d.net_weight_sum) AS net_weight_sum,
+                SUM(d.yard_minutes_sum) AS yard_minutes_sum,
+                COALESCE(SUM(d.yard_minutes_count), 0) AS yard_minutes_count,
+                SUM(d.ticket_minutes_sum) AS ticket_minutes_sum,
+                COALESCE(SUM(d.ticket_minutes_count), 0) AS ticket_minutes_count,
+                SUM(d.load_variance_pct_sum) AS load_variance_pct_sum,
+                COALESCE(SUM(d.load_variance_pct_count), 0) AS load_variance_pct_count,
+                COALESCE(SUM(d.high_variance_count), 0) AS high_variance_count,
+                COALESCE(SUM(d.deliveries), 0) AS deliveries,
+                COALESCE(SUM(d.delivery_rows), 0) AS delivery_rows,
+                SUM(d.delivery_minutes_sum) AS delivery_minutes_sum,
+                COALESCE(SUM(d.delivery_minutes_count), 0) AS delivery_minutes_count,
+                COALESCE(SUM(d.on_time_count), 0) AS on_time_count
+            FROM daily d
+            CROSS JOIN (VALUES {_GRAINS_SQL}) AS g(grain)
+            GROUP BY 1, 2, 3
+            ORDER BY 1, 2, 3
+            """,
+        "gold_hauler_rollup": f"""
+            WITH loads AS (
+                SELECT
+                    DATE(COALESCE(pod_ts, ticket_ts, loaded_ts)) AS service_date,
+                    hauler_id,
+                    COUNT(DISTINCT ticket_id) AS loads_completed,
+                    SUM(
+                        CASE
+                            WHEN dispatch_assigned_ts IS NOT NULL AND pod_ts IS NOT NULL
+                                THEN DATE_DIFF('minute', dispatch_assigned_ts, pod_ts)
+                        END
+                    ) AS active_delivery_minutes
+                FROM silver_tickets
+                WHERE COALESCE(pod_ts, ticket_ts, loaded_ts) IS NOT NULL
+                    AND {partition_filter("silver_tickets")}
+                GROUP BY 1, 2
+            ),
+            pay AS (
+                SELECT
+                    DATE(pay_date) AS service_date,
+                    hauler_id,
+                    SUM(expected_amount) AS expected_pay,
+                    SUM(paid_amount) AS paid_pay
+                FROM silver_hauler_pay
+                WHERE pay_date IS NOT NULL
+                    AND {partition_filter("silver_hauler_pay")}
+                GROUP BY 1, 2
+            ),
+            daily AS (
+                SELECT *
+                FROM loads
+                FULL OUTER JOIN pay USING (service_date, hauler_id)
+            )
+            SELECT
+                g.grain,
+                DATE_TRUNC(g.grain, d.service_date)::DATE AS period_start,
+                d.hauler_id,
+                COALESCE(SUM(d.loads_completed), 0) AS loads_completed,
+                SUM(d.active_delivery_minutes) AS active_delivery_minutes,
+                SUM(d.expected_pay) AS expected_pay,
+                SUM(d.paid_pay) AS paid_pay
+            FROM daily d
+            CROSS JOIN (VALUES {_GRAINS_SQL}) AS g(grain)
+            GROUP BY 1, 2, 3
+            ORDER BY 1, 2, 3
+            """,
+    }
+
+
+def rollup_query(table: str, grain: str | None = None) -> tuple[str, list[Any]]:
+    if grain is not None and table != LANE_HOURLY_TABLE and grain not in ROLLUP_GRAINS:
+        raise ValueError(f"Unknown grain '{grain}'; expected one of {', '.join(ROLLUP_GRAINS)}")
+    ratios = "".join(f", {expression} AS {name}" for name, expression in ROLLUP_RATIOS[table].items())
+    order = "service_hour" if table == LANE_HOURLY_TABLE else "period_start"
+    if table == LANE_HOURLY_TABLE or grain is None:
+        return f"SELECT *{ratios} FROM {table} ORDER BY {order}", []
+    return f"SELECT *{ratios} FROM {table} WHERE grain = ? ORDER BY {order}", [grain]
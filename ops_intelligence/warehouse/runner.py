@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import fnmatch
+import json
+import time
+import uuid
+from collections.abc import Callable, Iterable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any
+
+import duckdb
+
+from ops_intelligence.warehouse.db import transaction
+
+
+class ModelRunError(RuntimeError):
+    pass
+
+
+@dataclass(frozen=True)
+class ModelNode:
+    name: str
+    layer: str
+    depends_on: tuple[str, ...]
+    run: Callable[[duckdb.DuckDBPyConnection], dict[str, Any]]
+
+
+@dataclass
+class ModelRun:
+    name: str
+    layer: str
+    status: str
+    started_at: datetime | None = None
+    seconds: float = 0.0
+    rows: int | None = None
+    bytes: int | None = None
+    details: dict[str, Any] = field(default_factory=dict)
+    error: str | None = None
+
+
+def _descendants(nodes: dict[str, ModelNode], name: str) -> set[str]:
+    found: set[str] = set()
+    frontier = [name]
+    while frontier:
+        current = frontier.pop()
+        for node in nodes.values():
+            if current in node.depends_on and node.name not in found:
+                found.add(node.name)
+                frontier.append(node.name)
+    return found
+
+
+def _ancestors(nodes: dict[str, ModelNode], name: str) -> set[str]:
+    found: set[str] = set()
+    frontier = [name]
+    while frontier:
+        for parent in nodes[frontier.pop()].depends_on:
+            if parent in nodes and parent not in found:
+                found.add(parent)
+                frontier.append(parent)
+    return found
+
+
+def select_models(nodes: dict[str, ModelNode], selectors: Iterable[str] | None = None) -> list[str]:
+    if not selectors:
+        return list(nodes)
+    selected: set[str] = set()
+    for selector in selectors:
+        pattern = selector.strip().strip("+")
+        matches = [
+            name
+            for name, node in nodes.items()
+            if fnmatch.fnmatchcase(name, pattern) or node.layer == pattern
+        ]
+        if not matches:
+            raise ValueError(f"Selector '{selector}' matches no model")
+        for name in matches:
+            selected.add(name)
+            if selector.strip().startswith("+"):
+                selected |= _ancestors(nodes, name)
+            if selector.strip().endswith("+"):
+                selected |= _descendants(nodes, name)
+    return [name for name in nodes if name in selected]
+
+
+def table_bytes(conn: duckdb.DuckDBPyConnection, table: str) -> int:
+    row = conn.execute(
+        f"""
+        WITH blocks AS (
+            SELECT block_id FROM pragma_storage_info('{table}') WHERE persistent AND block_id >= 0
+            UNION
+            SELECT unnest(additional_block_ids) FROM pragma_storage_info('{table}')
+        )
+        SELECT COUNT(*) * (
+            SELECT block_size FROM pragma_database_size() WHERE database_name = current_database()
+        )
+        FROM blocks
+        """
+    ).fetchone()
+    return int(row[0]) if row and row[0] is not None else 0
+
+
+def _run_node(conn: duckdb.DuckDBPyConnection, node: ModelNode) -> ModelRun:
+    result = ModelRun(node.name, node.layer, "succeeded", started_at=datetime.now(tz=UTC))
+    cursor = conn.cursor()
+    began = time.perf_counter()
+    try:
+        result.details = node.run(cursor)
+        row = cursor.execute(f"SELECT COUNT(*) FROM {node.name}").fetchone()
+        result.rows = int(row[0]) if row else 0
+    except Exception as exc:
+        result.status = "failed"
+        result.error = f"{type(exc).__name__}: {exc}"
+    finally:
+        cursor.close()
+        result.seconds = round(time.perf_counter() - began, 3)
+    return result
+
+
+def execute_models(
+    conn: duckdb.DuckDBPyConnection,
+    nodes: dict[str, ModelNode],
+    selected: list[str],
+    threads: int = 4,
+) -> list[ModelRun]:
+    pending = {name: nodes[name] for name in selected}
+    finished: dict[str, ModelRun] = {}
+    with ThreadPoolExecutor(max_workers=max(1, threads)) as pool:
+        running: dict[Future[ModelRun], str] = {}
+        while pending or running:
+            progressed = False
+            for name, node in list(pending.items()):
+                upstream = [dep for dep in node.depends_on if dep in selected]
+                blocked = [
+                    dep for dep in upstream if dep in finished and finished[dep].status != "succeeded"
+                ]
+                if blocked:
+                    finished[name] = ModelRun(
+                        name, node.layer, "skipped", error=f"Upstream failed: {', '.join(blocked)}"
+                    )
+                    del pending[name]
+                    progressed = True
+                elif all(dep in finished for dep in upstream):
+                    running[pool.submit(_run_node, conn, node)] = name
+                    del pending[name]
+                    progressed = True
+            if not running:
+                if not progressed:
+                    raise ModelRunError(f"Dependency cycle among models: {', '.join(pending)}")
+                continue
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                finished[running.pop(future)] = future.result()
+    runs = [finished[name] for name in selected]
+    conn.execute("CHECKPOINT")
+    for run in runs:
+        if run.status == "succeeded":
+            run.bytes = table_bytes(conn, run.name)
+    return runs
+
+
+def record_model_runs(conn: duckdb.DuckDBPyConnection, runs: list[ModelRun]) -> str:
+    run_id = uuid.uuid4().hex
+    with transaction(conn):
+        conn.executemany(
+            """
+            INSERT INTO model_runs(
+                run_id, model, layer, status, started_at, seconds, table_rows, table_bytes,
+                details, error
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            [
+                [
+                    run_id,
+                    run.name,
+                    run.layer,
+                    run.status,
+                    run.started_at,
+                    run.seconds,
+                    run.rows,
+                    run.bytes,
+                    json.dumps(run.details, default=str, sort_keys=True),
+                    run.error,
+                ]
+                for run in runs
+            ],
+        )
+    return run_id
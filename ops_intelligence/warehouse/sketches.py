@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import math
+from collections.abc import Sequence
+
+QUANTILE_ACCURACY = 0.01
+HLL_PRECISION = 10
+
+_GAMMA = (1 + QUANTILE_ACCURACY) / (1 - QUANTILE_ACCURACY)
+_KEY_OFFSET = 4096
+_REGISTERS = 1 << HLL_PRECISION
+_RHO_SLOTS = 64
+
+
+def plain_columns(table: str) -> str:
+    return f"SELECT COLUMNS(c -> NOT ends_with(c, '_sketch')) FROM {table}"
+
+
+def quantile_sketch(expression: str) -> str:
+    magnitude = f"GREATEST(1, CEIL(LN(ABS({expression})) / {math.log(_GAMMA)!r}) + {_KEY_OFFSET})"
+    key = f"CASE WHEN {expression} = 0 THEN 0 ELSE SIGN({expression}) * {magnitude} END"
+    return f"histogram(({key})::INTEGER)"
+
+
+def distinct_sketch(expression: str) -> str:
+    hashed = f"md5_number_lower(CAST({expression} AS VARCHAR))"
+    remainder = f"({hashed} >> {HLL_PRECISION})"
+    rho = f"CASE WHEN {remainder} = 0 THEN {64 - HLL_PRECISION + 1} ELSE bit_count(xor({remainder}, {remainder} - 1)) END"
+    code = f"({hashed} % {_REGISTERS})::INTEGER * {_RHO_SLOTS} + {rho}"
+    return f"list_sort(list_distinct(list({code}) FILTER (WHERE {expression} IS NOT NULL)))"
+
+
+def _bucket_value(bucket: str) -> str:
+    return f"SIGN({bucket}) * POW({_GAMMA!r}, ABS({bucket}) - {_KEY_OFFSET}) * {2 / (_GAMMA + 1)!r}"
+
+
+def _group_sql(group_by: Sequence[str]) -> tuple[str, str, str]:
+    columns = "".join(f"{column}, " for column in group_by)
+    partition = f"PARTITION BY {', '.join(group_by)}" if group_by else ""
+    grouping = f"GROUP BY {', '.join(group_by)}" if group_by else ""
+    return columns, partition, grouping
+
+
+def sketch_quantiles_sql(
+    source: str,
+    column: str,
+    quantiles: Sequence[float],
+    group_by: Sequence[str] = (),
+    where: str = "TRUE",
+) -> str:
+    columns, partition, grouping = _group_sql(group_by)
+    names = [f"p{round(q * 100):02d}" for q in quantiles]
+    picks = ",\n                ".join(
+        f"MIN(bucket) FILTER (WHERE running > {q!r} * (total - 1)) AS {name}_bucket"
+        for q, name in zip(quantiles, names, strict=True)
+    )
+    values = ",\n            ".join(f"{_bucket_value(f'{name}_bucket')} AS {name}" for name in names)
+    return f"""
+        WITH entries AS (
+            SELECT {columns}unnest(map_keys({column})) AS bucket, unnest(map_values({column})) AS n
+            FROM {source}
+            WHERE {where}
+        ),
+        buckets AS (
+            SELECT {columns}bucket, SUM(n) AS n
+            FROM entries
+            GROUP BY ALL
+        ),
+        ranked AS (
+            SELECT
+                *,
+                SUM(n) OVER ({partition} ORDER BY bucket ROWS UNBOUNDED PRECEDING) AS running,
+                SUM(n) OVER ({partition}) AS total
+            FROM buckets
+        ),
+        picked AS (
+            SELECT
+                {columns}MAX(total) AS observations,
+                {picks}
+            FROM ranked
+            {grouping}
+        )
+        SELECT
+            {columns}observations,
+            {values}
+        FROM picked
+        """
+
+
+def sketch_distinct_sql(
+    source: str, column: str, group_by: Sequence[str] = (), where: str = "TRUE"
+) -> str:
+    columns, _, grouping = _group_sql(group_by)
+    scale = 0.7213 / (1 + 1.079 / _REGISTERS) * _REGISTERS * _REGISTERS
+    return f"""
+        WITH codes AS (
+            SELECT {columns}unnest({column}) AS code
+            FROM {source}
+            WHERE {where}
+        ),
+        registers AS (
+            SELECT {columns}code // {_RHO_SLOTS} AS register, MAX(code % {_RHO_SLOTS}) AS rho
+            FROM codes
+            GROUP BY ALL
+        ),
+        summed AS (
+            SELECT
+                {columns}{_REGISTERS} - COUNT(*) AS empty_registers,
+                {scale!r}::DOUBLE / (COALESCE(SUM(POW(2, -rho)), 0) + {_REGISTERS} - COUNT(*)) AS raw_estimate
+            FROM registers
+            {grouping}
+        )
+        SELECT
+            {columns}CASE
+                WHEN raw_estimate <= {2.5 * _REGISTERS} AND empty_registers > 0
+                    THEN {_REGISTERS} * LN({_REGISTERS}.0 / empty_registers)
+                ELSE raw_estimate
+            END AS distinct_estimate
+        FROM summed
+        """
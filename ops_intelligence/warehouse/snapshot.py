@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import os
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import duckdb
+
+from ops_intelligence.config import ResourceProfile, TenantConfig
+from ops_intelligence.warehouse.db import apply_resource_profile, transaction
+from ops_intelligence.warehouse.modeling import model_registry
+
+SNAPSHOT_ALIAS = "read_snapshot"
+
+
+def _literal(value: str) -> str:
+    return "'" + value.replace("'", "''") + "'"
+
+
+def snapshot_path_for(cfg: TenantConfig) -> Path | None:
+    if not cfg.publish_read_snapshot:
+        return None
+    if cfg.read_snapshot_path:
+        return Path(cfg.read_snapshot_path)
+    warehouse = Path(cfg.warehouse_path)
+    return warehouse.with_name(f"{warehouse.stem}_read{warehouse.suffix or '.duckdb'}")
+
+
+def snapshot_tables(conn: duckdb.DuckDBPyConnection) -> list[str]:
+    gold = [node.name for node in model_registry().values() if node.layer == "gold"]
+    rows = conn.execute(
+        """
+        SELECT table_name
+        FROM duckdb_tables()
+        WHERE database_name = current_database()
+          AND NOT temporary
+          AND list_contains(?::TEXT[], table_name)
+        ORDER BY table_name
+        """,
+        [gold],
+    ).fetchall()
+    return [row[0] for row in rows]
+
+
+def publish_read_snapshot(conn: duckdb.DuckDBPyConnection, target: Path) -> dict[str, Any]:
+    target.parent.mkdir(parents=True, exist_ok=True)
+    staging = target.with_name(target.name + ".publishing")
+    for stale in (staging, staging.with_name(staging.name + ".wal")):
+        stale.unlink(missing_ok=True)
+    published_at = datetime.now(tz=UTC)
+    tables = snapshot_tables(conn)
+    conn.execute(f"ATTACH {_literal(str(staging))} AS {SNAPSHOT_ALIAS}")
+    try:
+        with transaction(conn):
+            for table in tables:
+                conn.execute(
+                    f"CREATE TABLE {SNAPSHOT_ALIAS}.{table} AS SELECT * FROM {table}"
+                )
+            conn.execute(
+                f"""
+                CREATE TABLE {SNAPSHOT_ALIAS}.snapshot_info AS
+                SELECT ?::TIMESTAMP AS published_at, unnest(?::TEXT[]) AS table_name
+                """,
+                [published_at, tables],
+            )
+        conn.execute(f"CHECKPOINT {SNAPSHOT_ALIAS}")
+    finally:
+        conn.execute(f"DETACH {SNAPSHOT_ALIAS}")
+    os.replace(staging, target)
+    return {"path": str(target), "tables": len(tables), "published_at": published_at.isoformat()}
+
+
+def open_read_snapshot(
+    cfg: TenantConfig, profile: ResourceProfile | None = None
+) -> duckdb.DuckDBPyConnection:
+    path = snapshot_path_for(cfg) or Path(cfg.warehouse_path)
+    conn = duckdb.connect(str(path), read_only=True)
+    if profile is not None:
+        apply_resource_profile(conn, profile)
+    return conn
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import hashlib
+from datetime import UTC, datetime
+
+import duckdb
+
+from ops_intelligence.warehouse.columns import SILVER_MODELS, SilverModel, compile_extraction
+from ops_intelligence.warehouse.db import transaction
+
+ENVELOPE_COLUMNS = (
+    ("pulled_at", "TIMESTAMP"),
+    ("window_start", "TIMESTAMP"),
+    ("window_end", "TIMESTAMP"),
+    ("record_id", "TEXT"),
+    ("record_updated_at", "TIMESTAMP"),
+)
+
+
+def staged_table_sql(model: SilverModel) -> str:
+    columns = [f"{name} {sql_type}" for name, sql_type in ENVELOPE_COLUMNS]
+    columns += [f"{c.name} {c.sql_type}" for c in model.columns]
+    return f"CREATE OR REPLACE TABLE {model.staging_table} ({', '.join(columns)})"
+
+
+def staged_insert_sql(
+    model: SilverModel,
+    source: str,
+    where: str,
+    envelope: str = "pulled_at, window_start, window_end",
+) -> str:
+    names = ", ".join([name for name, _ in ENVELOPE_COLUMNS] + [c.name for c in model.columns])
+    extract, values = compile_extraction(model)
+    return f"""
+        INSERT INTO {model.staging_table} ({names})
+        SELECT
+            {envelope},
+            record_id,
+            record_updated_at,
+            {values}
+        FROM (
+            SELECT *, {extract} AS mapped
+            FROM {source}
+            WHERE {where}
+        )
+        """
+
+
+def staging_definition_hash(model: SilverModel) -> str:
+    definition = staged_table_sql(model) + staged_insert_sql(model, "bronze", "")
+    return hashlib.sha256(definition.encode("utf-8")).hexdigest()[:16]
+
+
+def _staged_state(conn: duckdb.DuckDBPyConnection, model: SilverModel) -> str | None:
+    exists = conn.execute(
+        "SELECT COUNT(*) FROM duckdb_tables() WHERE table_name = ? AND NOT temporary",
+        [model.staging_table],
+    ).fetchone()
+    if not exists or not exists[0]:
+        return None
+    row = conn.execute(
+        "SELECT definition_hash FROM model_state WHERE model = ?", [model.staging_table]
+    ).fetchone()
+    return row[0] if row else None
+
+
+def rebuild_staged_table(conn: duckdb.DuckDBPyConnection, model: SilverModel) -> None:
+    conn.execute(staged_table_sql(model))
+    conn.execute(
+        staged_insert_sql(model, "bronze", "entity = ?"),
+        [model.entity],
+    )
+    conn.execute(
+        """
+        INSERT INTO model_state(model, last_pulled_at, definition_hash, refreshed_at)
+        VALUES (?, (SELECT MAX(pulled_at) FROM bronze WHERE entity = ?), ?, ?)
+        ON CONFLICT(model) DO UPDATE SET
+            last_pulled_at=excluded.last_pulled_at,
+            definition_hash=excluded.definition_hash,
+            refreshed_at=excluded.refreshed_at
+        """,
+        [model.staging_table, model.entity, staging_definition_hash(model), datetime.now(tz=UTC)],
+    )
+
+
+def ensure_staged_tables(
+    conn: duckdb.DuckDBPyConnection,
+    force: bool = False,
+    models: tuple[SilverModel, ...] = SILVER_MODELS,
+) -> list[str]:
+    rebuilt: list[str] = []
+    for model in models:
+        if force or _staged_state(conn, model) != staging_definition_hash(model):
+            with transaction(conn):
+                rebuild_staged_table(conn, model)
+            rebuilt.append(model.staging_table)
+    return rebuilt
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+from ops_intelligence.config import TripConfig
+from ops_intelligence.warehouse.partitions import partition_filter
+
+TRIPS_TABLE = "gold_truck_trips_daily"
+TRIPS_SOURCE = "silver_dispatch_events"
+TRIPS_PARTITION = "unnest([DATE(event_ts), DATE(event_ts) - 1])"
+TRIPS_SCOPE = (
+    "DATE(event_ts) IN ("
+    "SELECT unnest([service_date - 1, service_date, service_date + 1]) FROM gold_partitions)"
+)
+
+_EARTH_RADIUS_KM = 6371.0088
+
+
+def haversine_km(lat1: str, lon1: str, lat2: str, lon2: str) -> str:
+    return f"""
+        2 * {_EARTH_RADIUS_KM} * ASIN(SQRT(
+            POW(SIN(RADIANS({lat2} - {lat1}) / 2), 2)
+            + COS(RADIANS({lat1})) * COS(RADIANS({lat2})) * POW(SIN(RADIANS({lon2} - {lon1}) / 2), 2)
+        ))"""
+
+
+def trips_sql(settings: TripConfig | None = None) -> dict[str, str]:
+    cfg = settings or TripConfig()
+    distance = haversine_km("prev_latitude", "prev_longitude", "latitude", "longitude")
+    return {
+        TRIPS_TABLE: f"""
+            WITH events AS (
+                SELECT
+                    dispatch_event_id,
+                    truck_id,
+                    hauler_id,
+                    ticket_id,
+                    event_ts,
+                    latitude,
+                    longitude,
+                    LAG(event_ts) OVER truck_events AS prev_ts,
+                    LAG(latitude) OVER truck_events AS prev_latitude,
+                    LAG(longitude) OVER truck_events AS prev_longitude,
+                    LAG(ticket_id) OVER truck_events AS prev_ticket_id
+                FROM {TRIPS_SOURCE}
+                WHERE truck_id IS NOT NULL AND event_ts IS NOT NULL
+                    AND {partition_filter(TRIPS_SOURCE)}
+                WINDOW truck_events AS (PARTITION BY truck_id ORDER BY event_ts, dispatch_event_id)
+            ),
+            legs AS (
+                SELECT
+                    *,
+                    DATE_DIFF('second', prev_ts, event_ts) / 60.0 AS leg_minutes,
+                    {distance} AS leg_km,
+                    CASE
+                        WHEN prev_ts IS NULL
+                            OR DATE_DIFF('second', prev_ts, event_ts) > {cfg.gap_minutes * 60}
+                            OR ticket_id <> prev_ticket_id
+                            THEN 1
+                        ELSE 0
+                    END AS trip_start
+                FROM events
+            ),
+            sessioned AS (
+                SELECT
+                    *,
+                    SUM(trip_start) OVER truck_order AS trip_seq,
+                    SUM(
+                        CASE WHEN trip_start = 0 AND leg_km * 1000 < {cfg.dwell_radius_meters} THEN 0 ELSE 1 END
+                    ) OVER truck_order AS stop_seq
+                FROM legs
+                WINDOW truck_order AS (
+                    PARTITION BY truck_id ORDER BY event_ts, dispatch_event_id ROWS UNBOUNDED PRECEDING
+                )
+            ),
+            stops AS (
+                SELECT truck_id, trip_seq, SUM(leg_minutes) AS stop_minutes
+                FROM sessioned
+                WHERE trip_start = 0 AND leg_km * 1000 < {cfg.dwell_radius_meters}
+                GROUP BY truck_id, trip_seq, stop_seq
+            ),
+            stop_totals AS (
+                SELECT
+                    truck_id,
+                    trip_seq,
+                    SUM(stop_minutes) AS dwell_minutes,
+                    SUM(stop_minutes) FILTER (WHERE stop_minutes >= {cfg.idle_minutes}) AS idle_minutes,
+                    COUNT(*) FILTER (WHERE stop_minutes >= {cfg.idle_minutes}) AS idle_stops
+                FROM stops
+                GROUP BY truck_id, trip_seq
+            ),
+            trips AS (
+                SELECT
+                    truck_id,
+                    trip_seq,
+                    arg_min(hauler_id, event_ts) FILTER (WHERE hauler_id IS NOT NULL) AS hauler_id,
+                    MIN(event_ts) AS started_at,
+                    DATE_DIFF('second', MIN(event_ts), MAX(event_ts)) / 60.0 AS trip_minutes,
+                    COUNT(*) AS events,
+                    COUNT(DISTINCT ticket_id) AS tickets,
+                    COUNT(*) FILTER (WHERE trip_start = 0) AS legs,
+                    COALESCE(SUM(leg_km) FILTER (WHERE trip_start = 0), 0) AS distance_km,
+                    COALESCE(
+                        SUM(leg_minutes) FILTER (
+                            WHERE trip_start = 0 AND leg_km * 1000 >= {cfg.dwell_radius_meters}
+                        ),
+                        0
+                    ) AS moving_minutes
+                FROM sessioned
+                GROUP BY truck_id, trip_seq
+            )
+            SELECT
+                DATE(t.started_at) AS service_date,
+                t.truck_id,
+                t.hauler_id,
+                COUNT(*) AS trips,
+                SUM(t.events) AS events,
+                SUM(t.legs) AS legs,
+                SUM(t.tickets) AS tickets,
+                SUM(t.trip_minutes) AS trip_minutes,
+                AVG(t.trip_minutes) AS avg_trip_minutes,
+                SUM(t.distance_km) AS distance_km,
+                SUM(t.moving_minutes) AS moving_minutes,
+                COALESCE(SUM(s.dwell_minutes), 0) AS dwell_minutes,
+                COALESCE(SUM(s.idle_minutes), 0) AS idle_minutes,
+                COALESCE(SUM(s.idle_stops), 0) AS idle_stops,
+                SUM(t.distance_km) / NULLIF(SUM(t.moving_minutes) / 60, 0) AS avg_moving_speed_kph
+            FROM trips t
+            LEFT JOIN stop_totals s
+                ON t.truck_id = s.truck_id
+                AND t.trip_seq = s.trip_seq
+            GROUP BY 1, 2, 3
+            ORDER BY 1, 2, 3
+            """,
+    }
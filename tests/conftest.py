@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import duckdb
+import pytest
+
+from ops_intelligence.config import EntityConfig, TenantConfig, parse_config
+from ops_intelligence.extraction.bronze import insert_bronze_rows
+from ops_intelligence.replay.benchmark import apply_overrides
+from ops_intelligence.warehouse.db import connect_warehouse
+from ops_intelligence.warehouse.staging import ensure_staged_tables
+
+ROOT = Path(__file__).parents[1]
+BASE = datetime(2026, 1, 1, tzinfo=UTC)
+
+Ingest = Callable[[str, list[dict[str, Any]], datetime], None]
+ReplayConfig = Callable[..., TenantConfig]
+
+
+@pytest.fixture
+def warehouse() -> Iterator[duckdb.DuckDBPyConnection]:
+    conn = connect_warehouse(":memory:")
+    ensure_staged_tables(conn)
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def ingest(warehouse: duckdb.DuckDBPyConnection) -> Ingest:
+    def _ingest(entity: str, rows: list[dict[str, Any]], pulled_at: datetime) -> None:
+        entity_cfg = EntityConfig(query_file="", root_path="", page_info_path="")
+        insert_bronze_rows(warehouse, entity, rows, entity_cfg, BASE, BASE, pulled_at)
+
+    return _ingest
+
+
+@pytest.fixture
+def replay_config(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> ReplayConfig:
+    monkeypatch.chdir(ROOT)
+    monkeypatch.setenv("FASTWEIGH_API_KEY", "replay")
+
+    def _config(endpoint: str, **overrides: Any) -> TenantConfig:
+        cfg = parse_config(str(ROOT / "config" / "tenant.example.yaml"))
+        return apply_overrides(
+            cfg,
+            {
+                "graphql_endpoint": endpoint,
+                "warehouse_path": str(tmp_path / "warehouse.duckdb"),
+                "bronze_lake_dir": str(tmp_path / "bronze"),
+                "transport.requests_per_second": 0.0,
+                "transport.max_attempts": 1,
+                **overrides,
+            },
+        )
+
+    return _config
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from datetime import timedelta
+
+import duckdb
+
+from ops_intelligence.alerts.engine import run_alert_engine
+from ops_intelligence.alerts.rules import alert_rules
+from ops_intelligence.config import AlertThresholdConfig, TenantConfig
+from ops_intelligence.warehouse.modeling import run_models
+from tests.conftest import BASE, Ingest
+
+ALERT_TABLES = {rule.table for rule in alert_rules(AlertThresholdConfig())}
+
+
+def _ticket(day: int, yard_minutes: int, updated: int) -> dict[str, str]:
+    check_in = BASE + timedelta(days=day, hours=8)
+    loaded = check_in + timedelta(minutes=yard_minutes)
+    return {
+        "id": f"t{day}",
+        "lastUpdatedAt": (BASE + timedelta(seconds=updated)).isoformat(),
+        "locationId": "L1",
+        "checkInTimestamp": check_in.isoformat(),
+        "loadedTimestamp": loaded.isoformat(),
+        "ticketTimestamp": loaded.isoformat(),
+    }
+
+
+def _logged_tables(warehouse: duckdb.DuckDBPyConnection) -> set[str]:
+    rows = warehouse.execute("SELECT DISTINCT table_name FROM gold_partition_log").fetchall()
+    return {row[0] for row in rows}
+
+
+def test_findings_past_the_rule_limit_fire_on_later_runs(
+    warehouse: duckdb.DuckDBPyConnection, ingest: Ingest
+) -> None:
+    cfg = TenantConfig.model_validate({"entities": {}})
+    ingest("tickets", [_ticket(day, 30, day) for day in range(30)], BASE + timedelta(hours=1))
+    run_models(warehouse, threads=1)
+    assert run_alert_engine(warehouse, cfg) == []
+
+    ingest("tickets", [_ticket(day, 200, 100 + day) for day in range(30)], BASE + timedelta(hours=2))
+    run_models(warehouse, threads=1)
+    fired = [len(run_alert_engine(warehouse, cfg)) for _ in range(3)]
+
+    assert fired == [20, 10, 0]
+    dates = warehouse.execute(
+        "SELECT COUNT(DISTINCT alert_date) FROM alert_events WHERE alert_name = 'yard_congestion'"
+    ).fetchone()
+    assert dates == (30,)
+    assert _logged_tables(warehouse) & ALERT_TABLES == set()
+
+
+def test_alert_runs_keep_log_entries_of_other_tables(
+    warehouse: duckdb.DuckDBPyConnection, ingest: Ingest
+) -> None:
+    cfg = TenantConfig.model_validate({"entities": {}})
+    ingest("tickets", [_ticket(0, 30, 0)], BASE + timedelta(hours=1))
+    run_models(warehouse, threads=1)
+    run_alert_engine(warehouse, cfg)
+
+    ingest("tickets", [_ticket(1, 200, 1)], BASE + timedelta(hours=2))
+    run_models(warehouse, threads=1)
+    ingest("tickets", [_ticket(2, 200, 2)], BASE + timedelta(hours=3))
+    run_models(warehouse, ["gold_lane_hourly"], threads=1)
+
+    fired = run_alert_engine(warehouse, cfg)
+    assert [finding.alert_date for finding in fired] == [(BASE + timedelta(days=1)).date()]
+    logged = _logged_tables(warehouse)
+    assert "gold_lane_hourly" in logged
+    assert logged & ALERT_TABLES == set()
+    assert len(run_alert_engine(warehouse, cfg)) == 0
+    run_models(warehouse, threads=1)
+    assert [f.alert_date for f in run_alert_engine(warehouse, cfg)] == [
+        (BASE + timedelta(days=2)).date()
+    ]
+
+
+def test_cooldown_suppresses_refired_findings(
+    warehouse: duckdb.DuckDBPyConnection, ingest: Ingest
+) -> None:
+    cfg = TenantConfig.model_validate({"entities": {}})
+    ingest("tickets", [_ticket(0, 200, 0)], BASE + timedelta(hours=1))
+    run_models(warehouse, threads=1)
+    assert len(run_alert_engine(warehouse, cfg)) == 1
+
+    ingest("tickets", [_ticket(0, 210, 1)], BASE + timedelta(hours=2))
+    run_models(warehouse, threads=1)
+    assert run_alert_engine(warehouse, cfg) == []
+
+    cfg.alerts.cooldown_hours = 0
+    ingest("tickets", [_ticket(0, 220, 2)], BASE + timedelta(hours=3))
+    run_models(warehouse, threads=1)
+    assert len(run_alert_engine(warehouse, cfg)) == 1
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from datetime import timedelta
+
+import duckdb
+
+from ops_intelligence.warehouse.modeling import run_ar_snapshots, run_models
+from tests.conftest import BASE, Ingest
+
+
+def _invoice(number: int, balance: float, updated_day: int) -> dict[str, object]:
+    return {
+        "id": f"i{number}",
+        "lastUpdatedAt": (BASE + timedelta(days=updated_day, hours=number)).isoformat(),
+        "customerId": f"c{number % 2}",
+        "invoiceDate": BASE.date().isoformat(),
+        "dueDate": (BASE + timedelta(days=5)).date().isoformat(),
+        "amount": 100.0,
+        "openBalance": balance,
+    }
+
+
+def test_rebuild_keeps_closed_snapshot_days(
+    warehouse: duckdb.DuckDBPyConnection, ingest: Ingest
+) -> None:
+    ingest("invoices", [_invoice(n, 100.0, 0) for n in range(4)], BASE + timedelta(days=1))
+    ingest("invoices", [_invoice(n, 0.0, 3) for n in range(2)], BASE + timedelta(days=4))
+    run_models(warehouse, ["silver_invoices"], threads=1)
+    run_ar_snapshots(warehouse, as_of=(BASE + timedelta(days=5)).date())
+    closed = warehouse.execute(
+        "SELECT * FROM gold_ar_snapshot_daily WHERE as_of_date < ? ORDER BY as_of_date",
+        [(BASE + timedelta(days=5)).date()],
+    ).fetchall()
+    assert len(closed) == 5
+
+    warehouse.execute(
+        """
+        DELETE FROM staged_invoices
+        WHERE updated_at < (SELECT MAX(updated_at) FROM staged_invoices s WHERE s.invoice_id = staged_invoices.invoice_id)
+        """
+    )
+    result = run_ar_snapshots(warehouse, full_refresh=True, as_of=(BASE + timedelta(days=7)).date())
+
+    assert result["mode"] == "backfill"
+    rows = warehouse.execute("SELECT * FROM gold_ar_snapshot_daily ORDER BY as_of_date").fetchall()
+    assert rows[: len(closed)] == closed
+    assert [row[0] for row in rows[len(closed) :]] == [
+        (BASE + timedelta(days=day)).date() for day in (5, 6, 7)
+    ]
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import json
+from datetime import timedelta
+from typing import Any
+
+import duckdb
+import pytest
+
+from ops_intelligence.config import EntityConfig
+from ops_intelligence.extraction.bronze import (
+    IngestCounts,
+    discard_window_rows,
+    insert_bronze_page,
+    insert_bronze_rows,
+)
+from ops_intelligence.extraction.state import WindowCheckpoint, upsert_checkpoint
+from ops_intelligence.graphql.transport import GraphQLError
+from tests.conftest import BASE
+
+ENTITY_CFG = EntityConfig(query_file="", root_path="data.tickets.nodes", page_info_path="")
+WINDOW = (BASE, BASE + timedelta(hours=1))
+
+
+def _ticket(number: int, net_weight: float = 10.0, minutes: int = 0) -> dict[str, Any]:
+    return {
+        "id": f"t{number}",
+        "lastUpdatedAt": (BASE + timedelta(minutes=number + minutes)).isoformat(),
+        "netWeight": net_weight,
+    }
+
+
+def _ingest(
+    conn: duckdb.DuckDBPyConnection,
+    rows: list[dict[str, Any]],
+    hours: int,
+    window: tuple[Any, Any] = WINDOW,
+    skip_unchanged: bool = True,
+) -> IngestCounts:
+    pulled_at = BASE + timedelta(hours=hours)
+    return insert_bronze_rows(conn, "tickets", rows, ENTITY_CFG, *window, pulled_at, skip_unchanged)
+
+
+def _ingest_page(
+    conn: duckdb.DuckDBPyConnection, body: str, hours: int, skip_unchanged: bool = True
+) -> IngestCounts:
+    pulled_at = BASE + timedelta(hours=hours)
+    return insert_bronze_page(conn, "tickets", body, ENTITY_CFG, *WINDOW, pulled_at, skip_unchanged)
+
+
+def _page_body(rows: list[dict[str, Any]]) -> str:
+    return json.dumps({"data": {"tickets": {"nodes": rows, "pageInfo": {}}}}, indent=2)
+
+
+def _fingerprints(conn: duckdb.DuckDBPyConnection) -> dict[str, tuple[int, Any]]:
+    rows = conn.execute(
+        "SELECT record_id, content_hash, pulled_at FROM bronze_fingerprints WHERE entity = 'tickets'"
+    ).fetchall()
+    return {record_id: (content_hash, pulled_at) for record_id, content_hash, pulled_at in rows}
+
+
+def _latest_bronze(conn: duckdb.DuckDBPyConnection) -> dict[str, tuple[int, Any]]:
+    rows = conn.execute(
+        """
+        SELECT record_id, content_hash, pulled_at
+        FROM bronze_events
+        WHERE entity = 'tickets'
+        QUALIFY row_number() OVER (PARTITION BY record_id ORDER BY pulled_at DESC) = 1
+        """
+    ).fetchall()
+    return {record_id: (content_hash, pulled_at) for record_id, content_hash, pulled_at in rows}
+
+
+def test_ingest_classifies_new_changed_and_unchanged_records(
+    warehouse: duckdb.DuckDBPyConnection,
+) -> None:
+    page = [_ticket(n) for n in range(3)]
+
+    assert _ingest(warehouse, page, 1) == IngestCounts(fetched=3, new=3, inserted=3)
+    first = _fingerprints(warehouse)
+    assert first == _latest_bronze(warehouse)
+    assert set(first) == {"t0", "t1", "t2"}
+
+    assert _ingest(warehouse, page, 2) == IngestCounts(fetched=3, unchanged=3)
+    assert _fingerprints(warehouse) == first
+
+    modified = [_ticket(0), _ticket(1, net_weight=12.5, minutes=30), _ticket(2), _ticket(3)]
+    assert _ingest(warehouse, modified, 3) == IngestCounts(
+        fetched=4, new=1, changed=1, unchanged=2, inserted=2
+    )
+    latest = _fingerprints(warehouse)
+    assert latest == _latest_bronze(warehouse)
+    assert latest["t1"][0] != first["t1"][0]
+    assert {key: latest[key] for key in ("t0", "t2")} == {key: first[key] for key in ("t0", "t2")}
+
+    assert _ingest(warehouse, modified, 4, skip_unchanged=False) == IngestCounts(
+        fetched=4, unchanged=4, inserted=4
+    )
+    assert warehouse.execute("SELECT COUNT(*) FROM bronze_events").fetchone() == (9,)
+    assert _fingerprints(warehouse) == latest
+
+
+def test_split_rollback_restores_fingerprints_of_surviving_rows(
+    warehouse: duckdb.DuckDBPyConnection,
+) -> None:
+    _ingest(warehouse, [_ticket(n) for n in range(3)], 1)
+    before = _fingerprints(warehouse)
+
+    split = (BASE + timedelta(hours=1), BASE + timedelta(hours=2))
+    upsert_checkpoint(
+        warehouse, "tickets", WindowCheckpoint(split, "100", 1, 3, BASE + timedelta(hours=2))
+    )
+    counts = _ingest(
+        warehouse, [_ticket(1, net_weight=11.0, minutes=70), _ticket(2), _ticket(5)], 3, split
+    )
+    assert counts == IngestCounts(fetched=3, new=1, changed=1, unchanged=1, inserted=2)
+    assert set(_fingerprints(warehouse)) == {"t0", "t1", "t2", "t5"}
+
+    assert discard_window_rows(warehouse, "tickets", split) == 2
+    assert _fingerprints(warehouse) == before == _latest_bronze(warehouse)
+
+
+def test_raw_page_ingest_stages_every_node(warehouse: duckdb.DuckDBPyConnection) -> None:
+    page = [_ticket(n) for n in range(3)]
+
+    assert _ingest_page(warehouse, _page_body(page), 1) == IngestCounts(
+        fetched=3, new=3, inserted=3
+    )
+    assert set(_latest_bronze(warehouse)) == {"t0", "t1", "t2"}
+    assert warehouse.execute("SELECT COUNT(*) FROM staged_tickets").fetchone() == (3,)
+    assert _ingest_page(warehouse, _page_body([]), 2) == IngestCounts()
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        json.dumps({"data": {"tickets": None}}),
+        json.dumps({"data": {"tickets": {"nodes": {"id": "t0"}}}}),
+        json.dumps({"errors": [{"message": "boom"}]}),
+    ],
+)
+def test_raw_page_ingest_rejects_a_missing_root_path(
+    warehouse: duckdb.DuckDBPyConnection, body: str
+) -> None:
+    with pytest.raises(GraphQLError, match="root_path=data.tickets.nodes"):
+        _ingest_page(warehouse, body, 1)
+
+
+def test_raw_page_and_row_ingest_hash_records_identically(
+    warehouse: duckdb.DuckDBPyConnection,
+) -> None:
+    page = [
+        {**_ticket(0), "netWeight": 1e21, "tare": 1.5e-7, "notes": 'Café ☃ "q"\n'},
+        {**_ticket(1), "customer": {"id": "C1", "tags": [1, None, True]}, "extra": {}},
+    ]
+
+    assert _ingest(warehouse, page, 1) == IngestCounts(fetched=2, new=2, inserted=2)
+    assert _ingest_page(warehouse, _page_body(page), 2) == IngestCounts(fetched=2, unchanged=2)
+
+    _ingest_page(warehouse, _page_body(page), 3, skip_unchanged=False)
+    rows = warehouse.execute(
+        """
+        SELECT record_id, list(DISTINCT content_hash), list(DISTINCT record_json)
+        FROM bronze_events
+        GROUP BY record_id
+        """
+    ).fetchall()
+    assert len(rows) == 2
+    assert all(len(hashes) == 1 and len(records) == 1 for _, hashes, records in rows)
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import duckdb
+import pytest
+
+from ops_intelligence.config import ConfigError, EntityConfig
+from ops_intelligence.extraction.bronze import insert_bronze_rows
+from ops_intelligence.warehouse.columns import (
+    SILVER_MODELS,
+    compile_extraction,
+    load_silver_models,
+    silver_model_for,
+)
+from ops_intelligence.warehouse.modeling import run_models
+from ops_intelligence.warehouse.staging import ensure_staged_tables
+from tests.conftest import BASE
+
+OVERRIDE = """
+silver_tickets:
+  columns:
+    ticket_id: [ticketNumber, id]
+    plant_code: {paths: [plant.code], default: NONE}
+"""
+
+
+def _mapping(tmp_path: Path, text: str) -> str:
+    path = tmp_path / "mapping.yaml"
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+
+def test_tenant_mapping_overlays_default_columns(
+    warehouse: duckdb.DuckDBPyConnection, tmp_path: Path
+) -> None:
+    models = load_silver_models(_mapping(tmp_path, OVERRIDE))
+    tickets = silver_model_for("tickets", models)
+    default = silver_model_for("tickets")
+    assert tickets is not None and default is not None
+
+    columns = {c.name: c for c in tickets.columns}
+    assert columns["ticket_id"].paths == ("ticketNumber", "id")
+    assert columns["plant_code"].default == "'NONE'"
+    assert list(columns)[:-1] == [c.name for c in default.columns]
+    assert [m.table for m in models] == [m.table for m in SILVER_MODELS]
+
+    extract, values = compile_extraction(tickets)
+    assert extract.startswith("json_extract_string(record_json, ['$.ticketNumber', '$.id', ")
+    assert values.startswith("COALESCE(mapped[1], mapped[2]),")
+    assert values.endswith(f"COALESCE(mapped[{len(tickets.json_paths)}], 'NONE')")
+
+    assert ensure_staged_tables(warehouse, models=models) == ["staged_tickets"]
+    insert_bronze_rows(
+        warehouse,
+        "tickets",
+        [
+            {
+                "id": "t1",
+                "ticketNumber": "T-1",
+                "plant": {"code": "P9"},
+                "lastUpdatedAt": BASE.isoformat(),
+            },
+            {"id": "t2", "lastUpdatedAt": BASE.isoformat()},
+        ],
+        EntityConfig(query_file="", root_path="", page_info_path=""),
+        BASE,
+        BASE,
+        BASE,
+        models=models,
+    )
+    run_models(warehouse, ["silver_tickets"], threads=1, models=models)
+    assert warehouse.execute(
+        "SELECT ticket_id, plant_code FROM silver_tickets ORDER BY ticket_id"
+    ).fetchall() == [("T-1", "P9"), ("t2", "NONE")]
+
+
+@pytest.mark.parametrize(
+    ("text", "message"),
+    [
+        ("", "is empty or invalid"),
+        (
+            "silver_tickets:\n  columns:\n    net_weight: {paths: [netWeight], type: FLOAT}\n",
+            "Invalid silver mapping for silver_tickets",
+        ),
+        (
+            "silver_widgets:\n  entity: widgets\n  key: widget_id\n"
+            "  columns:\n    updated_at: [updatedAt]\n",
+            "Silver mapping for silver_widgets has no 'widget_id' column",
+        ),
+        (
+            "silver_more_tickets:\n  entity: tickets\n  key: ticket_id\n"
+            "  columns:\n    ticket_id: [id]\n    updated_at: [updatedAt]\n",
+            "maps entity more than once: tickets",
+        ),
+    ],
+)
+def test_invalid_mapping_is_a_config_error(tmp_path: Path, text: str, message: str) -> None:
+    with pytest.raises(ConfigError, match=message):
+        load_silver_models(_mapping(tmp_path, text))
+
+
+def test_missing_mapping_is_a_config_error(tmp_path: Path) -> None:
+    with pytest.raises(ConfigError, match="Silver mapping not found"):
+        load_silver_models(str(tmp_path / "missing.yaml"))
+
+
+def test_mapping_changes_invalidate_compiled_models(
+    warehouse: duckdb.DuckDBPyConnection, tmp_path: Path
+) -> None:
+    path = _mapping(tmp_path, OVERRIDE)
+    first = load_silver_models(path)
+    assert load_silver_models(path) is first
+    ensure_staged_tables(warehouse, models=first)
+    assert ensure_staged_tables(warehouse, models=first) == []
+
+    changed = load_silver_models(_mapping(tmp_path, OVERRIDE.replace("plant.code", "plantCode")))
+    old = silver_model_for("tickets", first)
+    new = silver_model_for("tickets", changed)
+    assert changed is not first
+    assert old is not None and new is not None
+    assert new.mapping_hash != old.mapping_hash
+    assert "'$.plantCode'" in compile_extraction(new)[0]
+    assert "'$.plantCode'" not in compile_extraction(old)[0]
+    assert ensure_staged_tables(warehouse, models=changed) == ["staged_tickets"]
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import Any
+
+import duckdb
+
+from ops_intelligence.config import EntityConfig
+from ops_intelligence.extraction.bronze import insert_bronze_rows
+from ops_intelligence.warehouse.columns import silver_model_for, silver_select_sql
+from ops_intelligence.warehouse.compaction import compact_bronze
+from ops_intelligence.warehouse.db import connect_warehouse
+from ops_intelligence.warehouse.modeling import run_models
+from ops_intelligence.warehouse.staging import ensure_staged_tables
+from tests.conftest import BASE, ReplayConfig
+
+ENTITY_CFG = EntityConfig(query_file="", root_path="", page_info_path="")
+
+
+def _ticket(record_id: str | None, hours: int, net_weight: float) -> dict[str, Any]:
+    row: dict[str, Any] = {
+        "lastUpdatedAt": (BASE + timedelta(hours=hours)).isoformat(),
+        "netWeight": net_weight,
+        "ticketTimestamp": BASE.isoformat(),
+    }
+    if record_id is not None:
+        row["id"] = record_id
+    return row
+
+
+def _versions(conn: duckdb.DuckDBPyConnection) -> list[tuple[str | None, float]]:
+    rows = conn.execute(
+        """
+        SELECT record_id, json_extract(record_json, '$.netWeight')::DOUBLE AS net_weight
+        FROM bronze_events
+        ORDER BY record_id NULLS LAST, net_weight
+        """
+    ).fetchall()
+    return [(record_id, net_weight) for record_id, net_weight in rows]
+
+
+def _silver(conn: duckdb.DuckDBPyConnection) -> list[tuple[Any, ...]]:
+    model = silver_model_for("tickets")
+    assert model is not None
+    return conn.execute(
+        f"SELECT * EXCLUDE (bronze_pulled_at) FROM ({silver_select_sql(model)}) ORDER BY ALL"
+    ).fetchall()
+
+
+def test_compaction_keeps_latest_versions_and_silver_results(
+    replay_config: ReplayConfig,
+) -> None:
+    cfg = replay_config("http://unused/")
+    conn = connect_warehouse(cfg.warehouse_path)
+    ensure_staged_tables(conn)
+    for hours in (1, 2, 3):
+        batch = [_ticket("t0", hours, 10.0 + hours), _ticket(None, hours, 100.0 + hours)]
+        if hours == 1:
+            batch.append(_ticket("t1", hours, 5.0))
+        insert_bronze_rows(
+            conn, "tickets", batch, ENTITY_CFG, BASE, BASE, BASE + timedelta(hours=hours)
+        )
+    run_models(conn, ["silver_tickets"], threads=1)
+    staged = _silver(conn)
+    silver = conn.execute(
+        "SELECT * EXCLUDE (bronze_pulled_at) FROM silver_tickets ORDER BY ALL"
+    ).fetchall()
+    no_id = [(None, 101.0), (None, 102.0), (None, 103.0)]
+
+    report = compact_bronze(conn, cfg, history_depth=2)
+    assert (report.history_depth, report.rows_before, report.rows_after) == (2, 7, 6)
+    assert _versions(conn) == [("t0", 12.0), ("t0", 13.0), ("t1", 5.0), *no_id]
+
+    report = compact_bronze(conn, cfg)
+    assert (report.history_depth, report.rows_removed) == (1, 1)
+    assert _versions(conn) == [("t0", 13.0), ("t1", 5.0), *no_id]
+    assert conn.execute("SELECT COUNT(*) FROM staged_tickets").fetchone() == (5,)
+    assert _silver(conn) == staged
+
+    run_models(conn, ["silver_tickets"], full_refresh=True, threads=1)
+    assert (
+        conn.execute(
+            "SELECT * EXCLUDE (bronze_pulled_at) FROM silver_tickets ORDER BY ALL"
+        ).fetchall()
+        == silver
+    )
+    conn.close()
@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import json
+from datetime import timedelta
+from typing import Any
+
+import duckdb
+
+from ops_intelligence.warehouse.modeling import _gold_sql, _partition_predicates, run_models
+from ops_intelligence.warehouse.partitions import scope_partitions
+from ops_intelligence.warehouse.rollups import LANE_HOURLY_TABLE, rollup_sql
+from ops_intelligence.warehouse.trips import trips_sql
+from tests.conftest import BASE, Ingest
+
+DAYS = 20
+TICKETS_PER_DAY = 50
+ROLLUPS = ("gold_location_rollup", "gold_hauler_rollup")
+
+
+def _ticket(number: int, day: int, updated: int, net_weight: float = 10.0) -> dict[str, Any]:
+    stamp = BASE + timedelta(days=day, hours=8, minutes=number % 300)
+    return {
+        "id": f"t{number}",
+        "lastUpdatedAt": (BASE + timedelta(seconds=updated)).isoformat(),
+        "locationId": f"L{number % 2}",
+        "laneId": "A",
+        "truckId": f"k{number % 7}",
+        "haulerId": f"h{number % 3}",
+        "targetWeight": 10.0,
+        "netWeight": net_weight,
+        "checkInTimestamp": stamp.isoformat(),
+        "loadedTimestamp": (stamp + timedelta(minutes=20)).isoformat(),
+        "ticketTimestamp": (stamp + timedelta(minutes=25)).isoformat(),
+        "dispatchAssignedTimestamp": (stamp + timedelta(minutes=25)).isoformat(),
+        "podTimestamp": (stamp + timedelta(minutes=70)).isoformat(),
+    }
+
+
+def _seed(warehouse: duckdb.DuckDBPyConnection, ingest: Ingest) -> None:
+    rows = [
+        _ticket(day * TICKETS_PER_DAY + i, day, i)
+        for day in range(DAYS)
+        for i in range(TICKETS_PER_DAY)
+    ]
+    ingest("tickets", rows, BASE + timedelta(hours=1))
+    run_models(warehouse, threads=1)
+
+
+def _operators(node: dict[str, Any]) -> list[dict[str, Any]]:
+    found = [node] if "operator_name" in node else []
+    for child in node.get("children", []):
+        found += _operators(child)
+    return found
+
+
+def test_partition_refresh_aggregates_only_changed_dates(
+    warehouse: duckdb.DuckDBPyConnection, ingest: Ingest
+) -> None:
+    _seed(warehouse, ingest)
+    warehouse.execute(
+        "CREATE OR REPLACE TEMP TABLE gold_partitions AS SELECT ?::DATE AS service_date",
+        [(BASE + timedelta(days=3)).date()],
+    )
+    marts = {**_gold_sql(90), LANE_HOURLY_TABLE: rollup_sql(90)[LANE_HOURLY_TABLE]}
+    for table in (
+        "gold_plant_ops_daily",
+        "gold_dispatch_daily",
+        "gold_hauler_productivity_daily",
+        LANE_HOURLY_TABLE,
+    ):
+        sql = scope_partitions(marts[table], _partition_predicates(table))
+        plan = warehouse.execute(f"EXPLAIN (ANALYZE, FORMAT JSON) {sql}").fetchall()
+        operators = _operators(json.loads(plan[0][1]))
+        scans = [op for op in operators if op["operator_name"] in ("SEQ_SCAN", "TABLE_SCAN")]
+        above_scan = [op for op in operators if op not in scans]
+        assert scans
+        assert max(op["operator_cardinality"] for op in above_scan) <= TICKETS_PER_DAY, table
+
+
+def test_partition_refresh_matches_full_rebuild(
+    warehouse: duckdb.DuckDBPyConnection, ingest: Ingest
+) -> None:
+    _seed(warehouse, ingest)
+    changed = [_ticket(3 * TICKETS_PER_DAY + i, 3, 10_000 + i, 14.0) for i in range(5)]
+    changed.append(_ticket(99_999, 11, 20_000))
+    ingest("tickets", changed, BASE + timedelta(hours=2))
+    runs = {run.name: run for run in run_models(warehouse, threads=1)}
+
+    assert runs["gold_plant_ops_daily"].details["mode"] == "partitions"
+    assert runs["gold_plant_ops_daily"].details["partitions_recomputed"] == 2
+    assert runs[LANE_HOURLY_TABLE].details["mode"] == "partitions"
+    for rollup in ROLLUPS:
+        assert runs[rollup].details["mode"] == "partitions"
+        assert runs[rollup].details["partitions_recomputed"] == 5
+    _assert_matches_full_rebuild(warehouse)
+
+
+def test_rollup_refresh_recomputes_weeks_spanning_months(
+    warehouse: duckdb.DuckDBPyConnection, ingest: Ingest
+) -> None:
+    rows = [
+        _ticket(day * TICKETS_PER_DAY + i, day, i)
+        for day in range(25, 36)
+        for i in range(TICKETS_PER_DAY)
+    ]
+    ingest("tickets", rows, BASE + timedelta(hours=1))
+    run_models(warehouse, threads=1)
+
+    ingest("tickets", [_ticket(31 * TICKETS_PER_DAY, 31, 10_000, 14.0)], BASE + timedelta(hours=2))
+    runs = {run.name: run for run in run_models(warehouse, threads=1)}
+
+    for rollup in ROLLUPS:
+        assert runs[rollup].details["mode"] == "partitions"
+        assert runs[rollup].details["partitions_recomputed"] == 3
+        assert runs[rollup].details["partitions_skipped"] > 0
+    _assert_matches_full_rebuild(warehouse)
+
+
+def _assert_matches_full_rebuild(warehouse: duckdb.DuckDBPyConnection) -> None:
+    for table, sql in {**_gold_sql(90), **rollup_sql(90)}.items():
+        if table == "gold_billing_ar_daily":
+            continue
+        diff = warehouse.execute(
+            f"""
+            SELECT COUNT(*) FROM (
+                (SELECT * FROM {table} EXCEPT ALL SELECT * FROM ({sql}))
+                UNION ALL
+                (SELECT * FROM ({sql}) EXCEPT ALL SELECT * FROM {table})
+            )
+            """
+        ).fetchone()
+        assert diff == (0,), table
+
+
+def _ping(number: int, minutes: int, updated: int, latitude: float) -> dict[str, Any]:
+    return {
+        "id": f"e{number}",
+        "lastUpdatedAt": (BASE + timedelta(seconds=updated)).isoformat(),
+        "truckId": f"k{number % 3}",
+        "haulerId": "h1",
+        "ticketId": f"tk{minutes // 240}",
+        "eventTimestamp": (BASE + timedelta(minutes=minutes)).isoformat(),
+        "latitude": latitude,
+        "longitude": -86.0,
+    }
+
+
+def test_trip_refresh_reads_only_changed_days_and_matches_full_rebuild(
+    warehouse: duckdb.DuckDBPyConnection, ingest: Ingest
+) -> None:
+    pings = [_ping(i, i * 7, i, 35.0 + (i % 11) * 0.002) for i in range(DAYS * 200)]
+    ingest("dispatch_events", pings, BASE + timedelta(hours=1))
+    run_models(warehouse, threads=1)
+
+    moved = [_ping(i, i * 7, 100_000 + i, 35.5) for i in range(2000, 2010)]
+    ingest("dispatch_events", moved, BASE + timedelta(hours=2))
+    runs = {run.name: run for run in run_models(warehouse, ["gold_truck_trips_daily"], threads=1)}
+    assert runs["gold_truck_trips_daily"].details["partitions_skipped"] > 0
+
+    sql = trips_sql()["gold_truck_trips_daily"]
+    diff = warehouse.execute(
+        f"""
+        SELECT COUNT(*) FROM (
+            (SELECT * FROM gold_truck_trips_daily EXCEPT ALL SELECT * FROM ({sql}))
+            UNION ALL
+            (SELECT * FROM ({sql}) EXCEPT ALL SELECT * FROM gold_truck_trips_daily)
+        )
+        """
+    ).fetchone()
+    assert diff == (0,)
+
+    warehouse.execute(
+        "CREATE OR REPLACE TEMP TABLE gold_partitions AS SELECT ?::DATE AS service_date",
+        [(BASE + timedelta(days=10)).date()],
+    )
+    plan = warehouse.execute(
+        "EXPLAIN (ANALYZE, FORMAT JSON) "
+        + scope_partitions(sql, _partition_predicates("gold_truck_trips_daily"))
+    ).fetchall()
+    windows = [op for op in _operators(json.loads(plan[0][1])) if op["operator_name"] == "WINDOW"]
+    assert windows
+    assert max(op["operator_cardinality"] for op in windows) <= 3 * 24 * 60 // 7 + 1
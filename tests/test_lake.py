@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from datetime import timedelta
+from pathlib import Path
+from typing import Any
+
+import duckdb
+
+from ops_intelligence.config import EntityConfig
+from ops_intelligence.extraction.bronze import insert_bronze_rows
+from ops_intelligence.extraction.state import WindowCheckpoint, upsert_checkpoint
+from ops_intelligence.warehouse.db import BRONZE_COLUMNS, connect_warehouse
+from ops_intelligence.warehouse.lake import (
+    attach_bronze_lake,
+    flush_bronze_buffer,
+    lake_files,
+    rewrite_lake,
+)
+from ops_intelligence.warehouse.staging import ensure_staged_tables
+from tests.conftest import BASE, ReplayConfig
+
+ENTITY_CFG = EntityConfig(query_file="", root_path="", page_info_path="")
+OPEN_WINDOW = (BASE + timedelta(days=3), BASE + timedelta(days=4))
+
+
+def _ticket(record_id: str, days: int | None) -> dict[str, Any]:
+    row: dict[str, Any] = {"id": record_id}
+    if days is not None:
+        row["lastUpdatedAt"] = (BASE + timedelta(days=days, hours=6)).isoformat()
+    return row
+
+
+def _ingest(
+    conn: duckdb.DuckDBPyConnection,
+    rows: list[dict[str, Any]],
+    window: tuple[Any, Any] = (BASE, BASE + timedelta(days=3)),
+) -> None:
+    insert_bronze_rows(conn, "tickets", rows, ENTITY_CFG, *window, BASE + timedelta(days=5))
+
+
+def _partitions(lake_dir: Path) -> dict[str, int]:
+    counts: dict[str, int] = {}
+    for path in lake_files(str(lake_dir)):
+        key = str(path.parent.relative_to(lake_dir))
+        counts[key] = counts.get(key, 0) + 1
+    return counts
+
+
+def test_flush_moves_settled_rows_into_hive_partitions(
+    replay_config: ReplayConfig, tmp_path: Path
+) -> None:
+    lake_dir = tmp_path / "bronze"
+    cfg = replay_config("http://unused/", bronze_storage="parquet")
+    conn = connect_warehouse(cfg.warehouse_path)
+    attach_bronze_lake(conn, cfg)
+    ensure_staged_tables(conn)
+    _ingest(conn, [_ticket("t1", 0), _ticket("t2", 0), _ticket("t3", 1), _ticket("t4", None)])
+    upsert_checkpoint(
+        conn, "tickets", WindowCheckpoint(OPEN_WINDOW, "1", 1, 1, BASE + timedelta(days=5))
+    )
+    _ingest(conn, [_ticket("t5", 3)], OPEN_WINDOW)
+
+    assert flush_bronze_buffer(conn, str(lake_dir)) == 4
+    assert conn.execute("SELECT record_id FROM bronze_events").fetchall() == [("t5",)]
+    assert conn.execute("SELECT COUNT(*) FROM bronze").fetchone() == (5,)
+    assert conn.execute(
+        "SELECT record_id, record_date FROM bronze_lake ORDER BY record_id"
+    ).fetchall() == [
+        ("t1", BASE.date()),
+        ("t2", BASE.date()),
+        ("t3", (BASE + timedelta(days=1)).date()),
+        ("t4", None),
+    ]
+    assert _partitions(lake_dir) == {
+        "entity=tickets/record_date=2026-01-01": 1,
+        "entity=tickets/record_date=2026-01-02": 1,
+        "entity=tickets/record_date=__HIVE_DEFAULT_PARTITION__": 1,
+    }
+
+    conn.execute("DELETE FROM sync_checkpoints")
+    assert flush_bronze_buffer(conn, str(lake_dir)) == 1
+    assert conn.execute("SELECT COUNT(*) FROM bronze_events").fetchone() == (0,)
+    assert conn.execute("SELECT COUNT(*) FROM bronze").fetchone() == (5,)
+    assert "entity=tickets/record_date=2026-01-04" in _partitions(lake_dir)
+
+    rewrite_lake(
+        conn,
+        str(lake_dir),
+        f"SELECT {', '.join(BRONZE_COLUMNS)}, record_date FROM bronze_lake WHERE record_id <> 't2'",
+    )
+    assert conn.execute("SELECT COUNT(*) FROM bronze").fetchone() == (4,)
+    assert set(_partitions(lake_dir).values()) == {1}
+    assert not any(path.name.startswith("bronze.") for path in tmp_path.iterdir())
+    conn.close()
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from graphql import parse
+
+from ops_intelligence.graphql.projection import ProjectionError, prune_query
+from ops_intelligence.replay.server import _parse_query
+
+TEMPLATE = """
+query Tickets($first: Int!, $after: String) {
+  tickets(first: $first, after: $after) {
+    nodes {
+      id
+      ticketId
+      ticketNumber: number
+      order { id name }
+      netWeight
+      lastUpdatedAt
+    }
+    pageInfo { hasNextPage endCursor }
+  }
+}
+"""
+
+FIELDS = (
+    ("id", "ticketId"),
+    ("number",),
+    ("orderId", "order.id"),
+    ("order.name",),
+    ("netWeight", "actualNetWeight"),
+    ("lastUpdatedAt",),
+)
+
+
+def _type(name: str, fields: dict[str, str]) -> dict[str, Any]:
+    return {
+        "name": name,
+        "fields": [
+            {"name": field, "type": {"kind": "NON_NULL", "ofType": {"name": type_name}}}
+            for field, type_name in fields.items()
+        ],
+    }
+
+
+SCHEMA = {
+    "queryType": {"name": "Query"},
+    "types": [
+        _type("Query", {"tickets": "TicketConnection"}),
+        _type("TicketConnection", {"nodes": "Ticket", "pageInfo": "PageInfo"}),
+        _type(
+            "Ticket",
+            {
+                "id": "ID",
+                "number": "String",
+                "orderId": "ID",
+                "order": "Order",
+                "actualNetWeight": "Float",
+                "lastUpdatedAt": "DateTime",
+            },
+        ),
+        _type("Order", {"id": "ID", "name": "String"}),
+    ],
+}
+
+
+def _nodes(query: str) -> dict[str, Any]:
+    return _parse_query(query).node_fields
+
+
+@pytest.mark.parametrize("schema", [None, {}, {"types": []}])
+def test_prune_falls_back_to_template_selection(schema: dict[str, Any] | None) -> None:
+    pruned = prune_query(TEMPLATE, FIELDS, schema)
+
+    assert _nodes(pruned) == {
+        "id": None,
+        "ticketId": None,
+        "order": {"id": None, "name": None},
+        "netWeight": None,
+        "lastUpdatedAt": None,
+    }
+    assert "ticketNumber" not in pruned
+    assert "endCursor" in pruned
+
+
+def test_prune_requests_every_alternative_the_schema_lists() -> None:
+    pruned = prune_query(TEMPLATE, FIELDS, SCHEMA)
+
+    assert _nodes(pruned) == {
+        "id": None,
+        "number": None,
+        "orderId": None,
+        "order": {"id": None, "name": None},
+        "actualNetWeight": None,
+        "lastUpdatedAt": None,
+    }
+    parse(pruned)
+    assert "$first" in pruned and "$after" in pruned
+
+
+def test_prune_keeps_aliased_nodes_selection() -> None:
+    template = TEMPLATE.replace("nodes {", "items: nodes {")
+
+    pruned = prune_query(template, (("id", "ticketId"),))
+
+    assert "items: nodes {" in pruned
+    assert "ticketNumber" not in pruned
+
+
+def test_prune_rejects_templates_without_usable_fields() -> None:
+    with pytest.raises(ProjectionError, match="No silver fields"):
+        prune_query(TEMPLATE, (("missing",),))
+    with pytest.raises(ProjectionError, match="has no 'nodes' selection"):
+        prune_query("query { tickets { edges { id } } }", FIELDS)
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from ops_intelligence.replay.server import ReplaySettings, synthetic_page
+
+QUERY = (Path(__file__).parents[1] / "queries" / "hauler_pay.graphql").read_text(encoding="utf-8")
+START = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+def _fetch(start: datetime, end: datetime, settings: ReplaySettings) -> list[dict[str, Any]]:
+    nodes: list[dict[str, Any]] = []
+    after = 0
+    while True:
+        variables = {
+            "first": 50,
+            "after": str(after),
+            "updatedAfter": start.isoformat(),
+            "updatedBefore": end.isoformat(),
+        }
+        payload, _ = synthetic_page(QUERY, variables, settings)
+        connection = payload["data"]["haulerPay"]
+        nodes += connection["nodes"]
+        if not connection["pageInfo"]["hasNextPage"]:
+            return nodes
+        after = int(connection["pageInfo"]["endCursor"])
+
+
+def test_synthetic_records_do_not_depend_on_window_boundaries() -> None:
+    settings = ReplaySettings(rows_per_hour=37.0)
+    whole = _fetch(START, START + timedelta(hours=9), settings)
+    split: dict[str, dict[str, Any]] = {}
+    for hours in ((0, 2), (2, 5), (5, 9)):
+        window = _fetch(
+            START + timedelta(hours=hours[0]), START + timedelta(hours=hours[1]), settings
+        )
+        split.update((node["id"], node) for node in window)
+
+    assert len(whole) == 333
+    assert {node["id"]: node for node in whole} == split
+
+
+def test_only_id_suffixed_fields_are_synthetic_ids() -> None:
+    query = """
+        query Q($first: Int!, $updatedAfter: DateTime, $updatedBefore: DateTime) {
+          payments(first: $first, filter: { updatedAt: { gte: $updatedAfter, lte: $updatedBefore } }) {
+            nodes { id paid haulerId customer_id updatedAt }
+          }
+        }
+    """
+    window = {
+        "first": 1,
+        "updatedAfter": START.isoformat(),
+        "updatedBefore": (START + timedelta(hours=1)).isoformat(),
+    }
+    payload, _ = synthetic_page(query, window, ReplaySettings())
+    node = payload["data"]["payments"]["nodes"][0]
+
+    assert node["paid"].startswith("paid-")
+    assert node["haulerId"].startswith("hauler-")
+    assert node["customer_id"].startswith("customer-")
+    assert node["updatedAt"] == "2026-01-01T00:00:00Z"
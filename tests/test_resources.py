@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+
+import pytest
+
+from ops_intelligence.config import ResourceProfile
+from ops_intelligence.warehouse.db import connect_warehouse
+from ops_intelligence.warehouse.resources import governed_stage
+
+
+def test_unapplied_temp_directory_is_reported(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    first = str(tmp_path / "spill_a")
+    second = str(tmp_path / "spill_b")
+    conn = connect_warehouse(
+        str(tmp_path / "w.duckdb"),
+        ResourceProfile(threads=1, memory_limit="64MB", temp_directory=first),
+    )
+    conn.execute("CREATE TABLE big AS SELECT range AS n, md5(range::TEXT) AS s FROM range(3000000)")
+    conn.execute("SELECT * FROM big ORDER BY s").fetchall()
+
+    with (
+        caplog.at_level(logging.WARNING),
+        governed_stage(conn, "model", ResourceProfile(temp_directory=second)) as usage,
+    ):
+        pass
+
+    assert usage.temp_directory == first
+    assert any(second in record.getMessage() for record in caplog.records)
+    conn.close()
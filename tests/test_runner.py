@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from typing import Any
+
+import duckdb
+import pytest
+
+from ops_intelligence.warehouse.runner import (
+    ModelNode,
+    ModelRunError,
+    execute_models,
+    record_model_runs,
+    select_models,
+)
+
+DEPENDENCIES: dict[str, tuple[str, ...]] = {
+    "silver_a": (),
+    "silver_b": (),
+    "gold_c": ("silver_a",),
+    "gold_d": ("gold_c", "silver_b"),
+    "gold_e": ("gold_d",),
+}
+
+
+class Recorder:
+    def __init__(self, failing: set[str] | None = None) -> None:
+        self.failing = failing or set()
+        self.events: list[tuple[str, str]] = []
+        self.lock = threading.Lock()
+
+    def node(self, name: str, depends_on: tuple[str, ...]) -> ModelNode:
+        def run(conn: duckdb.DuckDBPyConnection) -> dict[str, Any]:
+            with self.lock:
+                self.events.append(("start", name))
+            time.sleep(0.01)
+            if name in self.failing:
+                raise RuntimeError(f"{name} broke")
+            conn.execute(f"CREATE OR REPLACE TABLE {name} AS SELECT range AS n FROM range(3)")
+            with self.lock:
+                self.events.append(("end", name))
+            return {"mode": "full"}
+
+        return ModelNode(name, name.split("_")[0], depends_on, run)
+
+    def registry(self, dependencies: dict[str, tuple[str, ...]]) -> dict[str, ModelNode]:
+        return {name: self.node(name, deps) for name, deps in dependencies.items()}
+
+
+def test_select_models_expands_graph_selectors() -> None:
+    nodes = Recorder().registry(DEPENDENCIES)
+
+    assert select_models(nodes) == list(DEPENDENCIES)
+    assert select_models(nodes, ["gold_d"]) == ["gold_d"]
+    assert select_models(nodes, ["+gold_d"]) == ["silver_a", "silver_b", "gold_c", "gold_d"]
+    assert select_models(nodes, ["gold_c+"]) == ["gold_c", "gold_d", "gold_e"]
+    assert select_models(nodes, ["silver"]) == ["silver_a", "silver_b"]
+    assert select_models(nodes, ["gold_[ce]", "silver_b"]) == ["silver_b", "gold_c", "gold_e"]
+    assert select_models(nodes, ["silver_a+"]) == ["silver_a", "gold_c", "gold_d", "gold_e"]
+    with pytest.raises(ValueError, match="matches no model"):
+        select_models(nodes, ["bronze"])
+
+
+def test_execute_models_runs_dependencies_first(warehouse: duckdb.DuckDBPyConnection) -> None:
+    recorder = Recorder()
+    nodes = recorder.registry(DEPENDENCIES)
+
+    runs = execute_models(warehouse, nodes, list(nodes), threads=4)
+
+    assert [(run.name, run.status, run.rows) for run in runs] == [
+        (name, "succeeded", 3) for name in DEPENDENCIES
+    ]
+    position = {event: index for index, event in enumerate(recorder.events)}
+    for name, depends_on in DEPENDENCIES.items():
+        for upstream in depends_on:
+            assert position[("end", upstream)] < position[("start", name)]
+    assert position[("start", "silver_b")] < position[("end", "silver_a")]
+
+
+def test_failed_model_skips_downstream_and_is_recorded(
+    warehouse: duckdb.DuckDBPyConnection,
+) -> None:
+    recorder = Recorder(failing={"gold_c"})
+    nodes = recorder.registry(DEPENDENCIES)
+
+    runs = execute_models(warehouse, nodes, list(nodes), threads=2)
+    run_id = record_model_runs(warehouse, runs)
+
+    rows = warehouse.execute(
+        """
+        SELECT model, layer, status, table_rows, details, error
+        FROM model_runs
+        WHERE run_id = ?
+        ORDER BY model
+        """,
+        [run_id],
+    ).fetchall()
+    assert [row[:4] for row in rows] == [
+        ("gold_c", "gold", "failed", None),
+        ("gold_d", "gold", "skipped", None),
+        ("gold_e", "gold", "skipped", None),
+        ("silver_a", "silver", "succeeded", 3),
+        ("silver_b", "silver", "succeeded", 3),
+    ]
+    errors = {row[0]: row[5] for row in rows}
+    assert errors["gold_c"] == "RuntimeError: gold_c broke"
+    assert errors["gold_d"] == "Upstream failed: gold_c"
+    assert errors["gold_e"] == "Upstream failed: gold_d"
+    assert json.loads(rows[3][4]) == {"mode": "full"}
+    assert ("start", "gold_d") not in recorder.events
+
+
+def test_dependency_cycle_is_reported(warehouse: duckdb.DuckDBPyConnection) -> None:
+    nodes = Recorder().registry({"gold_x": ("gold_y",), "gold_y": ("gold_x",)})
+
+    with pytest.raises(ModelRunError, match="Dependency cycle"):
+        execute_models(warehouse, nodes, list(nodes))
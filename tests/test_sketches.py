@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import random
+from collections.abc import Iterator
+
+import duckdb
+import pandas as pd
+import pytest
+
+from ops_intelligence.warehouse.sketches import (
+    distinct_sketch,
+    quantile_sketch,
+    sketch_distinct_sql,
+    sketch_quantiles_sql,
+)
+
+QUANTILES = (0.5, 0.9)
+
+
+@pytest.fixture
+def observations() -> Iterator[duckdb.DuckDBPyConnection]:
+    rng = random.Random(7)
+    frame = pd.DataFrame(
+        {
+            "day": [day for day in range(2) for _ in range(20000)],
+            "minutes": [rng.lognormvariate(3.5, 0.6) for _ in range(40000)],
+            "truck_id": [f"truck-{rng.randrange(5000)}" for _ in range(40000)],
+        }
+    )
+    conn = duckdb.connect()
+    conn.register("frame", frame)
+    conn.execute("CREATE TABLE observations AS SELECT * FROM frame")
+    for table, grouping in (("daily", "GROUP BY day"), ("combined", "")):
+        conn.execute(
+            f"""
+            CREATE TABLE {table} AS
+            SELECT
+                {quantile_sketch("minutes")} AS minutes_sketch,
+                {distinct_sketch("truck_id")} AS trucks_sketch
+            FROM observations
+            {grouping}
+            """
+        )
+    yield conn
+    conn.close()
+
+
+def test_sketch_estimates_track_exact_values(observations: duckdb.DuckDBPyConnection) -> None:
+    exact = observations.execute(
+        "SELECT quantile_disc(minutes, [0.5, 0.9]), COUNT(DISTINCT truck_id) FROM observations"
+    ).fetchone()
+    estimate = observations.execute(
+        sketch_quantiles_sql("daily", "minutes_sketch", QUANTILES)
+    ).fetchone()
+    distinct = observations.execute(sketch_distinct_sql("daily", "trucks_sketch")).fetchone()
+    assert exact is not None and estimate is not None and distinct is not None
+
+    assert estimate[0] == 40000
+    for approx, actual in zip(estimate[1:], exact[0], strict=True):
+        assert approx == pytest.approx(actual, rel=0.01)
+    assert distinct[0] == pytest.approx(exact[1], rel=0.1)
+
+
+def test_merged_daily_sketches_equal_sketch_of_union(
+    observations: duckdb.DuckDBPyConnection,
+) -> None:
+    for sql in (
+        lambda table: sketch_quantiles_sql(table, "minutes_sketch", QUANTILES),
+        lambda table: sketch_distinct_sql(table, "trucks_sketch"),
+    ):
+        merged = observations.execute(sql("daily")).fetchall()
+        assert merged == observations.execute(sql("combined")).fetchall()
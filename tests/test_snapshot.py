@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import duckdb
+
+from ops_intelligence.warehouse.modeling import model_registry, run_models
+from ops_intelligence.warehouse.snapshot import publish_read_snapshot
+from tests.conftest import Ingest
+from tests.test_gold_partitions import _seed
+
+
+def test_snapshot_publishes_registered_gold_tables(
+    warehouse: duckdb.DuckDBPyConnection, ingest: Ingest, tmp_path: Path
+) -> None:
+    _seed(warehouse, ingest)
+    run_models(warehouse, threads=1)
+    assert warehouse.execute("SELECT COUNT(*) FROM gold_partition_log").fetchone() != (0,)
+
+    target = tmp_path / "read.duckdb"
+    result = publish_read_snapshot(warehouse, target)
+
+    gold = sorted(name for name, node in model_registry().items() if node.layer == "gold")
+    with duckdb.connect(str(target), read_only=True) as snapshot:
+        tables = [row[0] for row in snapshot.execute("SHOW TABLES").fetchall()]
+        info = snapshot.execute(
+            "SELECT DISTINCT published_at, table_name FROM snapshot_info ORDER BY table_name"
+        ).fetchall()
+    assert tables == sorted([*gold, "snapshot_info"])
+    assert "gold_partition_log" not in tables
+    assert result["tables"] == len(gold)
+    assert [row[1] for row in info] == gold
+    assert {row[0].isoformat() for row in info} == {result["published_at"].removesuffix("+00:00")}
+    assert not target.with_name(target.name + ".publishing").exists()
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import Any
+
+import pytest
+
+from ops_intelligence.extraction.sync import sync_entities
+from ops_intelligence.graphql.transport import PermanentGraphQLError
+from ops_intelligence.replay.server import ReplaySettings, StandInGraphQLServer
+from ops_intelligence.warehouse.db import connect_warehouse
+from tests.conftest import BASE, ReplayConfig
+
+ROWS_PER_HOUR = 50
+PAGE_SIZE = 100
+END = BASE + timedelta(days=1)
+
+
+class FailingServer(StandInGraphQLServer):
+    def __init__(self, settings: ReplaySettings, fail_after: int) -> None:
+        super().__init__(settings)
+        self.fail_after = fail_after
+
+    def handle(
+        self, query: str, variables: dict[str, Any]
+    ) -> tuple[int, dict[str, Any], dict[str, str]]:
+        if self.stats.requests >= self.fail_after:
+            return 400, {"errors": [{"message": "Bad request"}]}, {}
+        return super().handle(query, variables)
+
+
+def test_interrupted_window_resumes_from_last_committed_cursor(
+    replay_config: ReplayConfig,
+) -> None:
+    settings = ReplaySettings(rows_per_hour=ROWS_PER_HOUR)
+    overrides = {
+        "page_size": PAGE_SIZE,
+        "max_concurrency": 1,
+        "prefetch_pages": 1,
+        "adaptive_windows": False,
+        "skip_unchanged_records": False,
+        "bronze_storage": "duckdb",
+    }
+    with FailingServer(settings, fail_after=7) as server:
+        cfg = replay_config(server.url, **overrides)
+        conn = connect_warehouse(cfg.warehouse_path)
+        with pytest.raises(PermanentGraphQLError):
+            sync_entities(conn, cfg, ["tickets"], BASE, END)
+        checkpoints = conn.execute(
+            "SELECT pages, rows_fetched FROM sync_checkpoints WHERE entity = 'tickets'"
+        ).fetchall()
+        interrupted = conn.execute("SELECT COUNT(*) FROM bronze_events").fetchone()
+        conn.close()
+    assert len(checkpoints) == 1
+    pages, rows_fetched = checkpoints[0]
+    assert 0 < pages < 7 and rows_fetched == pages * PAGE_SIZE
+    assert interrupted == (rows_fetched,)
+
+    with StandInGraphQLServer(settings) as server:
+        cfg = replay_config(server.url, **overrides)
+        conn = connect_warehouse(cfg.warehouse_path)
+        sync_entities(conn, cfg, ["tickets"], end_at=END)
+        served = server.stats.rows_served
+        rows = conn.execute(
+            "SELECT COUNT(*), COUNT(DISTINCT record_id) FROM bronze_events WHERE entity = 'tickets'"
+        ).fetchone()
+        remaining = conn.execute("SELECT COUNT(*) FROM sync_checkpoints").fetchone()
+        synced = conn.execute("SELECT last_synced_at FROM sync_state").fetchone()
+        conn.close()
+
+    expected = ROWS_PER_HOUR * 24 + 1
+    assert rows == (expected, expected)
+    assert served == expected - interrupted[0]
+    assert remaining == (0,)
+    assert synced is not None and synced[0] == END.replace(tzinfo=None)
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from ops_intelligence.tenants import run_tenants
+
+
+def test_bad_configs_fail_per_tenant(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("FASTWEIGH_API_KEY", raising=False)
+    warehouse = (tmp_path / "shared.duckdb").as_posix()
+    tenant = f"warehouse_path: {warehouse}\noutput_dir: {(tmp_path / 'out').as_posix()}\nentities: {{}}\n"
+    (tmp_path / "a.yaml").write_text(f"tenant_name: a\n{tenant}", encoding="utf-8")
+    (tmp_path / "b.yaml").write_text(f"tenant_name: b\n{tenant}", encoding="utf-8")
+    (tmp_path / "c.yaml").write_text("tenant_name: [unclosed\n", encoding="utf-8")
+    (tmp_path / "d.yaml").write_text("tenant_name: d\n", encoding="utf-8")
+
+    results = {Path(r.config_path).name: r for r in run_tenants(str(tmp_path), "sync", workers=1)}
+
+    assert sorted(results) == ["a.yaml", "b.yaml", "c.yaml", "d.yaml"]
+    assert all(r.status == "failed" for r in results.values())
+    assert "FASTWEIGH_API_KEY" in (results["a.yaml"].error or "")
+    assert "share warehouse" in (results["b.yaml"].error or "")
+    assert (results["c.yaml"].error or "").startswith("ConfigError")
+    assert (results["d.yaml"].error or "").startswith("ConfigError")
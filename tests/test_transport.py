@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import Any
+
+import httpx
+import pytest
+
+from ops_intelligence.config import TransportConfig
+from ops_intelligence.extraction.sync import sync_entities
+from ops_intelligence.graphql import transport
+from ops_intelligence.graphql.client import GraphQLClient
+from ops_intelligence.graphql.transport import (
+    CircuitBreaker,
+    CircuitOpenError,
+    GraphQLTransport,
+    PermanentGraphQLError,
+    RateLimitedError,
+    TransientGraphQLError,
+    check_payload,
+    check_response,
+)
+from ops_intelligence.replay.server import ReplaySettings, StandInGraphQLServer, _parse_query
+from ops_intelligence.warehouse.db import connect_warehouse
+from tests.conftest import BASE, ROOT, ReplayConfig
+
+QUERY = (ROOT / "queries" / "orders.graphql").read_text(encoding="utf-8")
+VARIABLES = {
+    "first": 10,
+    "updatedAfter": BASE.isoformat(),
+    "updatedBefore": (BASE + timedelta(hours=1)).isoformat(),
+}
+
+
+def _response(status: int, headers: dict[str, str] | None = None) -> httpx.Response:
+    return httpx.Response(status, headers=headers, request=httpx.Request("POST", "http://test/"))
+
+
+def test_check_response_classifies_status_codes() -> None:
+    check_response(_response(200))
+
+    with pytest.raises(RateLimitedError) as throttled:
+        check_response(_response(429, {"Retry-After": "7"}))
+    assert throttled.value.retry_after == 7.0
+
+    with pytest.raises(TransientGraphQLError) as unavailable:
+        check_response(_response(503))
+    assert not isinstance(unavailable.value, RateLimitedError)
+
+    with pytest.raises(RateLimitedError) as deferred:
+        check_response(_response(503, {"Retry-After": "3"}))
+    assert deferred.value.retry_after == 3.0
+
+    for status in (400, 401, 404):
+        with pytest.raises(PermanentGraphQLError):
+            check_response(_response(status))
+
+
+def test_check_payload_classifies_graphql_errors() -> None:
+    def errors(code: str) -> dict[str, Any]:
+        return {"data": None, "errors": [{"message": "x", "extensions": {"code": code}}]}
+
+    assert check_payload({"data": {}}) == {"data": {}}
+    with pytest.raises(RateLimitedError):
+        check_payload(errors("throttled"))
+    with pytest.raises(TransientGraphQLError):
+        check_payload(errors("INTERNAL_SERVER_ERROR"))
+    with pytest.raises(PermanentGraphQLError):
+        check_payload(errors("GRAPHQL_VALIDATION_FAILED"))
+    with pytest.raises(TransientGraphQLError):
+        check_payload({})
+
+
+def test_circuit_breaker_opens_half_opens_and_closes(monkeypatch: pytest.MonkeyPatch) -> None:
+    clock = [100.0]
+    monkeypatch.setattr(transport.time, "monotonic", lambda: clock[0])
+    breaker = CircuitBreaker("tickets", failure_threshold=2, reset_seconds=30)
+
+    breaker.record_failure()
+    breaker.check()
+    breaker.record_failure()
+    assert breaker.is_open
+    with pytest.raises(CircuitOpenError):
+        breaker.check()
+
+    clock[0] += 30
+    breaker.check()
+    breaker.record_failure()
+    assert breaker.is_open
+
+    clock[0] += 30
+    breaker.check()
+    breaker.record_success()
+    breaker.record_failure()
+    assert not breaker.is_open
+
+
+def test_transport_classifies_stand_in_server_errors() -> None:
+    cases: list[tuple[ReplaySettings, type[Exception]]] = [
+        (ReplaySettings(requests_per_second=0.001, burst=1), RateLimitedError),
+        (ReplaySettings(error_rate=1.0), TransientGraphQLError),
+        (ReplaySettings(graphql_error_rate=1.0), TransientGraphQLError),
+    ]
+    for settings, expected in cases:
+        with (
+            StandInGraphQLServer(settings) as server,
+            GraphQLClient(
+                server.url, "replay", transport=GraphQLTransport(TransportConfig(max_attempts=1))
+            ) as client,
+        ):
+            if settings.requests_per_second:
+                client.execute(QUERY, VARIABLES)
+            with pytest.raises(expected) as raised:
+                client.execute(QUERY, VARIABLES)
+        if isinstance(raised.value, RateLimitedError):
+            assert raised.value.retry_after == settings.retry_after_seconds
+
+    with StandInGraphQLServer() as server, GraphQLClient(server.url, "replay") as client:
+        with pytest.raises(PermanentGraphQLError):
+            client.execute("query { orders(first: ", VARIABLES)
+        assert server.stats.requests == 1
+
+
+class DegradingServer(StandInGraphQLServer):
+    def __init__(self, settings: ReplaySettings, root: str, healthy_pages: int) -> None:
+        super().__init__(settings)
+        self.root = root
+        self.healthy_pages = healthy_pages
+        self.served_pages = 0
+
+    def handle(
+        self, query: str, variables: dict[str, Any]
+    ) -> tuple[int, dict[str, Any], dict[str, str]]:
+        if _parse_query(query).root == self.root:
+            with self.stats.lock:
+                self.served_pages += 1
+                failing = self.served_pages > self.healthy_pages
+            if failing:
+                return 503, {"errors": [{"message": "Service unavailable"}]}, {"Retry-After": "0"}
+        return super().handle(query, variables)
+
+
+def test_open_circuit_degrades_only_its_entity(replay_config: ReplayConfig) -> None:
+    end = BASE + timedelta(days=1)
+    with DegradingServer(ReplaySettings(rows_per_hour=50), "tickets", healthy_pages=2) as server:
+        cfg = replay_config(
+            server.url,
+            page_size=100,
+            adaptive_windows=False,
+            bronze_storage="duckdb",
+            **{"transport.max_attempts": 4, "transport.circuit_failure_threshold": 2},
+        )
+        conn = connect_warehouse(cfg.warehouse_path)
+        with pytest.raises(CircuitOpenError) as raised:
+            sync_entities(conn, cfg, ["tickets", "orders"], BASE, end)
+        rows = dict(
+            conn.execute("SELECT entity, COUNT(*) FROM bronze_events GROUP BY entity").fetchall()
+        )
+        synced = [row[0] for row in conn.execute("SELECT entity FROM sync_state").fetchall()]
+        conn.close()
+
+    message = str(raised.value)
+    assert "tickets: Circuit 'tickets' is open" in message
+    assert "orders:" not in message.split("counts=")[0]
+    assert "'tickets': {'fetched': 200," in message
+    assert "'orders': {'fetched': 1201," in message
+    assert rows == {"tickets": 200, "orders": 1201}
+    assert synced == ["orders"]
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import Any
+
+import pytest
+
+from ops_intelligence.config import TenantConfig
+from ops_intelligence.extraction.state import Window, WindowCheckpoint
+from ops_intelligence.extraction.windows import WindowPlanner
+from tests.conftest import BASE
+
+HOUR = timedelta(hours=1)
+DAY = timedelta(days=1)
+
+
+def _planner(
+    days: int = 3,
+    rows_per_hour: float | None = None,
+    checkpoints: list[WindowCheckpoint] | None = None,
+    **overrides: Any,
+) -> WindowPlanner:
+    cfg = TenantConfig(entities={}, **overrides)
+    return WindowPlanner(cfg, BASE, BASE + days * DAY, rows_per_hour, checkpoints)
+
+
+def _drain(planner: WindowPlanner) -> list[Window]:
+    windows: list[Window] = []
+    while (window := planner.next_window()) is not None:
+        windows.append(window)
+    return windows
+
+
+def test_fixed_windows_tile_the_range_and_never_split() -> None:
+    planner = _planner(adaptive_windows=False, rows_per_hour=1_000_000)
+
+    windows = _drain(planner)
+
+    assert windows == [(BASE + i * DAY, BASE + (i + 1) * DAY) for i in range(3)]
+    assert not planner.split(windows[0])
+
+
+def test_initial_size_follows_rows_per_hour_within_bounds() -> None:
+    assert _planner(rows_per_hour=2_000).next_window() == (BASE, BASE + 10 * HOUR)
+    assert _planner(rows_per_hour=10**9).next_window() == (BASE, BASE + timedelta(minutes=15))
+    assert _planner(days=30, rows_per_hour=0).next_window() == (BASE, BASE + 7 * DAY)
+
+
+def test_split_retries_both_halves_first_and_shrinks_later_windows() -> None:
+    planner = _planner()
+    window = planner.next_window()
+    assert window == (BASE, BASE + DAY)
+
+    assert planner.split(window)
+
+    assert planner.next_window() == (BASE, BASE + 12 * HOUR)
+    assert planner.next_window() == (BASE + 12 * HOUR, BASE + DAY)
+    assert planner.next_window() == (BASE + DAY, BASE + DAY + 12 * HOUR)
+
+
+def test_split_refuses_below_min_window() -> None:
+    planner = _planner(min_window_minutes=60)
+    window = (BASE, BASE + 90 * timedelta(minutes=1))
+
+    assert not planner.split(window)
+    assert planner.split((BASE, BASE + 2 * HOUR))
+
+
+def test_observe_blends_rows_per_hour_with_the_previous_estimate() -> None:
+    planner = _planner(rows_per_hour=1_000)
+
+    planner.observe((BASE, BASE + HOUR), 3_000)
+    assert planner.rows_per_hour == pytest.approx(2_000)
+
+    planner.observe((BASE, BASE + 2 * HOUR), 1_000)
+    assert planner.rows_per_hour == pytest.approx(1_250)
+
+    planner.observe((BASE, BASE), 10**6)
+    assert planner.rows_per_hour == pytest.approx(1_250)
+
+
+def test_observe_seeds_the_estimate_and_resizes_at_most_fourfold() -> None:
+    planner = _planner(days=7)
+    assert planner.rows_per_hour is None
+
+    planner.observe((BASE, BASE + DAY), 48_000)
+    assert planner.rows_per_hour == pytest.approx(2_000)
+    assert planner.next_window() == (BASE, BASE + 10 * HOUR)
+
+    planner.observe((BASE, BASE + HOUR), 10**9)
+    assert planner.next_window() == (
+        BASE + 10 * HOUR,
+        BASE + 10 * HOUR + 150 * timedelta(minutes=1),
+    )
+
+
+def test_finish_holds_the_watermark_at_the_oldest_open_window() -> None:
+    planner = _planner()
+    first, second, third = _drain(planner)
+
+    assert planner.finish(second) is None
+    assert planner.finish(third) is None
+    assert planner.finish(first) == BASE + 3 * DAY
+
+
+def test_finish_advances_only_to_the_next_open_window() -> None:
+    planner = _planner()
+    first, second = planner.next_window(), planner.next_window()
+    assert first is not None and second is not None
+
+    assert planner.finish(first) == second[0]
+    third = planner.next_window()
+    assert third is not None
+    assert planner.finish(third) is None
+    assert planner.finish(second) == BASE + 3 * DAY
+
+
+def test_finish_waits_for_split_halves_still_queued() -> None:
+    planner = _planner()
+    first, second = planner.next_window(), planner.next_window()
+    assert first is not None and second is not None
+
+    assert planner.split(first)
+    assert planner.finish(second) is None
+    left, right = planner.next_window(), planner.next_window()
+    assert left is not None and right is not None
+    assert planner.finish(left) == right[0]
+    assert planner.finish(right) == second[1]
+
+
+def test_checkpointed_windows_resume_first_and_are_not_replanned() -> None:
+    reserved = (BASE + DAY, BASE + DAY + 6 * HOUR)
+    checkpoint = WindowCheckpoint(reserved, "cursor-3", pages=3, rows=300, started_at=BASE)
+    planner = _planner(checkpoints=[checkpoint])
+
+    windows = _drain(planner)
+
+    assert windows[0] == reserved
+    assert planner.resume_point(reserved) == checkpoint
+    assert planner.resume_point(reserved) is None
+    assert windows[1:] == [
+        (BASE, BASE + DAY),
+        (BASE + DAY + 6 * HOUR, BASE + 2 * DAY + 6 * HOUR),
+        (BASE + 2 * DAY + 6 * HOUR, BASE + 3 * DAY),
+    ]
+
+
+def test_over_budget_checks_pages_and_rows() -> None:
+    planner = _planner(window_page_budget=10, window_row_budget=1_000)
+
+    assert not planner.over_budget(9, 999)
+    assert planner.over_budget(10, 0)
+    assert planner.over_budget(0, 1_000)